@@ -1,4 +1,13 @@
-# Importar a aplicação FastAPI
-from .app import app
-
-__all__ = ["app"]
+# Importar a aplicação FastAPI sob demanda: importar app.core ou app.services
+# (ex.: pré-carga do analisador no mestre do gunicorn) não deve carregar a
+# aplicação inteira nem abrir conexões com o banco
+
+
+def __getattr__(name):
+    if name == "app":
+        from .app import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["app"]
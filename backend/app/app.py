@@ -8,7 +8,7 @@ from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, Backgroun
 from typing import List, Dict, Any, Optional
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 import os
@@ -31,13 +31,18 @@ logger = logging.getLogger(__name__)
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from app.core.config import settings
+
 try:
     from excel_to_database import ExcelToDatabaseConverter
     from database_config import get_db_manager, init_database, close_database
 
     from app.services.excel_service import ExcelService
     from app.services.sentiment_analyzer import sentiment_analyzer
-    from app.services.feedback_service import feedback_service
+    from app.services.analyzer_executor import analyzer_executor
+    from app.services.feedback_service import feedback_service, FeedbackService
+    from app.services.ingest_analysis_queue import ingest_analysis_queue
+    from app.services.analyzer_preload import process_memory
     
 except ImportError as e:
     print(f" Erro de importação: {e}")
@@ -46,7 +51,11 @@ except ImportError as e:
 
     ExcelService = None
     sentiment_analyzer = None
+    analyzer_executor = None
     feedback_service = None
+    FeedbackService = None
+    ingest_analysis_queue = None
+    process_memory = None
 
 # Modelos Pydantic
 class UserResponse(BaseModel):
@@ -512,6 +521,16 @@ async def process_and_save_message(message_data):
         
         if save_success:
             logger.info(f"✅ MENSAGEM SALVA NO POSTGRESQL: {message_data['notify_name'] or message_data['chat_id']}")
+            
+            # Análise de sentimento desacoplada: só enfileira (os workers gravam em feedbacks e em whatsapp_messages)
+            if ingest_analysis_queue:
+                ingest_analysis_queue.submit({
+                    "message_id": message_data["message_id"],
+                    "phone": message_data["chat_id"],
+                    "text": message_data["message_text"],
+                    "contact_name": message_data["notify_name"],
+                    "timestamp": message_data["timestamp"]
+                })
             return True
         else:
             logger.error(f"❌ FALHA AO SALVAR: {message_data['chat_id']}")
@@ -557,7 +576,8 @@ async def get_new_messages(since: str = None):
                         "timestamp": msg.get("timestamp"),
                         "received_at": msg.get("created_at"),
                         "processed": False,
-                        "retry_count": 0
+                        "retry_count": 0,
+                        "sentiment": msg.get("sentiment")
                     }
                     all_messages.append(formatted_msg)
         
@@ -644,7 +664,7 @@ async def whatsapp_status():
 # NOVO: Endpoints para persistência de mensagens WhatsApp
 @app.get("/api/whatsapp/chats")
 async def get_whatsapp_chats():
-    """Buscar todos os chats salvos no PostgreSQL (sistema limpo)"""
+    """Buscar todos os chats salvos no PostgreSQL (sistema limpo), com o sentimento da última mensagem analisada"""
     try:
         if not whatsapp_persistence:
             logger.error("❌ Serviço de persistência não disponível")
@@ -675,7 +695,7 @@ async def get_whatsapp_chats():
 
 @app.get("/api/whatsapp/messages/{phone}")
 async def get_whatsapp_chat_messages(phone: str, limit: int = 100, since: str = None, include_sent: bool = True):
-    """Buscar mensagens de um chat específico do PostgreSQL (sistema limpo)"""
+    """Buscar mensagens de um chat específico do PostgreSQL (sistema limpo), com a análise gravada na ingestão"""
     try:
         if not whatsapp_persistence:
             logger.error("❌ Serviço de persistência não disponível")
@@ -702,7 +722,8 @@ async def get_whatsapp_chat_messages(phone: str, limit: int = 100, since: str =
                 "direction": msg.get("direction", "received"),  # Manter original
                 "status": msg.get("status", "received"),
                 "created_at": msg.get("created_at"),
-                "originalTimestamp": msg.get("timestamp")  # Para compatibilidade
+                "originalTimestamp": msg.get("timestamp"),  # Para compatibilidade
+                "sentiment": msg.get("sentiment")  # Gravado na ingestão (None enquanto não analisada)
             }
             formatted_messages.append(formatted_msg)
         
@@ -1186,6 +1207,260 @@ async def create_message(message: dict):
         logger.error(f"Erro ao criar mensagem: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# ===== ANÁLISE DE SENTIMENTOS EM LOTE =====
+
+def _parse_batch_items(body: bytes, ndjson: bool) -> List[Any]:
+    """Lê o corpo do lote: array JSON ou NDJSON (um texto ou objeto {"text", "id", "user_id"} por linha)"""
+    text = body.decode("utf-8").strip()
+    if not text:
+        return []
+    
+    if not ndjson and text.startswith("["):
+        items = json.loads(text)
+    else:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    
+    for item in items:
+        if not isinstance(item, (str, dict)):
+            raise ValueError("Cada item deve ser um texto ou um objeto com o campo 'text'")
+    return items
+
+def _batch_result(index: int, item: Any, result: tuple, include_details: bool) -> Dict[str, Any]:
+    """Resumo serializável de uma análise do lote"""
+    sentiment_class, score, keywords, details = result
+    entry = {
+        "index": index,
+        "id": item.get("id") if isinstance(item, dict) else None,
+        "sentiment_class": sentiment_class,
+        "score": score,
+        "confidence": details.get("confidence", 0.0),
+        "keywords": keywords,
+        "emotions": details.get("emotions", {}),
+        "contexts": details.get("contexts", []),
+        "analysis_profile": details.get("analysis_profile")
+    }
+    if details.get("fallback"):
+        entry["error"] = details.get("error")
+    if include_details:
+        entry["details"] = details
+    return entry
+
+def _batch_error(index: int, item: Any, error: str) -> Dict[str, Any]:
+    """Item de um bloco do lote que não foi analisado (timeout ou falha do pool)"""
+    return {
+        "index": index,
+        "id": item.get("id") if isinstance(item, dict) else None,
+        "error": error
+    }
+
+# Campos do resumo de cada item do lote (sem include_details só as fases necessárias a eles são executadas)
+BATCH_SUMMARY_FIELDS = ("confidence", "emotions", "contexts", "keyword_analysis")
+
+# Itens por bloco enviado ao pool de processos (o timeout vale para cada bloco)
+BATCH_STREAM_CHUNK = 256
+
+@app.post("/api/analyze/batch")
+async def analyze_batch(request: Request, profile: Optional[str] = None, include_details: bool = False,
+                        format: Optional[str] = None, fields: Optional[str] = None,
+                        timeout: Optional[float] = None):
+    """
+    Analisa um lote de textos e devolve os resultados em streaming, na ordem de entrada.
+    Corpo: array JSON ou NDJSON (Content-Type application/x-ndjson). Resposta em NDJSON quando
+    a entrada é NDJSON ou format=ndjson; caso contrário, um array JSON.
+    fields (separados por vírgula) restringe os detalhes de include_details a esses campos.
+    A análise roda no pool de processos, em blocos de BATCH_STREAM_CHUNK itens (um por processo
+    em paralelo); timeout (> 0) vale para cada bloco e itens de um bloco que o excede saem com 'error'.
+    """
+    if not sentiment_analyzer or not analyzer_executor:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    
+    ndjson_input = "ndjson" in request.headers.get("content-type", "")
+    try:
+        items = _parse_batch_items(await request.body(), ndjson_input)
+        if fields:
+            batch_fields = list(BATCH_SUMMARY_FIELDS) + [field.strip() for field in fields.split(",") if field.strip()]
+        else:
+            batch_fields = None if include_details else list(BATCH_SUMMARY_FIELDS)
+        sentiment_analyzer.resolve_fields(batch_fields, profile or sentiment_analyzer.ingest_profile)
+        batch_timeout = analyzer_executor.resolve_timeout(timeout)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Lote inválido: {e}")
+    
+    if len(items) > settings.sentiment_batch_max_items:
+        raise HTTPException(status_code=413, detail=f"Lote excede {settings.sentiment_batch_max_items} itens")
+    
+    ndjson_output = format == "ndjson" or (format is None and ndjson_input)
+    batch_profile = profile or sentiment_analyzer.ingest_profile
+    
+    async def analyze_chunks():
+        """Blocos no pool de processos, até um por processo em paralelo, devolvidos na ordem de entrada"""
+        starts = iter(range(0, len(items), BATCH_STREAM_CHUNK))
+        in_flight = deque()
+        
+        def submit_next():
+            start = next(starts, None)
+            if start is not None:
+                chunk = items[start:start + BATCH_STREAM_CHUNK]
+                in_flight.append((start, chunk, asyncio.ensure_future(
+                    analyzer_executor.analyze_batch(chunk, batch_profile, batch_timeout, batch_fields))))
+        
+        for _ in range(max(1, analyzer_executor.max_workers)):
+            submit_next()
+        try:
+            while in_flight:
+                start, chunk, task = in_flight.popleft()
+                submit_next()
+                try:
+                    results = await task
+                except asyncio.TimeoutError:
+                    results = ["Tempo limite da análise excedido"] * len(chunk)
+                except Exception as e:
+                    logger.error(f"❌ Erro ao analisar bloco do lote: {e}")
+                    results = [f"Erro na análise: {e}"] * len(chunk)
+                for offset, result in enumerate(results):
+                    yield start + offset, result
+        finally:
+            # Cliente desconectou: blocos ainda não iniciados saem da fila do pool
+            for _, _, task in in_flight:
+                task.cancel()
+    
+    async def stream_results():
+        if not ndjson_output:
+            yield "["
+        async for index, result in analyze_chunks():
+            if isinstance(result, str):
+                entry = _batch_error(index, items[index], result)
+            else:
+                entry = _batch_result(index, items[index], result, include_details)
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+            if ndjson_output:
+                yield line + "\n"
+            else:
+                yield ("," if index else "") + line
+        if not ndjson_output:
+            yield "]"
+    
+    media_type = "application/x-ndjson" if ndjson_output else "application/json"
+    return StreamingResponse(stream_results(), media_type=media_type)
+
+@app.post("/api/analyze")
+async def analyze_text(payload: dict):
+    """Analisa um texto no pool de processos do analisador (não bloqueia o event loop)"""
+    if not analyzer_executor:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise HTTPException(status_code=400, detail="Campo 'text' obrigatório")
+    
+    try:
+        sentiment_class, score, keywords, details = await analyzer_executor.analyze(
+            text,
+            user_id=payload.get("user_id"),
+            profile=payload.get("profile"),
+            timeout=payload.get("timeout"),
+            fields=payload.get("fields")
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Tempo limite da análise excedido")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "sentiment_class": sentiment_class,
+        "score": score,
+        "keywords": keywords,
+        "details": details
+    }
+
+@app.get("/api/analyzer/executor")
+async def analyzer_executor_metrics():
+    """Métricas do pool de análise: fila, utilização e tempos médios"""
+    if not analyzer_executor:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    return analyzer_executor.get_metrics()
+
+@app.get("/api/analyzer/memory")
+async def analyzer_worker_memory():
+    """
+    RSS e PSS do worker que atendeu a requisição (com SENTIMENT_PRELOAD as tabelas do analisador
+    ficam em páginas compartilhadas com o mestre e os demais workers)
+    """
+    if not process_memory:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    import gc
+    return {
+        'memory': process_memory(),
+        'parent_pid': os.getppid(),
+        'preload': settings.sentiment_preload,
+        'frozen_objects': gc.get_freeze_count()
+    }
+
+@app.get("/api/analyzer/ingest-queue")
+async def analyzer_ingest_queue_metrics():
+    """Fila de análise da ingestão WhatsApp: profundidade, descartes, vazão e atraso"""
+    if not ingest_analysis_queue:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    return ingest_analysis_queue.get_metrics()
+
+@app.get("/api/analyzer/lexicon")
+async def analyzer_lexicon_status():
+    """Versão ativa do léxico (embutido ou arquivo SENTIMENT_LEXICON_PATH) e situação da recarga"""
+    if not sentiment_analyzer:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    return sentiment_analyzer.lexicon_reloader.get_status()
+
+@app.post("/api/analyzer/lexicon/reload")
+async def analyzer_lexicon_reload():
+    """
+    Recompila o léxico do arquivo em segundo plano; a troca ocorre na fronteira da próxima análise
+    (os processos do pool detectam a mudança do arquivo em até SENTIMENT_LEXICON_CHECK_SECONDS)
+    """
+    if not sentiment_analyzer:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    result = sentiment_analyzer.lexicon_reloader.reload()
+    if not result.get('success'):
+        raise HTTPException(status_code=400, detail=result.get('error'))
+    return result
+
+@app.get("/api/analyzer/short-messages")
+async def analyzer_short_messages():
+    """
+    Rota curta do analisador (até SENTIMENT_SHORT_MESSAGE_TOKENS tokens): tamanho da tabela pré-calculada,
+    fração das análises que são mensagens curtas e taxa de acerto da tabela (inclui os processos do pool)
+    """
+    if not sentiment_analyzer:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    return sentiment_analyzer.short_messages.get_stats()
+
+@app.get("/api/analyzer/degradation")
+async def analyzer_degradation():
+    """
+    Análises degradadas: textos acima de SENTIMENT_MAX_TEXT_CHARS analisados por janelas e análises que
+    estouraram SENTIMENT_TIME_BUDGET_MS (fases opcionais puladas, por fase; inclui os processos do pool)
+    """
+    if not sentiment_analyzer:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    return {
+        'time_budget_ms': round(sentiment_analyzer.time_budget * 1000, 1),
+        'max_text_chars': sentiment_analyzer.max_text_chars,
+        **sentiment_analyzer.degradation.get_stats()
+    }
+
+@app.get("/api/analyzer/profile")
+async def analyzer_phase_profile(reset: bool = False):
+    """
+    Tempos por fase do analisador (p50/p95/p99 por perfil), a partir das análises amostradas
+    (SENTIMENT_PROFILER_SAMPLE_RATE); reset=true zera os histogramas após a leitura
+    """
+    if not sentiment_analyzer:
+        raise HTTPException(status_code=503, detail="Analisador de sentimentos não disponível")
+    profiler = sentiment_analyzer.profiler
+    report = profiler.get_report()
+    if reset:
+        profiler.reset()
+    return report
+
 # ===== ENDPOINTS DE PRODUTIVIDADE =====
 
 @app.get("/api/productivity/contacts")
@@ -1333,6 +1608,23 @@ async def startup_event():
     else:
         logger.warning("⚠️ get_db_manager não disponível")
     
+    # Relatório das tabelas do analisador de sentimentos (construídas sob demanda)
+    if sentiment_analyzer:
+        sentiment_analyzer.log_table_report()
+    
+    # Pool de processos do analisador (análises fora do event loop)
+    if analyzer_executor:
+        analyzer_executor.start()
+    
+    # Estágio de análise da ingestão WhatsApp (mensagens salvas -> feedbacks analisados + análise em whatsapp_messages)
+    if ingest_analysis_queue and FeedbackService and get_db_manager:
+        # Conexão própria: as gravações da fila rodam na sua thread de escrita, fora do event loop
+        ingest_db = init_database()
+        ingest_analysis_queue.start(
+            FeedbackService(ingest_db),
+            WhatsAppPersistenceService(ingest_db) if ingest_db and whatsapp_persistence else None
+        )
+    
     # NOVO: Inicializar sistema de persistência WhatsApp
     try:
         # Executar limpeza automática na inicialização
@@ -1388,6 +1680,22 @@ async def shutdown_event():
     """Evento de finalização"""
     logger.info("🛑 SacsMax Backend parando...")
     
+    # Tabelas do analisador efetivamente usadas durante a execução
+    if sentiment_analyzer:
+        sentiment_analyzer.log_table_report()
+    
+    # Esvazia a fila de análise antes de encerrar o pool que ela usa
+    if ingest_analysis_queue:
+        await ingest_analysis_queue.stop()
+    
+    if analyzer_executor:
+        logger.info(f"⚙️ Executor do analisador: {analyzer_executor.get_metrics()}")
+        analyzer_executor.shutdown()
+    
+    # Grava os contextos conversacionais pendentes (write-behind) deste processo
+    if sentiment_analyzer:
+        sentiment_analyzer.conversation_contexts.close()
+    
     # Fechar conexões do banco
     if get_db_manager:
         try:
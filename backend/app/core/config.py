@@ -29,6 +29,35 @@ class Settings:
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     allowed_extensions: list = [".xlsx", ".xls", ".csv"]
     
+    # Configurações do analisador de sentimentos (perfis: fast, standard, full)
+    sentiment_analysis_profile: str = os.getenv("SENTIMENT_ANALYSIS_PROFILE", "full")
+    sentiment_ingest_profile: str = os.getenv("SENTIMENT_INGEST_PROFILE", "standard")  # intenção/urgência gravadas em whatsapp_messages
+    sentiment_snapshot_path: str = os.getenv("SENTIMENT_SNAPSHOT_PATH", "./cache/sentiment_lexicon.snapshot")
+    sentiment_lexicon_path: str = os.getenv("SENTIMENT_LEXICON_PATH", "")  # JSON externo (vazio = léxico embutido)
+    sentiment_lexicon_check_seconds: float = float(os.getenv("SENTIMENT_LEXICON_CHECK_SECONDS", 5))
+    sentiment_batch_max_items: int = int(os.getenv("SENTIMENT_BATCH_MAX_ITEMS", 50000))
+    sentiment_executor_workers: int = int(os.getenv("SENTIMENT_EXECUTOR_WORKERS", 2))
+    sentiment_executor_timeout: float = float(os.getenv("SENTIMENT_EXECUTOR_TIMEOUT", 10))
+    sentiment_preload: bool = os.getenv("SENTIMENT_PRELOAD", "true").lower() == "true"  # gunicorn: analisador no mestre antes do fork
+    sentiment_cache_max_entries: int = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", 20000))
+    sentiment_cache_max_bytes: int = int(os.getenv("SENTIMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024))  # 64MB
+    sentiment_cache_ttl_seconds: float = float(os.getenv("SENTIMENT_CACHE_TTL_SECONDS", 3600))
+    sentiment_short_message_tokens: int = int(os.getenv("SENTIMENT_SHORT_MESSAGE_TOKENS", 3))  # rota curta: até N tokens (0 = desligada)
+    sentiment_short_message_table_size: int = int(os.getenv("SENTIMENT_SHORT_MESSAGE_TABLE_SIZE", 5000))
+    sentiment_time_budget_ms: float = float(os.getenv("SENTIMENT_TIME_BUDGET_MS", 100))  # prazo das fases opcionais (0 = sem prazo)
+    sentiment_max_text_chars: int = int(os.getenv("SENTIMENT_MAX_TEXT_CHARS", 4000))  # acima disso: início + fim do texto (0 = sem limite)
+    sentiment_context_max_users: int = int(os.getenv("SENTIMENT_CONTEXT_MAX_USERS", 10000))
+    sentiment_context_idle_ttl_seconds: float = float(os.getenv("SENTIMENT_CONTEXT_IDLE_TTL_SECONDS", 86400))  # 24h
+    sentiment_context_max_bytes: int = int(os.getenv("SENTIMENT_CONTEXT_MAX_BYTES", 32 * 1024 * 1024))  # 32MB
+    sentiment_context_persist: bool = os.getenv("SENTIMENT_CONTEXT_PERSIST", "true").lower() == "true"  # PostgreSQL (write-behind)
+    sentiment_context_flush_seconds: float = float(os.getenv("SENTIMENT_CONTEXT_FLUSH_SECONDS", 5))
+    sentiment_context_refresh_seconds: float = float(os.getenv("SENTIMENT_CONTEXT_REFRESH_SECONDS", 30))  # releitura do contexto gravado por outros processos
+    sentiment_profiler_sample_rate: float = float(os.getenv("SENTIMENT_PROFILER_SAMPLE_RATE", 0.01))  # 1% das análises
+    sentiment_ingest_queue_size: int = int(os.getenv("SENTIMENT_INGEST_QUEUE_SIZE", 5000))
+    sentiment_ingest_workers: int = int(os.getenv("SENTIMENT_INGEST_WORKERS", 2))
+    sentiment_ingest_batch_size: int = int(os.getenv("SENTIMENT_INGEST_BATCH_SIZE", 32))
+    sentiment_ingest_batch_wait_ms: float = float(os.getenv("SENTIMENT_INGEST_BATCH_WAIT_MS", 50))
+    
     # Configurações de logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     log_file: str = "./logs/sacsmax.log"
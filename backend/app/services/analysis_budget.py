@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+⏱️ ORÇAMENTO DE TEMPO POR ANÁLISE ⏱️
+Todas as fases são lineares (ou piores) no tamanho do texto, então uma mensagem
+patológica (texto enorme colado, enxurrada de emojis) custaria muito mais que
+uma mensagem normal. Duas proteções, ambas configuráveis:
+
+- Janela de entrada: acima de settings.sentiment_max_text_chars caracteres,
+  a análise usa o início e o fim do texto (window_text), onde normalmente estão
+  o assunto e o pedido do cliente.
+- Prazo: cada análise tem settings.sentiment_time_budget_ms. As fases
+  obrigatórias (score léxico, emoções, contextos e palavras-chave) sempre
+  executam; as opcionais (sarcasmo, intenção, urgência e fases profundas) só
+  começam antes do prazo. Fases puladas ficam fora do resultado.
+
+Resultados truncados ou com fases puladas levam 'degraded': True e o detalhe em
+'degradation', e não entram nos caches (dependem do tempo de cada execução).
+"""
+
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+def window_text(text: str, max_chars: int) -> str:
+    """Início e fim do texto, somando no máximo max_chars caracteres, cortados em espaços"""
+    if len(text) <= max_chars:
+        return text
+    head_chars = max_chars // 2
+    tail_chars = max_chars - head_chars
+    head = text[:head_chars]
+    tail = text[-tail_chars:] if tail_chars else ''
+    # Não corta palavras ao meio (a não ser que a janela inteira seja uma única "palavra")
+    if ' ' in head:
+        head = head.rsplit(' ', 1)[0]
+    if ' ' in tail:
+        tail = tail.split(' ', 1)[1]
+    return f"{head} {tail}"
+
+
+class AnalysisBudget:
+    """Fases de uma análise e o seu prazo: as opcionais só executam enquanto houver tempo"""
+    
+    __slots__ = ('phases', 'deadline', 'skipped')
+    
+    def __init__(self, phases: frozenset, deadline: Optional[float] = None):
+        self.phases = phases
+        # Instante (time.perf_counter) a partir do qual fases opcionais não começam; None = sem prazo
+        self.deadline = deadline
+        self.skipped: List[str] = []
+    
+    def allows(self, phase: str) -> bool:
+        """A fase está no perfil e ainda há tempo (senão é registrada como pulada)"""
+        if phase not in self.phases:
+            return False
+        if self.deadline is None or time.perf_counter() < self.deadline:
+            return True
+        self.skipped.append(phase)
+        return False
+    
+    def ran(self, phase: str) -> bool:
+        """A fase estava no perfil e não foi pulada"""
+        return phase in self.phases and phase not in self.skipped
+
+
+class DegradationStats:
+    """Contadores de análises degradadas (prazo estourado e entradas truncadas), por processo"""
+    
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.skipped_phases: Counter = Counter()
+        # Modo processo do pool: incrementos guardados até drain_metrics()
+        self._pending: Optional[Counter] = None
+    
+    def record(self, truncated_chars: int = 0, skipped: Optional[List[str]] = None):
+        """Registra uma análise (degradada se truncada ou com fases puladas)"""
+        if not truncated_chars and not skipped:
+            self.counts['analyses'] += 1
+            if self._pending is not None:
+                self._pending['analyses'] += 1
+            return
+        counts = Counter(analyses=1, degraded=1)
+        if truncated_chars:
+            counts['truncated'] += 1
+            counts['truncated_chars'] += truncated_chars
+        if skipped:
+            counts['over_budget'] += 1
+            counts.update(f"skipped:{phase}" for phase in skipped)
+        self.record_metrics(counts)
+        if self._pending is not None:
+            self._pending.update(counts)
+    
+    def enable_forwarding(self):
+        """Modo processo do pool: drain_metrics() devolve os incrementos desde a última chamada"""
+        self._pending = Counter()
+    
+    def drain_metrics(self) -> Dict[str, int]:
+        if not self._pending:
+            return {}
+        pending, self._pending = self._pending, Counter()
+        return dict(pending)
+    
+    def record_metrics(self, counts: Dict[str, int]):
+        """Soma contadores (de uma análise local ou encaminhados por um processo do pool)"""
+        for name, value in counts.items():
+            if name.startswith('skipped:'):
+                self.skipped_phases[name[8:]] += value
+            else:
+                self.counts[name] += value
+    
+    def reset(self):
+        self.counts.clear()
+        self.skipped_phases.clear()
+        if self._pending is not None:
+            self._pending = Counter()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        analyses = self.counts['analyses']
+        return {
+            'analyses': analyses,
+            'degraded': self.counts['degraded'],
+            'degraded_rate': round(self.counts['degraded'] / analyses, 4) if analyses else 0.0,
+            'over_budget': self.counts['over_budget'],
+            'truncated': self.counts['truncated'],
+            'truncated_chars': self.counts['truncated_chars'],
+            'skipped_phases': dict(self.skipped_phases.most_common())
+        }
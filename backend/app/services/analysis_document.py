@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+📄 DOCUMENTO DE ANÁLISE COMPARTILHADO 📄
+Texto preprocessado, tokens e acertos de dicionários calculados uma única vez
+e repassados a todas as fases do analisador. Os tokens estão na forma canônica
+(a mesma das chaves dos dicionários); words traz as mesmas posições como
+foram escritas, para exibição
+"""
+
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from .keyword_matcher import KeywordHits
+
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+
+class AnalysisDocument:
+    """Texto de uma análise com forma canônica, tokens, contagens, offsets e acertos de emojis/palavras-chave"""
+    
+    __slots__ = ('text', 'lowered', 'tokens', 'hits', 'emoji_hits', '_words', '_token_counts', '_offsets')
+    
+    def __init__(self, text: str, hits: KeywordHits, emoji_hits: Optional[List[Tuple[str, float]]] = None):
+        self.text = text
+        # Texto varrido pelo matcher: minúsculas na forma canônica
+        self.lowered = hits.text
+        self.tokens: List[str] = self.lowered.split()
+        self.hits = hits
+        self._words: Optional[List[str]] = None
+        self.emoji_hits = emoji_hits if emoji_hits is not None else []
+        self._token_counts: Optional[Counter] = None
+        self._offsets: Optional[List[int]] = None
+    
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+    
+    @property
+    def density_base(self) -> int:
+        """Divisor das densidades por palavra das fases: ao menos 1 (mensagens só de emojis não têm tokens)"""
+        return len(self.tokens) or 1
+    
+    @property
+    def words(self) -> List[str]:
+        """Tokens como foram escritos (minúsculas), alinhados a tokens; calculados no primeiro uso"""
+        if self._words is None:
+            self._words = self.text.lower().split()
+        return self._words
+    
+    @property
+    def token_counts(self) -> Counter:
+        """Frequência dos tokens (na ordem da primeira ocorrência); calculada no primeiro uso"""
+        if self._token_counts is None:
+            self._token_counts = Counter(self.tokens)
+        return self._token_counts
+    
+    @property
+    def offsets(self) -> List[int]:
+        """Posição inicial de cada token em lowered; calculada no primeiro uso"""
+        if self._offsets is None:
+            self._offsets = [match.start() for match in _TOKEN_PATTERN.finditer(self.lowered)]
+        return self._offsets
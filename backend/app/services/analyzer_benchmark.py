@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+🏁 BENCHMARK DO ANALISADOR DE SENTIMENTOS 🏁
+Gera um corpus sintético e determinístico de mensagens de SAC em português
+(comprimentos, emojis, gírias e negações em proporções realistas) e mede, para
+cada perfil de análise, mensagens/segundo, percentis de latência por chamada e
+pico de memória. O relatório é gravado em JSON para comparação entre execuções:
+    
+    python -m app.services.analyzer_benchmark --messages 2000 --output bench.json
+    python -m app.services.analyzer_benchmark --compare bench.json
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# ===== VOCABULÁRIO DO CORPUS SINTÉTICO =====
+
+_GREETINGS = ['oi', 'olá', 'bom dia', 'boa tarde', 'boa noite', 'oi pessoal', 'e aí', 'opa']
+_SUBJECTS = ['o produto', 'a entrega', 'o atendimento', 'o suporte', 'o preço', 'o pedido', 'a qualidade',
+             'o aplicativo', 'o site', 'a troca', 'o reembolso', 'a cobrança', 'o serviço', 'o frete']
+_POSITIVE = ['excelente', 'ótimo', 'maravilhoso', 'rápido', 'perfeito', 'muito bom', 'incrível', 'top',
+             'show de bola', 'nota 10', 'eficiente', 'satisfeito', 'recomendo']
+_NEGATIVE = ['péssimo', 'horrível', 'demorado', 'ruim', 'lento', 'caro', 'decepcionante', 'uma vergonha',
+             'um absurdo', 'insatisfeito', 'quebrado', 'errado', 'um lixo']
+_NEGATIONS = ['não', 'nunca', 'nem', 'jamais']
+_INTENSIFIERS = ['muito', 'super', 'extremamente', 'bem', 'totalmente', 'demais de']
+_REQUESTS = ['preciso de ajuda', 'quero cancelar', 'quero meu dinheiro de volta', 'quando chega',
+             'como faço para trocar', 'alguém pode me responder', 'qual o prazo', 'vou reclamar no procon']
+_URGENCY = ['urgente', 'agora', 'hoje ainda', 'o quanto antes', 'imediatamente']
+_SLANG = {'você': 'vc', 'porque': 'pq', 'também': 'tb', 'muito': 'mt', 'que': 'q', 'beleza': 'blz',
+          'obrigado': 'vlw', 'para': 'pra', 'está': 'tá', 'não': 'n'}
+_INTERJECTIONS = ['kkkk', 'aff', 'pfv', 'mano', 'nossa', 'poxa', 'rsrs', 'sério']
+_SHORT = ['ok', 'obrigado', 'valeu', 'blz', 'sim', 'não', 'pode ser', 'certo', 'entendi', 'oi?', 'alô']
+_POSITIVE_EMOJIS = ['😍', '👍', '🎉', '😊', '❤️', '👏', '🙏', '😁']
+_NEGATIVE_EMOJIS = ['😡', '😤', '👎', '😢', '😭', '🙄', '💔', '😠']
+
+# Proporções do corpus
+SHORT_RATIO = 0.30       # mensagens de 1 a 3 palavras
+LONG_RATIO = 0.20        # mensagens com várias frases
+EMOJI_RATIO = 0.35
+SLANG_RATIO = 0.30
+NEGATION_RATIO = 0.25
+USER_ID_RATIO = 0.60     # mensagens associadas a um usuário (memória conversacional)
+USER_POOL = 300
+
+DEFAULT_PROFILES = ('fast', 'standard', 'full')
+
+
+def _sentence(rng: random.Random) -> str:
+    """Uma frase de avaliação: assunto + (negação) + verbo + (intensificador) + adjetivo"""
+    positive = rng.random() < 0.5
+    words = [rng.choice(_SUBJECTS)]
+    if rng.random() < NEGATION_RATIO:
+        words.append(rng.choice(_NEGATIONS))
+    words.append('foi' if rng.random() < 0.5 else 'está')
+    if rng.random() < 0.35:
+        words.append(rng.choice(_INTENSIFIERS))
+    words.append(rng.choice(_POSITIVE if positive else _NEGATIVE))
+    if rng.random() < 0.2:
+        words.append(rng.choice(_URGENCY))
+    sentence = ' '.join(words)
+    if rng.random() < EMOJI_RATIO:
+        emojis = _POSITIVE_EMOJIS if positive else _NEGATIVE_EMOJIS
+        sentence += ' ' + ''.join(rng.choice(emojis) for _ in range(rng.randint(1, 3)))
+    return sentence
+
+
+def _apply_slang(rng: random.Random, text: str) -> str:
+    words = [(_SLANG.get(word, word) if rng.random() < 0.7 else word) for word in text.split(' ')]
+    if rng.random() < 0.5:
+        words.append(rng.choice(_INTERJECTIONS))
+    return ' '.join(words)
+
+
+def generate_message(rng: random.Random) -> str:
+    """Uma mensagem sintética de SAC (curta, média ou longa)"""
+    roll = rng.random()
+    if roll < SHORT_RATIO:
+        text = rng.choice(_SHORT)
+        if rng.random() < EMOJI_RATIO:
+            text += ' ' + rng.choice(_POSITIVE_EMOJIS + _NEGATIVE_EMOJIS)
+        return text
+    
+    parts = []
+    if rng.random() < 0.4:
+        parts.append(rng.choice(_GREETINGS))
+    sentences = rng.randint(3, 6) if roll > 1 - LONG_RATIO else rng.randint(1, 2)
+    for _ in range(sentences):
+        parts.append(_sentence(rng))
+        if rng.random() < 0.3:
+            parts.append(rng.choice(_REQUESTS))
+    
+    text = ', '.join(parts) + rng.choice(['.', '!', '!!!', '?', '...', ''])
+    if rng.random() < SLANG_RATIO:
+        text = _apply_slang(rng, text)
+    if rng.random() < 0.08:
+        text = text.upper()
+    return text[0].upper() + text[1:]
+
+
+def generate_corpus(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Corpus determinístico: a mesma semente sempre gera as mesmas mensagens e usuários"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        text = generate_message(rng)
+        user_id = f"bench_{rng.randrange(USER_POOL)}" if rng.random() < USER_ID_RATIO else None
+        corpus.append({'text': text, 'user_id': user_id})
+    return corpus
+
+
+def corpus_fingerprint(corpus: Sequence[Dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for item in corpus:
+        digest.update(f"{item['user_id']}\x00{item['text']}\x01".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+# ===== EXECUÇÃO =====
+
+def benchmark_profile(analyzer, corpus: Sequence[Dict[str, Any]], profile: str, warmup: int = 200,
+                      memory_sample: int = 500) -> Dict[str, Any]:
+    """Mede um perfil: passada cronometrada sobre o corpus inteiro e passada com tracemalloc para o pico de memória"""
+    analyzer.result_cache.clear()
+    analyzer.short_messages.clear()
+    analyzer.conversation_contexts.clear()
+    analyzer.get_keyword_matcher(profile)
+    for item in corpus[:warmup]:
+        analyzer.analyze_sentiment_supreme(item['text'], None, profile=profile)
+    analyzer.result_cache.clear()
+    analyzer.short_messages.clear()
+    
+    latencies = []
+    distribution: Dict[str, int] = {}
+    analyze = analyzer.analyze_sentiment_supreme
+    perf_counter = time.perf_counter
+    
+    gc.collect()
+    started = perf_counter()
+    for item in corpus:
+        call_started = perf_counter()
+        result = analyze(item['text'], item['user_id'], profile=profile)
+        latencies.append(perf_counter() - call_started)
+        distribution[result[0]] = distribution.get(result[0], 0) + 1
+    elapsed = perf_counter() - started
+    cache_stats = analyzer.result_cache.get_stats()
+    
+    # Pico de memória alocada durante a análise (tracemalloc desacelera, por isso passada separada)
+    analyzer.result_cache.clear()
+    analyzer.short_messages.clear()
+    gc.collect()
+    tracemalloc.start()
+    for item in corpus[:memory_sample]:
+        analyze(item['text'], item['user_id'], profile=profile)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    ordered = sorted(latencies)
+    return {
+        'messages': len(corpus),
+        'elapsed_seconds': round(elapsed, 4),
+        'messages_per_second': round(len(corpus) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'mean': round(elapsed / len(corpus) * 1000, 4) if corpus else 0.0,
+            'p50': round(_percentile(ordered, 0.50) * 1000, 4),
+            'p90': round(_percentile(ordered, 0.90) * 1000, 4),
+            'p95': round(_percentile(ordered, 0.95) * 1000, 4),
+            'p99': round(_percentile(ordered, 0.99) * 1000, 4),
+            'max': round(ordered[-1] * 1000, 4) if ordered else 0.0
+        },
+        'peak_memory_kb': round(peak / 1024, 1),
+        'memory_sample_messages': min(memory_sample, len(corpus)),
+        'cache_hit_rate': cache_stats['hit_rate'],
+        'sentiment_distribution': distribution
+    }
+
+
+def run_benchmark(messages: int = 2000, seed: int = 42, profiles: Sequence[str] = DEFAULT_PROFILES,
+                  use_cache: bool = False, warmup: int = 200) -> Dict[str, Any]:
+    """🏁 Executa o benchmark e retorna o relatório (dict serializável em JSON)"""
+    from .sentiment_analyzer import SupremeSentimentAnalyzer
+    
+    corpus = generate_corpus(messages, seed)
+    
+    init_started = time.perf_counter()
+    analyzer = SupremeSentimentAnalyzer()
+    init_seconds = time.perf_counter() - init_started
+    if not use_cache:
+        analyzer.result_cache.max_entries = 0
+        analyzer.short_messages.max_entries = 0
+    
+    results = {}
+    for profile in profiles:
+        analyzer.get_profile_phases(profile)
+        logger.info(f"🏁 Perfil {profile}: {messages} mensagens...")
+        results[profile] = benchmark_profile(analyzer, corpus, profile, warmup=min(warmup, messages))
+        logger.info(f"🏁 Perfil {profile}: {results[profile]['messages_per_second']} msg/s | "
+                    f"p50 {results[profile]['latency_ms']['p50']}ms | p99 {results[profile]['latency_ms']['p99']}ms")
+    
+    return {
+        'benchmark': 'sentiment_analyzer',
+        'created_at': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'lexicon_version': analyzer.lexicon_version,
+        'analyzer_init_seconds': round(init_seconds, 4),
+        'corpus': {
+            'messages': messages,
+            'seed': seed,
+            'fingerprint': corpus_fingerprint(corpus),
+            'avg_chars': round(sum(len(item['text']) for item in corpus) / max(messages, 1), 1)
+        },
+        'result_cache': use_cache,
+        'profiles': results
+    }
+
+
+def compare_reports(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Variação percentual (atual vs anterior) de throughput, p50, p99 e memória por perfil"""
+    comparison = {}
+    for profile, now in current['profiles'].items():
+        before = previous.get('profiles', {}).get(profile)
+        if not before:
+            continue
+        pairs = {
+            'messages_per_second': (before['messages_per_second'], now['messages_per_second']),
+            'p50_ms': (before['latency_ms']['p50'], now['latency_ms']['p50']),
+            'p99_ms': (before['latency_ms']['p99'], now['latency_ms']['p99']),
+            'peak_memory_kb': (before['peak_memory_kb'], now['peak_memory_kb'])
+        }
+        comparison[profile] = {
+            metric: round((new - old) / old * 100, 1) if old else 0.0
+            for metric, (old, new) in pairs.items()
+        }
+    if previous.get('corpus', {}).get('fingerprint') != current['corpus']['fingerprint']:
+        logger.warning("⚠️ Corpus diferente do relatório anterior: comparação não é direta")
+    return comparison
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark do analisador de sentimentos')
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--profiles', default=','.join(DEFAULT_PROFILES))
+    parser.add_argument('--warmup', type=int, default=200)
+    parser.add_argument('--cache', action='store_true', help='mantém o cache de resultados ligado')
+    parser.add_argument('--output', default='sentiment_benchmark.json')
+    parser.add_argument('--compare', help='relatório anterior para comparar')
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    # O log detalhado por mensagem distorceria as medidas
+    logging.getLogger('app.services.sentiment_analyzer').setLevel(logging.WARNING)
+    
+    report = run_benchmark(args.messages, args.seed, [p.strip() for p in args.profiles.split(',') if p.strip()],
+                           use_cache=args.cache, warmup=args.warmup)
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            report['comparison'] = {'baseline': args.compare, 'delta_percent': compare_reports(json.load(f), report)}
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    print(json.dumps({profile: {'msg/s': r['messages_per_second'], 'p50_ms': r['latency_ms']['p50'],
+                                'p99_ms': r['latency_ms']['p99'], 'peak_kb': r['peak_memory_kb']}
+                      for profile, r in report['profiles'].items()}, indent=2))
+    if 'comparison' in report:
+        print(json.dumps(report['comparison']['delta_percent'], indent=2))
+    print(f"✅ Relatório gravado em {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
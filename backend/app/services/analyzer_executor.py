@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+⚙️ EXECUTOR DO ANALISADOR DE SENTIMENTOS ⚙️
+Executa a análise (CPU pura em Python) em um ProcessPoolExecutor para não
+bloquear o event loop do FastAPI. Cada processo carrega o analisador uma vez.
+
+Uma análise que excede o timeout é abandonada pelo chamador, mas o processo
+a conclui: pendências, tempo ocupado e utilização só são contabilizados quando
+ela termina de fato (análises ainda na fila são canceladas).
+
+Observação: a memória conversacional e o histórico de aprendizagem do
+analisador ficam no processo que executou a análise.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing.util
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from .phase_profiler import phase_profiler
+
+logger = logging.getLogger(__name__)
+
+
+# ===== FUNÇÕES EXECUTADAS NOS PROCESSOS DO POOL =====
+
+def _init_worker(profile: str):
+    """Pré-carrega o analisador e o matcher do perfil no processo do pool"""
+    from .sentiment_analyzer import sentiment_analyzer
+    sentiment_analyzer.get_keyword_matcher(profile)
+    # Contextos conversacionais ainda não gravados saem no encerramento do processo
+    multiprocessing.util.Finalize(None, sentiment_analyzer.conversation_contexts.close, exitpriority=10)
+    # Tempos amostrados das fases e contadores do analisador (rota curta, degradação) voltam ao processo
+    # principal junto com cada resultado
+    phase_profiler.enable_forwarding()
+    sentiment_analyzer.enable_metrics_forwarding()
+    logger.info(f"⚙️ Processo de análise {os.getpid()} pronto (perfil {profile})")
+
+
+def _worker_analyze(text: str, user_id: Optional[str], profile: Optional[str],
+                    fields: Optional[List[str]] = None) -> Tuple[Tuple, float, List, Dict[str, Dict[str, int]]]:
+    from .sentiment_analyzer import sentiment_analyzer
+    started = time.perf_counter()
+    result = sentiment_analyzer.analyze_sentiment_supreme(text, user_id, profile=profile, fields=fields)
+    return result, time.perf_counter() - started, phase_profiler.drain(), sentiment_analyzer.drain_metrics()
+
+
+def _worker_analyze_batch(texts: List[Any], profile: Optional[str],
+                          fields: Optional[List[str]] = None) -> Tuple[List[Tuple], float, List, Dict[str, Dict[str, int]]]:
+    from .sentiment_analyzer import sentiment_analyzer
+    started = time.perf_counter()
+    results = sentiment_analyzer.analyze_batch(texts, profile, fields)
+    return results, time.perf_counter() - started, phase_profiler.drain(), sentiment_analyzer.drain_metrics()
+
+
+class AnalyzerExecutor:
+    """
+    Pool de processos para análise de sentimentos com API assíncrona
+    
+    Uso: result = await analyzer_executor.analyze(text, profile='fast', timeout=5)
+    Com workers = 0 a análise roda em uma thread (não bloqueia o event loop, mas disputa o GIL)
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, default_timeout: Optional[float] = None,
+                 profile: Optional[str] = None):
+        self.max_workers = settings.sentiment_executor_workers if max_workers is None else max_workers
+        self.default_timeout = settings.sentiment_executor_timeout if default_timeout is None else default_timeout
+        self.profile = profile or settings.sentiment_ingest_profile
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        
+        # Métricas
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        # Análises que excederam o timeout e ainda ocupam um processo
+        self._abandoned = set()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._pool is not None
+    
+    def start(self) -> bool:
+        """Cria o pool de processos (idempotente)"""
+        with self._lock:
+            if self._pool is not None:
+                return True
+            if self.max_workers <= 0:
+                logger.info("⚙️ Executor do analisador sem processos: análises rodarão em thread")
+                self._started_at = time.monotonic()
+                return False
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.profile,)
+                )
+                self._started_at = time.monotonic()
+                logger.info(f"⚙️ Executor do analisador iniciado: {self.max_workers} processos")
+                return True
+            except Exception as e:
+                logger.error(f"❌ Erro ao iniciar executor do analisador: {e}")
+                self._pool = None
+                return False
+    
+    def shutdown(self, wait: bool = True):
+        """Encerra o pool de processos"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            threads, self._threads = self._threads, None
+        if threads:
+            threads.shutdown(wait=wait, cancel_futures=True)
+        if pool:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info("⚙️ Executor do analisador encerrado")
+    
+    def _executor(self) -> Executor:
+        """Pool de processos ou, sem processos (workers = 0 ou falha ao iniciar), um pool de threads"""
+        pool = self._pool
+        if pool is not None:
+            return pool
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(thread_name_prefix='analyzer')
+            return self._threads
+    
+    def resolve_timeout(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Timeout efetivo de uma chamada: o do cliente (número > 0) ou o padrão
+        (SENTIMENT_EXECUTOR_TIMEOUT = 0 desativa o padrão). ValueError para valores <= 0 ou inválidos
+        """
+        if timeout is None:
+            return self.default_timeout or None
+        try:
+            timeout = float(timeout)
+        except (TypeError, ValueError):
+            raise ValueError(f"timeout inválido: {timeout!r}")
+        if not timeout > 0:
+            raise ValueError("timeout deve ser maior que zero")
+        return timeout
+    
+    async def _submit(self, function, *args, timeout: Optional[float] = None):
+        timeout = self.resolve_timeout(timeout)
+        if self._pool is None and self._started_at is None:
+            self.start()
+        
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        self.submitted += 1
+        submitted_at = time.perf_counter()
+        try:
+            job = self._executor().submit(function, *args)
+        except Exception:
+            self.pending -= 1
+            self.failed += 1
+            raise
+        
+        # Métricas contabilizadas quando o processo termina, mesmo que o chamador já tenha desistido
+        future = asyncio.wrap_future(job, loop=loop)
+        future.add_done_callback(functools.partial(self._record, job, submitted_at))
+        try:
+            result, _, _, _ = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+            return result
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if job.cancel():
+                logger.warning(f"⏱️ Análise excedeu {timeout}s na fila e foi cancelada")
+            else:
+                self._abandoned.add(job)
+                logger.warning(f"⏱️ Análise excedeu {timeout}s e foi abandonada (o processo ainda a conclui)")
+            raise
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+    
+    def _record(self, job: Future, submitted_at: float, future: asyncio.Future):
+        """Fim real de uma análise (concluída, com erro ou cancelada na fila)"""
+        self.pending -= 1
+        self._abandoned.discard(job)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.failed += 1
+            return
+        _, busy, profile_samples, analyzer_metrics = future.result()
+        phase_profiler.record_many(profile_samples)
+        if analyzer_metrics:
+            from .sentiment_analyzer import sentiment_analyzer
+            sentiment_analyzer.record_metrics(analyzer_metrics)
+        self.completed += 1
+        self.busy_seconds += busy
+        self.wait_seconds += max(0.0, time.perf_counter() - submitted_at - busy)
+    
+    async def analyze(self, text: str, user_id: Optional[str] = None, profile: Optional[str] = None,
+                      timeout: Optional[float] = None,
+                      fields: Optional[List[str]] = None) -> Tuple[str, float, List[str], Dict]:
+        """Análise de um texto fora do event loop (asyncio.TimeoutError se exceder o timeout, ValueError se timeout <= 0)"""
+        return await self._submit(_worker_analyze, text, user_id, profile or self.profile, fields, timeout=timeout)
+    
+    async def analyze_batch(self, texts: List[Any], profile: Optional[str] = None, timeout: Optional[float] = None,
+                            fields: Optional[List[str]] = None) -> List[Tuple[str, float, List[str], Dict]]:
+        """Análise de um lote inteiro em um único processo do pool"""
+        return await self._submit(_worker_analyze_batch, list(texts), profile or self.profile, fields, timeout=timeout)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Profundidade da fila e utilização dos processos, para dimensionar o pool"""
+        workers = self.max_workers if self._pool else 0
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        capacity = max(workers, 1) * uptime
+        return {
+            'running': self.is_running,
+            'workers': workers,
+            'profile': self.profile,
+            'default_timeout': self.default_timeout,
+            'pending': self.pending,
+            'queue_depth': max(0, self.pending - workers) if workers else self.pending,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'timeouts': self.timeouts,
+            'abandoned_running': len(self._abandoned),
+            'avg_analysis_ms': round(self.busy_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+            'avg_queue_wait_ms': round(self.wait_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+            'utilization': round(min(1.0, self.busy_seconds / capacity), 4) if capacity else 0.0,
+            'uptime_seconds': round(uptime, 1)
+        }
+
+
+# Instância global do executor (o pool é criado no startup da aplicação ou no primeiro uso)
+analyzer_executor = AnalyzerExecutor()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+🧊 PRÉ-CARGA DO ANALISADOR PARA WORKERS PRÉ-FORKADOS 🧊
+Com vários workers do gunicorn, cada um importaria o analisador e construiria
+a sua própria cópia das tabelas de conhecimento. No modo de pré-carga
+(SENTIMENT_PRELOAD=true, ver gunicorn.conf.py) o processo mestre importa apenas
+o analisador (a aplicação e as conexões com o banco só existem nos workers),
+constrói as tabelas, os matchers dos perfis e os scorers antes do fork e chama
+gc.freeze(): os objetos ficam fora das coletas do GC, que de outra forma
+escreveriam nos seus cabeçalhos e copiariam as páginas compartilhadas para
+cada worker.
+
+Relatório de memória (RSS e PSS por worker, com e sem pré-carga):
+    
+    python -m app.services.analyzer_preload report --workers 4
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Mensagens usadas para exercitar o analisador antes do fork e nos workers do relatório
+WARMUP_MESSAGES = (
+    'Bom dia, o atendimento foi ótimo, muito obrigado! 👍',
+    'Estou muito insatisfeito, o produto chegou quebrado e ninguém resolve 😡',
+    'Preciso urgente de uma resposta sobre o meu pedido',
+    'ok',
+    'Que bom né, mais uma semana esperando... excelente serviço',
+)
+
+# Campos de /proc/<pid>/smaps_rollup incluídos no relatório (kB)
+MEMORY_FIELDS = {
+    'Rss': 'rss_kb',
+    'Pss': 'pss_kb',
+    'Shared_Clean': 'shared_clean_kb',
+    'Shared_Dirty': 'shared_dirty_kb',
+    'Private_Clean': 'private_clean_kb',
+    'Private_Dirty': 'private_dirty_kb',
+}
+
+
+def warm_analyzer(analyzer, profiles: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Constrói todas as tabelas sob demanda, os matchers dos perfis e os scorers do analisador
+    e pré-calcula a tabela de mensagens curtas de cada perfil
+    """
+    started = time.perf_counter()
+    profiles = list(profiles or dict.fromkeys([analyzer.default_profile, analyzer.ingest_profile]))
+    analyzer.load_all_tables()
+    short_messages = 0
+    for profile in profiles:
+        analyzer.get_keyword_matcher(profile)
+        # Uma passada por perfil cria os caches internos restantes (regex, normalizador);
+        # sem user_id, o aquecimento não consulta o banco (nenhuma conexão é herdada pelos workers)
+        analyzer.analyze_batch(list(WARMUP_MESSAGES), profile)
+        short_messages += analyzer.precompute_short_messages(profile)
+    # Os resultados das mensagens de aquecimento não devem ser herdados pelos workers
+    # (a tabela de mensagens curtas é mantida; os contadores passam a contar só o tráfego real)
+    analyzer.result_cache.clear()
+    analyzer.short_messages.reset_metrics()
+    analyzer.degradation.reset()
+    report = analyzer.get_table_report()
+    return {
+        'profiles': profiles,
+        'loaded_tables': report['loaded_tables'],
+        'registered_tables': report['registered_tables'],
+        'short_messages': short_messages,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
+def freeze_for_fork() -> int:
+    """Coleta o lixo e congela os objetos sobreviventes (ficam fora das coletas dos processos filhos)"""
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def preload(profiles: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """No processo mestre, antes do fork dos workers: aquece o analisador global e congela o heap"""
+    from .sentiment_analyzer import sentiment_analyzer
+    
+    result = warm_analyzer(sentiment_analyzer, profiles)
+    result['frozen_objects'] = freeze_for_fork()
+    result['memory'] = process_memory()
+    logger.info(f"🧊 Analisador pré-carregado para fork: {result['loaded_tables']}/{result['registered_tables']} tabelas, "
+                f"perfis {', '.join(result['profiles'])} em {result['elapsed_ms']:.0f}ms | "
+                f"{result['frozen_objects']} objetos congelados | RSS {result['memory'].get('rss_kb')} kB")
+    return result
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, Any]:
+    """RSS, PSS e páginas compartilhadas/privadas do processo (kB), de /proc/<pid>/smaps_rollup"""
+    pid = pid or os.getpid()
+    memory: Dict[str, Any] = {'pid': pid}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in MEMORY_FIELDS:
+                    memory[MEMORY_FIELDS[key]] = int(value.split()[0])
+    except OSError:
+        # Sem smaps_rollup (kernel antigo ou fora do Linux): apenas o RSS
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        memory['rss_kb'] = int(line.split()[1])
+        except OSError:
+            pass
+    return memory
+
+
+# ===== 📊 RELATÓRIO: WORKERS COM E SEM PRÉ-CARGA =====
+
+def _run_worker(preloaded: bool, ready_fd: int, release_fd: int):
+    """
+    Processo filho: sem pré-carga constrói as suas próprias tabelas; depois atende algumas análises
+    (a instância global, criada no import do pacote, é compartilhada nos dois modos: a comparação
+    subestima o custo sem pré-carga)
+    """
+    try:
+        from .sentiment_analyzer import sentiment_analyzer
+        if not preloaded:
+            warm_analyzer(sentiment_analyzer)
+        for _ in range(20):
+            sentiment_analyzer.analyze_batch(list(WARMUP_MESSAGES), sentiment_analyzer.default_profile)
+        os.write(ready_fd, b'1')
+        # Permanece vivo até o mestre medir todos os workers (o PSS divide as páginas entre os vivos)
+        os.read(release_fd, 1)
+    finally:
+        os._exit(0)
+
+
+def measure_workers(workers: int, preloaded: bool) -> Dict[str, Any]:
+    """Forka workers (após a pré-carga, se pedida) e mede a memória de cada um com todos vivos"""
+    master: Dict[str, Any] = {}
+    if preloaded:
+        master = preload()
+    
+    ready_read, ready_write = os.pipe()
+    release_read, release_write = os.pipe()
+    pids: List[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(preloaded, ready_write, release_read)
+        pids.append(pid)
+    
+    for _ in pids:
+        os.read(ready_read, 1)
+    worker_memory = [process_memory(pid) for pid in pids]
+    master_memory = process_memory()
+    os.write(release_write, b'1' * len(pids))
+    for pid in pids:
+        os.waitpid(pid, 0)
+    
+    def total(key: str, rows: List[Dict[str, Any]]) -> int:
+        return sum(row.get(key, 0) for row in rows)
+    
+    return {
+        'preload': preloaded,
+        'workers': worker_memory,
+        'master': master_memory,
+        'frozen_objects': master.get('frozen_objects', 0),
+        'workers_rss_kb': total('rss_kb', worker_memory),
+        'workers_pss_kb': total('pss_kb', worker_memory),
+        # Memória efetivamente usada pelo conjunto: PSS soma exatamente as páginas únicas
+        'total_pss_kb': total('pss_kb', worker_memory) + master_memory.get('pss_kb', 0)
+    }
+
+
+def memory_report(workers: int) -> Dict[str, Any]:
+    """Cada modo roda em um interpretador novo, para que um não herde as tabelas do outro"""
+    report = {}
+    for mode in ('without_preload', 'with_preload'):
+        command = [sys.executable, '-m', 'app.services.analyzer_preload',
+                   'measure', '--workers', str(workers)]
+        if mode == 'with_preload':
+            command.append('--preload')
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        report[mode] = json.loads(output)
+    return report
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"{'modo':<18}{'worker':>8}{'RSS kB':>12}{'PSS kB':>12}{'compart. kB':>14}{'privado kB':>13}")
+    for mode, result in report.items():
+        rows = [('mestre', result['master'])] + [(str(index), memory) for index, memory in enumerate(result['workers'])]
+        for name, memory in rows:
+            shared = memory.get('shared_clean_kb', 0) + memory.get('shared_dirty_kb', 0)
+            private = memory.get('private_clean_kb', 0) + memory.get('private_dirty_kb', 0)
+            print(f"{mode:<18}{name:>8}{memory.get('rss_kb', 0):>12}{memory.get('pss_kb', 0):>12}{shared:>14}{private:>13}")
+        print(f"{mode:<18}{'total':>8}{result['workers_rss_kb']:>12}{result['total_pss_kb']:>12}")
+    saved = report['without_preload']['total_pss_kb'] - report['with_preload']['total_pss_kb']
+    print(f"\n🧊 PSS total economizado com a pré-carga: {saved} kB")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Pré-carga do analisador e relatório de memória dos workers')
+    parser.add_argument('command', choices=('report', 'measure'))
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--preload', action='store_true', help='(measure) pré-carrega antes do fork')
+    parser.add_argument('--json', action='store_true', help='(report) saída em JSON')
+    args = parser.parse_args(argv)
+    
+    logging.disable(logging.INFO)
+    if args.command == 'measure':
+        print(json.dumps(measure_workers(args.workers, args.preload)))
+        return 0
+    
+    report = memory_report(args.workers)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+📊 SCORE LÉXICO VETORIZADO EM LOTE 📊
+Para jobs em massa (ex.: re-score da tabela feedbacks): os tokens de todas as
+mensagens do lote são codificados no vocabulário do PhraseScorer e achatados
+em um único vetor (as linhas da matriz esparsa mensagem x token). Os pesos do
+léxico são coletados por ocorrência, as frases e as janelas de intensificador,
+diminuidor e negação entram como ajustes esparsos nas posições afetadas, e a
+soma por mensagem é feita com bincount (na mesma ordem da passada por
+mensagem, para o normalized_score ser idêntico ao de calculate_advanced_sentiment_score).
+
+O NumPy é opcional: sem ele, o lote é pontuado mensagem a mensagem pelo PhraseScorer.
+"""
+
+import logging
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .phrase_scorer import MODIFIER_WINDOW, NEGATION_FACTOR, NEGATION_WINDOW, PhraseScorer
+
+logger = logging.getLogger(__name__)
+
+
+class BatchLexiconScorer:
+    """Tabelas do PhraseScorer em arrays NumPy (pesos, fatores de modificador, negações e códigos de frases)"""
+    
+    def __init__(self, phrase_scorer: PhraseScorer):
+        self.phrase_scorer = phrase_scorer
+        self.vectorized = np is not None
+        if not self.vectorized:
+            logger.info("📊 NumPy indisponível: score em lote usa a passada por mensagem")
+            return
+        
+        size = len(phrase_scorer._modifier_kind)
+        self._modifier_factor = np.array(phrase_scorer._modifier_factor, dtype=np.float64)
+        self._negation = np.array(phrase_scorer._negation, dtype=bool)
+        
+        # Termos por tamanho (em tokens): código inteiro do n-grama -> valor
+        terms: Dict[int, Dict[int, float]] = {}
+        for token_ids, value in self._iter_terms(phrase_scorer._trie, ()):
+            code = 0
+            for token_id in token_ids:
+                code = code * size + token_id
+            terms.setdefault(len(token_ids), {})[code] = value
+        
+        self._base = size
+        self._max_length = max(terms) if terms else 0
+        if size ** self._max_length >= 2 ** 62:
+            # Códigos não cabem em int64: frases longas demais para o vocabulário
+            logger.warning("📊 Frases do léxico longas demais para o score vetorizado: usando a passada por mensagem")
+            self.vectorized = False
+            return
+        
+        self._terms: Dict[int, Tuple] = {}
+        for length, codes in terms.items():
+            ordered = sorted(codes)
+            self._terms[length] = (np.array(ordered, dtype=np.int64),
+                                   np.array([codes[code] for code in ordered], dtype=np.float64))
+    
+    @classmethod
+    def _iter_terms(cls, children: Dict, prefix: Tuple[int, ...]):
+        for token_id, (value, grandchildren) in children.items():
+            token_ids = prefix + (token_id,)
+            if value is not None:
+                yield token_ids, value
+            yield from cls._iter_terms(grandchildren, token_ids)
+    
+    def score(self, token_lists: Sequence[Sequence[str]],
+              emoji_scores: Optional[Sequence[float]] = None) -> List[float]:
+        """
+        normalized_score de cada mensagem: (soma dos termos com modificadores + emojis) / unidades (mínimo 1),
+        em que cada frase do léxico conta como uma unidade (como no PhraseScorer)
+        token_lists são os tokens do texto preprocessado; emoji_scores, a soma dos emojis de cada mensagem
+        """
+        if emoji_scores is None:
+            emoji_scores = [0] * len(token_lists)
+        if not self.vectorized:
+            return self._score_sequential(token_lists, emoji_scores)
+        if not token_lists:
+            return []
+        
+        raw, merged = self._raw_scores(token_lists)
+        scores = []
+        for tokens, total_score, merged_tokens, emoji_score in zip(token_lists, raw.tolist(), merged.tolist(), emoji_scores):
+            total_score += emoji_score
+            scores.append(total_score / max(len(tokens) - int(merged_tokens), 1))
+        return scores
+    
+    def _score_sequential(self, token_lists: Sequence[Sequence[str]],
+                          emoji_scores: Sequence[float]) -> List[float]:
+        scores = []
+        for tokens, emoji_score in zip(token_lists, emoji_scores):
+            total_score, _, units = self.phrase_scorer.score(tokens, explain=False)
+            total_score += emoji_score
+            scores.append(total_score / max(units, 1))
+        return scores
+    
+    def _raw_scores(self, token_lists: Sequence[Sequence[str]]):
+        """Soma dos termos (com intensificadores, diminuidores e negações) e tokens absorvidos por frases, por mensagem"""
+        count = len(token_lists)
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=count)
+        get = self.phrase_scorer.vocabulary.get
+        ids = np.fromiter((get(token, 0) for token in chain.from_iterable(token_lists)),
+                          dtype=np.int64, count=int(lengths.sum()))
+        total = len(ids)
+        if not total:
+            return np.zeros(count), np.zeros(count)
+        
+        # Mensagem de cada posição e posição dentro da mensagem
+        row = np.repeat(np.arange(count), lengths)
+        starts = np.cumsum(lengths) - lengths
+        position = np.arange(total) - np.repeat(starts, lengths)
+        remaining = np.repeat(lengths, lengths) - position
+        
+        # 🔍 Termos de cada tamanho que começam em cada posição (o maior vence)
+        match_length = np.zeros(total, dtype=np.int64)
+        match_value = np.zeros(total)
+        code = np.zeros(total, dtype=np.int64)
+        for length in range(1, self._max_length + 1):
+            # code[i] = código do n-grama ids[i:i+length] (válido onde cabe na mensagem)
+            shifted = np.zeros(total, dtype=np.int64)
+            shifted[:total - length + 1] = ids[length - 1:]
+            code = code * self._base + shifted
+            if length not in self._terms:
+                continue
+            codes, values = self._terms[length]
+            index = np.minimum(np.searchsorted(codes, code), len(codes) - 1)
+            found = (codes[index] == code) & (remaining >= length)
+            match_length[found] = length
+            match_value[found] = values[index[found]]
+        
+        # 🔗 Frases consomem seus tokens: resolução gulosa só nas (poucas) frases encontradas
+        accepted = match_length > 0
+        phrase_starts = np.flatnonzero(match_length > 1)
+        if len(phrase_starts):
+            covered = np.zeros(total, dtype=bool)
+            resume = 0
+            for start, length in zip(phrase_starts.tolist(), match_length[phrase_starts].tolist()):
+                if start < resume:
+                    continue
+                resume = start + length
+                # Uma frase aceita encobre termos que começariam nas posições seguintes
+                covered[start + 1:resume] = True
+            accepted &= ~covered
+        
+        terms = np.flatnonzero(accepted)
+        final = match_value[terms]
+        term_position = position[terms]
+        
+        # Ajustes esparsos: fatores dos modificadores nas 2 posições anteriores (mesma ordem da passada)
+        factors = self._modifier_factor[ids]
+        for offset in range(MODIFIER_WINDOW, 0, -1):
+            inside = term_position >= offset
+            final = final * np.where(inside, factors[np.maximum(terms - offset, 0)], 1.0)
+        
+        # Negação em qualquer das 3 posições anteriores inverte o termo uma única vez
+        negations = self._negation[ids]
+        negated = np.zeros(len(terms), dtype=bool)
+        for offset in range(1, NEGATION_WINDOW + 1):
+            negated |= (term_position >= offset) & negations[np.maximum(terms - offset, 0)]
+        final = np.where(negated, final * NEGATION_FACTOR, final)
+        
+        merged = np.bincount(row[terms], weights=match_length[terms] - 1, minlength=count)
+        return np.bincount(row[terms], weights=final, minlength=count), merged
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+💾 PERSISTÊNCIA DA MEMÓRIA CONVERSACIONAL NO POSTGRESQL 💾
+Backend de escrita adiada (write-behind) do ConversationContextStore: o store
+marca os contextos alterados e grava periodicamente, todos de uma vez, com um
+único upsert de várias linhas, apenas o incremento de cada um (interações e
+contadores desde o último flush). A leitura é preguiçosa: o contexto de um
+usuário é buscado no banco no primeiro acesso do processo e, depois, relido em
+lote (um SELECT para vários usuários) pela thread de flush, então a análise
+nunca espera por uma gravação nem por uma releitura.
+
+Vários processos (workers do gunicorn, pool do analisador) podem atender o
+mesmo usuário: o upsert acrescenta as interações ao histórico gravado (mantendo
+as history_size mais recentes) e soma os contadores do perfil de sentimento,
+em vez de substituí-los, então nenhum processo apaga o que outro gravou.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from psycopg2.extras import execute_values
+except ImportError:
+    execute_values = None
+
+try:
+    from database_config import get_db_connection
+except ImportError:
+    get_db_connection = None
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS sentiment_conversation_contexts (
+    user_id VARCHAR(100) PRIMARY KEY,
+    history JSON NOT NULL,
+    sentiment_profile JSON NOT NULL,
+    session_start TIMESTAMP,
+    last_interaction TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+LOAD_SQL = """
+SELECT history, sentiment_profile, session_start, last_interaction
+FROM sentiment_conversation_contexts WHERE user_id = %s
+"""
+
+# Releitura em lote dos contextos residentes (refresh da thread de flush)
+LOAD_MANY_SQL = """
+SELECT user_id, history, sentiment_profile, session_start, last_interaction
+FROM sentiment_conversation_contexts WHERE user_id = ANY(%s)
+"""
+
+# Novas interações entram depois de todas as gravadas (ordinalidade deslocada)
+_APPEND_OFFSET = 1000000
+
+
+@lru_cache(maxsize=8)
+def _upsert_sql(history_size: int) -> str:
+    """Upsert que acrescenta o incremento ao histórico gravado (últimas history_size) e soma os contadores"""
+    return f"""
+INSERT INTO sentiment_conversation_contexts AS stored
+    (user_id, history, sentiment_profile, session_start, last_interaction, updated_at)
+VALUES %s
+ON CONFLICT (user_id) DO UPDATE SET
+    history = (
+        SELECT COALESCE(json_agg(kept.entry ORDER BY kept.ord), json_build_array())
+        FROM (
+            SELECT entry, ord FROM (
+                SELECT entry, ord FROM json_array_elements(stored.history) WITH ORDINALITY AS saved_entries(entry, ord)
+                UNION ALL
+                SELECT entry, ord + {_APPEND_OFFSET} FROM json_array_elements(EXCLUDED.history) WITH ORDINALITY AS new_entries(entry, ord)
+            ) merged
+            ORDER BY ord DESC
+            LIMIT {int(history_size)}
+        ) kept
+    ),
+    sentiment_profile = (
+        SELECT COALESCE(json_object_agg(totals.key, totals.total), json_build_object())
+        FROM (
+            SELECT key, SUM(value::text::integer) AS total FROM (
+                SELECT key, value FROM json_each(stored.sentiment_profile)
+                UNION ALL
+                SELECT key, value FROM json_each(EXCLUDED.sentiment_profile)
+            ) counters
+            GROUP BY key
+        ) totals
+    ),
+    session_start = LEAST(stored.session_start, EXCLUDED.session_start),
+    last_interaction = GREATEST(stored.last_interaction, EXCLUDED.last_interaction),
+    updated_at = EXCLUDED.updated_at
+"""
+
+UPSERT_TEMPLATE = '(%s, %s::json, %s::json, %s, %s, CURRENT_TIMESTAMP)'
+
+# Fotografia de um contexto: (user_id, histórico, perfil de sentimento, início da sessão, última interação);
+# na gravação, histórico e perfil são só o incremento desde o último flush
+ContextSnapshot = Tuple[str, List[Dict[str, Any]], Dict[str, int], Optional[datetime], Optional[datetime]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _restore_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Item do histórico lido do banco, com o timestamp de volta a datetime"""
+    timestamp = entry.get('timestamp')
+    if isinstance(timestamp, str):
+        try:
+            entry['timestamp'] = datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+    return entry
+
+
+def _snapshot_from_row(user_id: str, row: Sequence[Any]) -> ContextSnapshot:
+    history, profile, session_start, last_interaction = row
+    # Colunas JSON chegam decodificadas pelo psycopg2; texto é aceito por segurança
+    if isinstance(history, str):
+        history = json.loads(history)
+    if isinstance(profile, str):
+        profile = json.loads(profile)
+    return (user_id, [_restore_entry(entry) for entry in history or []],
+            dict(profile or {}), session_start, last_interaction)
+
+
+class ContextPersistence:
+    """Leitura por usuário e upsert em lote da tabela sentiment_conversation_contexts"""
+    
+    def __init__(self, connection_factory: Optional[Callable] = None, retry_seconds: float = 30.0):
+        self.connection_factory = connection_factory or get_db_connection
+        self.retry_seconds = retry_seconds
+        self._connection = None
+        self._connection_pid: Optional[int] = None
+        self._lock = threading.Lock()
+        # Após uma falha de conexão o banco não é tentado até este instante (sem custo no caminho da análise)
+        self._retry_at = 0.0
+        
+        # Métricas
+        self.loads = 0
+        self.loaded = 0
+        self.load_errors = 0
+        self.flushes = 0
+        self.saved = 0
+        self.flush_errors = 0
+        self.last_flush_ms = 0.0
+        self.last_error: Optional[str] = None
+    
+    @property
+    def available(self) -> bool:
+        return self.connection_factory is not None and execute_values is not None
+    
+    def _get_connection(self):
+        """Conexão própria do processo (recriada após fork ou erro), com a tabela garantida"""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+        if time.monotonic() < self._retry_at:
+            return None
+        try:
+            connection = self.connection_factory()
+            if connection is None:
+                raise ConnectionError('conexão indisponível')
+            with connection.cursor() as cursor:
+                cursor.execute(CONTEXT_TABLE_SQL)
+            connection.commit()
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.retry_seconds
+            self.last_error = str(e)
+            logger.warning(f"⚠️ Persistência de contextos indisponível (nova tentativa em {self.retry_seconds:.0f}s): {e}")
+            return None
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+    
+    def _discard_connection(self, error: Exception):
+        self.last_error = str(error)
+        connection, self._connection = self._connection, None
+        if connection is not None and self._connection_pid == os.getpid():
+            try:
+                connection.close()
+            except Exception:
+                pass
+    
+    def load(self, user_id: str) -> Tuple[bool, Optional[ContextSnapshot]]:
+        """
+        (consultou o banco, fotografia gravada do usuário ou None)
+        Sem banco ou com erro retorna (False, None): o usuário não deve ser marcado como ausente
+        """
+        if not self.available:
+            return False, None
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return False, None
+            self.loads += 1
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(LOAD_SQL, (user_id,))
+                    row = cursor.fetchone()
+                connection.commit()
+            except Exception as e:
+                self.load_errors += 1
+                self._discard_connection(e)
+                logger.error(f"❌ Erro ao carregar contexto de {user_id}: {e}")
+                return False, None
+        
+        if row is None:
+            return True, None
+        if isinstance(row, dict):
+            row = (row['history'], row['sentiment_profile'], row['session_start'], row['last_interaction'])
+        self.loaded += 1
+        return True, _snapshot_from_row(user_id, row)
+    
+    def load_many(self, user_ids: Sequence[str]) -> Tuple[bool, Dict[str, ContextSnapshot]]:
+        """
+        (consultou o banco, {user_id: fotografia}) para vários usuários num único SELECT
+        Usuários sem contexto gravado ficam fora do dicionário; sem banco ou com erro retorna (False, {})
+        """
+        if not user_ids or not self.available:
+            return False, {}
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return False, {}
+            self.loads += 1
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(LOAD_MANY_SQL, (list(user_ids),))
+                    rows = cursor.fetchall()
+                connection.commit()
+            except Exception as e:
+                self.load_errors += 1
+                self._discard_connection(e)
+                logger.error(f"❌ Erro ao reler {len(user_ids)} contextos: {e}")
+                return False, {}
+        
+        snapshots = {}
+        for row in rows:
+            if isinstance(row, dict):
+                row = (row['user_id'], row['history'], row['sentiment_profile'], row['session_start'], row['last_interaction'])
+            snapshots[row[0]] = _snapshot_from_row(row[0], row[1:])
+        self.loaded += len(snapshots)
+        return True, snapshots
+    
+    def save(self, snapshots: Sequence[ContextSnapshot], history_size: int = 50) -> bool:
+        """Grava os incrementos com um único upsert de várias linhas, mesclando com o gravado (False se não gravou)"""
+        if not snapshots:
+            return True
+        if not self.available:
+            return False
+        started = time.perf_counter()
+        values = [(user_id,
+                   json.dumps(history, ensure_ascii=False, default=_json_default),
+                   json.dumps(profile, ensure_ascii=False),
+                   session_start, last_interaction)
+                  for user_id, history, profile, session_start, last_interaction in snapshots]
+        
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                self.flush_errors += 1
+                return False
+            try:
+                with connection.cursor() as cursor:
+                    execute_values(cursor, _upsert_sql(history_size), values, template=UPSERT_TEMPLATE, page_size=len(values))
+                connection.commit()
+            except Exception as e:
+                self.flush_errors += 1
+                try:
+                    connection.rollback()
+                except Exception:
+                    pass
+                self._discard_connection(e)
+                logger.error(f"❌ Erro ao gravar {len(values)} contextos conversacionais: {e}")
+                return False
+        
+        self.flushes += 1
+        self.saved += len(values)
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        return True
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                try:
+                    self._connection.close()
+                except Exception:
+                    pass
+            self._connection = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'available': self.available,
+            'connected': self._connection is not None and self._connection_pid == os.getpid(),
+            'loads': self.loads,
+            'loaded': self.loaded,
+            'load_errors': self.load_errors,
+            'flushes': self.flushes,
+            'saved': self.saved,
+            'flush_errors': self.flush_errors,
+            'last_flush_ms': round(self.last_flush_ms, 3),
+            'last_error': self.last_error
+        }
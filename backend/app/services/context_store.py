@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+🧠 MEMÓRIA CONVERSACIONAL LIMITADA 🧠
+Armazena o contexto conversacional por usuário com política LRU, expiração por
+inatividade (TTL) e orçamento de memória em bytes
+
+Com um backend de persistência (ContextPersistence) as interações novas são
+gravadas em segundo plano a cada flush_seconds (write-behind) e mescladas no
+banco com as dos outros processos. O contexto de um usuário ausente da memória
+é carregado do banco no primeiro acesso; depois disso a análise sempre usa a
+cópia em memória e a mesma thread do flush relê, a cada refresh_seconds e com um
+único SELECT por bloco, os contextos residentes e os usuários recentes ainda sem
+contexto gravado, para que processos diferentes atendendo o mesmo usuário vejam
+o histórico uns dos outros sem uma ida ao banco por análise
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Custo fixo aproximado de um contexto vazio (objeto, deque e dict de perfil)
+_CONTEXT_OVERHEAD = 1024
+
+# Usuários por SELECT no refresh em lote
+REFRESH_BATCH = 500
+
+
+def _entry_size(entry: Dict[str, Any]) -> int:
+    """Tamanho aproximado de um item do histórico (determinístico, para descontar na saída do deque)"""
+    size = sys.getsizeof(entry)
+    for value in entry.values():
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(sys.getsizeof(key) + sys.getsizeof(item) for key, item in value.items())
+    return size
+
+
+class CompactConversationContext:
+    """Contexto conversacional compacto: apenas os campos usados pelo analisador"""
+    
+    __slots__ = ('user_id', 'conversation_history', 'user_sentiment_profile',
+                 'last_interaction', 'session_start', 'last_seen', 'size_bytes',
+                 'pending_history', 'pending_profile', 'loaded_at')
+    
+    def __init__(self, user_id: str, history_size: int = 50):
+        self.user_id = user_id
+        self.conversation_history = deque(maxlen=history_size)
+        self.user_sentiment_profile: Dict[str, int] = {}
+        self.last_interaction: Optional[datetime] = None
+        self.session_start = datetime.now()
+        self.last_seen = time.monotonic()
+        self.size_bytes = _CONTEXT_OVERHEAD
+        # Persistência: interações e contadores ainda não gravados (o flush envia só o incremento)
+        self.pending_history: List[Dict[str, Any]] = []
+        self.pending_profile: Dict[str, int] = {}
+        # Instante (monotonic) da última leitura do banco
+        self.loaded_at = self.last_seen
+
+
+class ConversationContextStore:
+    """
+    Contextos por usuário com limite de quantidade, TTL de inatividade e orçamento de bytes
+    A ordem LRU coincide com a ordem de inatividade, então a expiração varre apenas o início da fila
+    
+    Persistência (opcional): record_interaction só marca o contexto como sujo; uma thread grava as
+    interações novas dos sujos a cada flush_seconds (o banco as acrescenta ao histórico e soma os
+    contadores). Contextos removidos da memória antes do flush continuam referenciados entre os sujos,
+    então nada se perde na expulsão (e um retorno do usuário reaproveita o objeto). get() só consulta o
+    banco na primeira carga de um usuário; a releitura dos residentes e dos ausentes recentes é feita em
+    lote pela thread de flush (refresh)
+    """
+    
+    def __init__(self, max_contexts: int, idle_ttl_seconds: float, max_bytes: int, history_size: int = 50,
+                 persistence=None, flush_seconds: float = 5.0, refresh_seconds: float = 30.0):
+        self.max_contexts = max_contexts
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_bytes = max_bytes
+        self.history_size = history_size
+        self._contexts: 'OrderedDict[str, CompactConversationContext]' = OrderedDict()
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.created = 0
+        self.evicted_lru = 0
+        self.evicted_idle = 0
+        self.evicted_memory = 0
+        
+        # 💾 Write-behind
+        self.persistence = persistence if persistence is not None and persistence.available else None
+        self.flush_seconds = flush_seconds
+        self.refresh_seconds = refresh_seconds
+        self._dirty: Dict[str, CompactConversationContext] = {}
+        self._flushing: Dict[str, CompactConversationContext] = {}
+        # Usuários sem contexto gravado (limitado como o store) -> último acesso; get() não volta ao
+        # banco por eles, o refresh em lote os reconsulta enquanto forem acessados dentro do TTL
+        self._missing: 'OrderedDict[str, float]' = OrderedDict()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher_pid: Optional[int] = None
+        self._next_refresh = 0.0
+        self.restored = 0
+        self.refreshed = 0
+        self.refreshes = 0
+    
+    def __len__(self) -> int:
+        return len(self._contexts)
+    
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._contexts
+    
+    def items(self) -> List[Tuple[str, CompactConversationContext]]:
+        """Cópia dos pares (usuário, contexto), do menos ao mais recente"""
+        with self._lock:
+            return list(self._contexts.items())
+    
+    def get(self, user_id: str) -> Optional[CompactConversationContext]:
+        """
+        Contexto do usuário (renovando sua posição LRU) ou None se ausente/expirado
+        Só a primeira carga do usuário no processo consulta o banco; depois vale a cópia em memória
+        """
+        with self._lock:
+            context, needs_load = self._lookup(user_id)
+        if not needs_load:
+            return context
+        return self._load(user_id)
+    
+    def _lookup(self, user_id: str) -> Tuple[Optional[CompactConversationContext], bool]:
+        """(contexto em memória, se é a primeira carga e é preciso consultar o banco) — nunca acessa o banco"""
+        self.evict_idle()
+        context = self._contexts.get(user_id)
+        if context is not None:
+            self._contexts.move_to_end(user_id)
+            context.last_seen = time.monotonic()
+            return context, False
+        if self.persistence is None:
+            return None, False
+        # Removido da memória mas ainda não gravado: o objeto sujo é a versão mais nova
+        context = self._dirty.get(user_id) or self._flushing.get(user_id)
+        if context is not None:
+            context.last_seen = time.monotonic()
+            self._insert(context)
+            return context, False
+        if user_id in self._missing:
+            self._missing[user_id] = time.monotonic()
+            self._missing.move_to_end(user_id)
+            return None, False
+        return None, True
+    
+    def _load(self, user_id: str) -> Optional[CompactConversationContext]:
+        """Primeiro acesso do usuário no processo: busca o contexto gravado (fora do lock do store)"""
+        queried, snapshot = self.persistence.load(user_id)
+        with self._lock:
+            if self._flusher_pid != os.getpid():
+                # O refresh em lote roda na thread de flush: precisa dela mesmo sem gravações
+                self._start_flusher()
+            # Outra thread pode ter criado ou carregado o contexto durante a consulta
+            context = self._contexts.get(user_id)
+            if context is not None:
+                return context
+            if snapshot is None:
+                if queried:
+                    self._mark_missing(user_id)
+                return None
+            context = self._restore(snapshot)
+            self._insert(context)
+            self.restored += 1
+            return context
+    
+    def _mark_missing(self, user_id: str):
+        self._missing[user_id] = time.monotonic()
+        self._missing.move_to_end(user_id)
+        while len(self._missing) > self.max_contexts:
+            self._missing.popitem(last=False)
+    
+    def refresh(self) -> int:
+        """
+        Relê em lote (um SELECT por bloco) os contextos residentes carregados há mais de refresh_seconds
+        e os usuários ausentes acessados dentro do TTL, reaplicando as interações deste processo ainda
+        não gravadas. Roda na thread de flush, fora do caminho da análise; retorna os contextos atualizados
+        """
+        if self.persistence is None:
+            return 0
+        with self._flush_lock:
+            now = time.monotonic()
+            with self._lock:
+                deadline = now - self.refresh_seconds
+                stale = [user_id for user_id, context in self._contexts.items() if context.loaded_at <= deadline]
+                # Ausentes sem acesso dentro do TTL deixam de ser acompanhados
+                if self.idle_ttl_seconds:
+                    idle_deadline = now - self.idle_ttl_seconds
+                    while self._missing and next(iter(self._missing.values())) <= idle_deadline:
+                        self._missing.popitem(last=False)
+                missing = list(self._missing)
+            user_ids = stale + missing
+            if not user_ids:
+                return 0
+            
+            self.refreshes += 1
+            updated = 0
+            for start in range(0, len(user_ids), REFRESH_BATCH):
+                chunk = user_ids[start:start + REFRESH_BATCH]
+                queried, snapshots = self.persistence.load_many(chunk)
+                if not queried:
+                    # Banco indisponível: as cópias em memória continuam valendo até o próximo ciclo
+                    break
+                with self._lock:
+                    for user_id in chunk:
+                        updated += self._apply_refresh(user_id, snapshots.get(user_id))
+            self.refreshed += updated
+            return updated
+    
+    def _apply_refresh(self, user_id: str, snapshot) -> int:
+        """Aplica a fotografia relida de um usuário (chamado com o lock do store)"""
+        context = self._contexts.get(user_id)
+        if context is None:
+            if snapshot is None or user_id not in self._missing:
+                return 0
+            # Outro processo gravou o contexto de um usuário que aqui ainda não tinha nenhum
+            del self._missing[user_id]
+            context = self._restore(snapshot)
+            context.last_seen = time.monotonic()
+            self._insert(context)
+            return 1
+        if snapshot is None:
+            # Ainda não gravado (só interações pendentes deste processo)
+            context.loaded_at = time.monotonic()
+            return 0
+        _, history, profile, session_start, last_interaction = snapshot
+        previous_bytes = context.size_bytes
+        self._apply_snapshot(context, history + context.pending_history, profile, session_start, last_interaction)
+        for sentiment_class, count in context.pending_profile.items():
+            context.user_sentiment_profile[sentiment_class] = context.user_sentiment_profile.get(sentiment_class, 0) + count
+        self.current_bytes += context.size_bytes - previous_bytes
+        return 1
+    
+    def _restore(self, snapshot) -> CompactConversationContext:
+        user_id, history, profile, session_start, last_interaction = snapshot
+        context = CompactConversationContext(user_id, self.history_size)
+        self._apply_snapshot(context, history, profile, session_start, last_interaction)
+        return context
+    
+    @staticmethod
+    def _apply_snapshot(context: CompactConversationContext, history: List[Dict[str, Any]], profile: Dict[str, int],
+                        session_start: Optional[datetime], last_interaction: Optional[datetime]):
+        context.conversation_history.clear()
+        context.conversation_history.extend(history)
+        context.user_sentiment_profile = dict(profile)
+        context.session_start = min(filter(None, (session_start, context.session_start)))
+        context.last_interaction = max(filter(None, (last_interaction, context.last_interaction)), default=None)
+        context.size_bytes = (_CONTEXT_OVERHEAD + sum(_entry_size(entry) for entry in context.conversation_history)
+                              + 64 * len(context.user_sentiment_profile))
+        context.loaded_at = time.monotonic()
+    
+    def _insert(self, context: CompactConversationContext):
+        self._contexts[context.user_id] = context
+        self.current_bytes += context.size_bytes
+        self._enforce_limits(keep=context.user_id)
+    
+    def get_or_create(self, user_id: str) -> CompactConversationContext:
+        if self.persistence is not None and user_id not in self._contexts:
+            # Carga preguiçosa fora do lock do store
+            self.get(user_id)
+        with self._lock:
+            context, _ = self._lookup(user_id)
+            if context is None:
+                context = CompactConversationContext(user_id, self.history_size)
+                self._missing.pop(user_id, None)
+                self._contexts[user_id] = context
+                self.current_bytes += context.size_bytes
+                self.created += 1
+                self._enforce_limits(keep=user_id)
+            return context
+    
+    def record_interaction(self, user_id: str, entry: Dict[str, Any], sentiment_class: str) -> CompactConversationContext:
+        """Acrescenta uma interação ao histórico do usuário e atualiza seu perfil de sentimento"""
+        if self.persistence is not None and user_id not in self._contexts:
+            self.get(user_id)
+        with self._lock:
+            context = self.get_or_create(user_id)
+            history = context.conversation_history
+            
+            delta = _entry_size(entry)
+            if len(history) == history.maxlen:
+                delta -= _entry_size(history[0])
+            history.append(entry)
+            
+            context.last_interaction = datetime.now()
+            if sentiment_class not in context.user_sentiment_profile:
+                context.user_sentiment_profile[sentiment_class] = 0
+                delta += 64
+            context.user_sentiment_profile[sentiment_class] += 1
+            
+            context.size_bytes += delta
+            self.current_bytes += delta
+            self._enforce_limits(keep=user_id)
+            
+            if self.persistence is not None:
+                context.pending_history.append(entry)
+                context.pending_profile[sentiment_class] = context.pending_profile.get(sentiment_class, 0) + 1
+                self._dirty[user_id] = context
+                if self._flusher_pid != os.getpid():
+                    self._start_flusher()
+            return context
+    
+    def evict_idle(self) -> int:
+        """Remove contextos inativos há mais que o TTL (a partir do menos recente)"""
+        if not self.idle_ttl_seconds:
+            return 0
+        with self._lock:
+            deadline = time.monotonic() - self.idle_ttl_seconds
+            removed = 0
+            while self._contexts:
+                user_id, context = next(iter(self._contexts.items()))
+                if context.last_seen > deadline:
+                    break
+                self._remove(user_id)
+                removed += 1
+            self.evicted_idle += removed
+            return removed
+    
+    def _enforce_limits(self, keep: Optional[str] = None):
+        while len(self._contexts) > self.max_contexts:
+            self._evict_oldest(keep)
+            self.evicted_lru += 1
+        while self.current_bytes > self.max_bytes and len(self._contexts) > 1:
+            self._evict_oldest(keep)
+            self.evicted_memory += 1
+    
+    def _evict_oldest(self, keep: Optional[str]):
+        user_id = next(iter(self._contexts))
+        if user_id == keep:
+            self._contexts.move_to_end(user_id)
+            user_id = next(iter(self._contexts))
+        self._remove(user_id)
+    
+    def _remove(self, user_id: str):
+        context = self._contexts.pop(user_id)
+        self.current_bytes -= context.size_bytes
+    
+    def clear(self):
+        with self._lock:
+            self._contexts.clear()
+            self._missing.clear()
+            self.current_bytes = 0
+    
+    # ===== 💾 WRITE-BEHIND =====
+    
+    def _start_flusher(self):
+        """Thread de flush do processo atual (threads não sobrevivem ao fork dos processos do pool)"""
+        self._flusher_pid = os.getpid()
+        self._stop = threading.Event()
+        threading.Thread(target=self._flush_loop, args=(self._stop,), name='context-flush', daemon=True).start()
+    
+    def _flush_loop(self, stop: threading.Event):
+        while not stop.wait(self.flush_seconds):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"❌ Erro no flush dos contextos conversacionais: {e}")
+            if time.monotonic() < self._next_refresh:
+                continue
+            self._next_refresh = time.monotonic() + self.refresh_seconds
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Erro ao reler os contextos conversacionais: {e}")
+    
+    def flush(self) -> int:
+        """
+        Grava as interações novas dos contextos sujos em um único upsert (o banco as acrescenta ao
+        histórico e soma os contadores); em caso de falha elas voltam a ficar pendentes
+        """
+        if self.persistence is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return 0
+                batch, self._dirty = self._dirty, {}
+                self._flushing = batch
+                # Incrementos retirados sob o lock: o contexto continua recebendo interações durante a gravação
+                snapshots = []
+                for user_id, context in batch.items():
+                    snapshots.append((user_id, context.pending_history[-self.history_size:], context.pending_profile,
+                                      context.session_start, context.last_interaction))
+                    context.pending_history, context.pending_profile = [], {}
+            
+            saved = self.persistence.save(snapshots, self.history_size)
+            
+            with self._lock:
+                self._flushing = {}
+                if not saved:
+                    for (user_id, history, profile, _, _), context in zip(snapshots, batch.values()):
+                        context.pending_history[:0] = history
+                        for sentiment_class, count in profile.items():
+                            context.pending_profile[sentiment_class] = context.pending_profile.get(sentiment_class, 0) + count
+                        self._dirty.setdefault(user_id, context)
+                    return 0
+            return len(snapshots)
+    
+    def close(self):
+        """Encerra a thread de flush e grava os contextos pendentes (chamar no shutdown)"""
+        self._stop.set()
+        self._flusher_pid = None
+        flushed = self.flush()
+        if flushed:
+            logger.info(f"💾 {flushed} contextos conversacionais gravados no encerramento")
+        if self.persistence is not None:
+            self.persistence.close()
+        return flushed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'active_contexts': len(self._contexts),
+            'max_contexts': self.max_contexts,
+            'estimated_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'idle_ttl_seconds': self.idle_ttl_seconds,
+            'history_size': self.history_size,
+            'created': self.created,
+            'evicted_lru': self.evicted_lru,
+            'evicted_idle': self.evicted_idle,
+            'evicted_memory': self.evicted_memory,
+            'persistence': {
+                'enabled': True,
+                'flush_seconds': self.flush_seconds,
+                'dirty': len(self._dirty),
+                'refresh_seconds': self.refresh_seconds,
+                'known_missing': len(self._missing),
+                'restored': self.restored,
+                'refreshes': self.refreshes,
+                'refreshed': self.refreshed,
+                **self.persistence.get_stats()
+            } if self.persistence is not None else {'enabled': False}
+        }
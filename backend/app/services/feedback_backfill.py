@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+🔁 BACKFILL DE SENTIMENTO DA TABELA FEEDBACKS 🔁
+As mensagens gravadas pelo WAHA entram em feedbacks com o placeholder
+sentiment='neutral', score=0.5. Este job percorre a tabela com um cursor do
+lado do servidor (em blocos, sem carregar tudo na memória), analisa cada bloco
+em lote, grava os resultados com um UPDATE em massa e registra o último id
+processado na mesma transação. Interrompido, continua de onde parou:
+    
+    python -m app.services.feedback_backfill --chunk-size 500
+    python -m app.services.feedback_backfill --all --restart      # re-score de toda a tabela
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from psycopg2.extras import execute_values
+except ImportError:
+    execute_values = None
+
+try:
+    from database_config import get_db_connection
+except ImportError:
+    get_db_connection = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_NAME = 'feedbacks_sentiment'
+DEFAULT_CHUNK_SIZE = 500
+
+# Campos da análise usados na gravação (dispensam as fases profundas)
+BACKFILL_FIELDS = ('sentiment_class', 'confidence')
+
+# Linhas ainda com o placeholder de WahaService._save_message_as_feedback
+PLACEHOLDER_FILTER = "sentiment = 'neutral' AND score = 0.5"
+
+CHECKPOINT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS sentiment_backfill_checkpoints (
+    job_name VARCHAR(50) PRIMARY KEY,
+    last_id INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+UPDATE_SQL = """
+UPDATE feedbacks AS f SET
+    sentiment = v.sentiment,
+    score = v.score,
+    keywords = v.keywords::json,
+    analyzed_at = v.analyzed_at
+FROM (VALUES %s) AS v(id, sentiment, score, keywords, analyzed_at)
+WHERE f.id = v.id
+"""
+
+UPDATE_TEMPLATE = '(%s, %s, %s::numeric, %s, %s::timestamp)'
+
+CHECKPOINT_SQL = """
+INSERT INTO sentiment_backfill_checkpoints (job_name, last_id, processed, updated_at)
+VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+ON CONFLICT (job_name) DO UPDATE SET
+    last_id = EXCLUDED.last_id,
+    processed = EXCLUDED.processed,
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+class FeedbackBackfill:
+    """Job retomável: cursor do servidor em blocos -> análise em lote -> UPDATE em massa + checkpoint"""
+    
+    def __init__(self, connection_factory: Optional[Callable] = None, analyzer=None,
+                 job_name: str = DEFAULT_JOB_NAME, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 profile: Optional[str] = None, only_placeholders: bool = True):
+        if analyzer is None:
+            from .sentiment_analyzer import sentiment_analyzer as analyzer
+        self.connection_factory = connection_factory or get_db_connection
+        self.analyzer = analyzer
+        self.job_name = job_name
+        self.chunk_size = max(1, chunk_size)
+        self.profile = profile or analyzer.ingest_profile
+        self.only_placeholders = only_placeholders
+    
+    def _where(self) -> str:
+        return f"id > %s AND {PLACEHOLDER_FILTER}" if self.only_placeholders else "id > %s"
+    
+    def load_checkpoint(self, connection) -> Tuple[int, int]:
+        """(último id, linhas processadas) gravados pela execução anterior do job"""
+        with connection.cursor() as cursor:
+            cursor.execute(CHECKPOINT_TABLE_SQL)
+            cursor.execute("SELECT last_id, processed FROM sentiment_backfill_checkpoints WHERE job_name = %s",
+                           (self.job_name,))
+            row = cursor.fetchone()
+        connection.commit()
+        return (row[0], row[1]) if row else (0, 0)
+    
+    def reset_checkpoint(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(CHECKPOINT_TABLE_SQL)
+            cursor.execute("DELETE FROM sentiment_backfill_checkpoints WHERE job_name = %s", (self.job_name,))
+        connection.commit()
+    
+    def analyze_rows(self, rows: Sequence[Tuple[int, Optional[str]]]) -> List[Tuple]:
+        """Linhas (id, text) -> valores do UPDATE (id, sentiment, score, keywords, analyzed_at)"""
+        results = self.analyzer.analyze_batch([text or '' for _, text in rows], self.profile, BACKFILL_FIELDS)
+        analyzed_at = datetime.now().isoformat()
+        values = []
+        for (feedback_id, _), (sentiment_class, _, keywords, details) in zip(rows, results):
+            values.append((
+                feedback_id,
+                self.analyzer._to_simple_sentiment(sentiment_class),
+                round(details.get('confidence', 0.0), 4),
+                json.dumps(keywords, ensure_ascii=False),
+                analyzed_at
+            ))
+        return values
+    
+    def run(self, limit: Optional[int] = None, restart: bool = False) -> Dict[str, Any]:
+        """Executa (ou retoma) o backfill; limit restringe o número de linhas desta execução"""
+        if self.connection_factory is None or execute_values is None:
+            logger.error("❌ Backfill indisponível: psycopg2/database_config não encontrados")
+            return {'success': False, 'error': 'Banco de dados indisponível'}
+        
+        read_connection = self.connection_factory()
+        write_connection = self.connection_factory()
+        stats = {'success': True, 'job_name': self.job_name, 'processed': 0, 'interrupted': False}
+        started = time.perf_counter()
+        
+        try:
+            if restart:
+                self.reset_checkpoint(write_connection)
+            last_id, processed_before = self.load_checkpoint(write_connection)
+            stats['resumed_from_id'] = last_id
+            
+            with write_connection.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM feedbacks WHERE {self._where()}", (last_id,))
+                pending = cursor.fetchone()[0]
+            write_connection.commit()
+            total = min(pending, limit) if limit else pending
+            stats['pending'] = pending
+            logger.info(f"🔁 Backfill '{self.job_name}': {total} linhas a processar a partir do id {last_id} "
+                        f"(perfil {self.profile}, blocos de {self.chunk_size})")
+            
+            # Cursor nomeado = cursor do lado do servidor: as linhas chegam em blocos de itersize
+            stream = read_connection.cursor(name=f'{self.job_name}_stream')
+            stream.itersize = self.chunk_size
+            stream.execute(f"SELECT id, text FROM feedbacks WHERE {self._where()} ORDER BY id", (last_id,))
+            
+            processed = 0
+            while not limit or processed < limit:
+                size = min(self.chunk_size, limit - processed) if limit else self.chunk_size
+                rows = stream.fetchmany(size)
+                if not rows:
+                    break
+                
+                values = self.analyze_rows(rows)
+                last_id = rows[-1][0]
+                processed += len(rows)
+                
+                # Resultados e checkpoint na mesma transação: nunca há bloco gravado sem checkpoint
+                with write_connection.cursor() as cursor:
+                    execute_values(cursor, UPDATE_SQL, values, template=UPDATE_TEMPLATE, page_size=len(values))
+                    cursor.execute(CHECKPOINT_SQL, (self.job_name, last_id, processed_before + processed))
+                write_connection.commit()
+                
+                stats['processed'] = processed
+                stats['last_id'] = last_id
+                self._log_progress(processed, total, started, last_id)
+            
+            stream.close()
+        
+        except KeyboardInterrupt:
+            write_connection.rollback()
+            stats['interrupted'] = True
+            logger.warning(f"⏸️ Backfill interrompido: retomará a partir do id {stats.get('last_id', last_id)}")
+        except Exception as e:
+            write_connection.rollback()
+            logger.error(f"❌ Erro no backfill '{self.job_name}': {e}")
+            stats.update({'success': False, 'error': str(e)})
+        finally:
+            read_connection.close()
+            write_connection.close()
+        
+        elapsed = time.perf_counter() - started
+        stats['elapsed_seconds'] = round(elapsed, 2)
+        stats['rows_per_second'] = round(stats['processed'] / elapsed, 1) if elapsed > 0 else 0.0
+        logger.info(f"✅ Backfill '{self.job_name}': {stats['processed']} linhas em {elapsed:.1f}s "
+                    f"({stats['rows_per_second']} linhas/s)")
+        return stats
+    
+    @staticmethod
+    def _log_progress(processed: int, total: int, started: float, last_id: int):
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        remaining = max(total - processed, 0)
+        eta = remaining / rate if rate > 0 else 0.0
+        percent = processed / total * 100 if total else 100.0
+        logger.info(f"🔁 {processed}/{total} ({percent:.1f}%) | {rate:.0f} linhas/s | "
+                    f"ETA {eta:.0f}s | último id {last_id}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Backfill de sentimento da tabela feedbacks')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--limit', type=int, help='máximo de linhas nesta execução')
+    parser.add_argument('--profile', help='perfil de análise (padrão: perfil de ingestão)')
+    parser.add_argument('--job', default=DEFAULT_JOB_NAME, help='nome do job (chave do checkpoint)')
+    parser.add_argument('--all', action='store_true', help='re-analisa todas as linhas, não só os placeholders')
+    parser.add_argument('--restart', action='store_true', help='descarta o checkpoint e começa do início')
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    # O log por lote do analisador repetiria o progresso do job
+    logging.getLogger('app.services.sentiment_analyzer').setLevel(logging.WARNING)
+    
+    backfill = FeedbackBackfill(job_name=args.job, chunk_size=args.chunk_size, profile=args.profile,
+                                only_placeholders=not args.all)
+    stats = backfill.run(limit=args.limit, restart=args.restart)
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    return 0 if stats.get('success') else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
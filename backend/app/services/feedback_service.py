@@ -11,6 +11,22 @@ from .sentiment_analyzer import sentiment_analyzer
 
 logger = logging.getLogger(__name__)
 
+UPSERT_FEEDBACK_QUERY = """
+INSERT INTO feedbacks (
+    feedback_id, contact_name, contact_phone, text, 
+    sentiment, score, keywords, timestamp, analyzed_at
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON CONFLICT (feedback_id) DO UPDATE SET
+    contact_name = EXCLUDED.contact_name,
+    contact_phone = EXCLUDED.contact_phone,
+    text = EXCLUDED.text,
+    sentiment = EXCLUDED.sentiment,
+    score = EXCLUDED.score,
+    keywords = EXCLUDED.keywords,
+    timestamp = EXCLUDED.timestamp,
+    analyzed_at = EXCLUDED.analyzed_at
+"""
+
 class FeedbackService:
     def __init__(self, db_manager=None):
         self.db_manager = db_manager
@@ -57,35 +73,7 @@ class FeedbackService:
             # Garante que a tabela existe
             self.create_feedback_table()
             
-            query = """
-            INSERT INTO feedbacks (
-                feedback_id, contact_name, contact_phone, text, 
-                sentiment, score, keywords, timestamp, analyzed_at
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (feedback_id) DO UPDATE SET
-                contact_name = EXCLUDED.contact_name,
-                contact_phone = EXCLUDED.contact_phone,
-                text = EXCLUDED.text,
-                sentiment = EXCLUDED.sentiment,
-                score = EXCLUDED.score,
-                keywords = EXCLUDED.keywords,
-                timestamp = EXCLUDED.timestamp,
-                analyzed_at = EXCLUDED.analyzed_at
-            """
-            
-            values = (
-                feedback_data.get('id'),
-                feedback_data.get('contact_name'),
-                feedback_data.get('contact_phone'),
-                feedback_data.get('text'),
-                feedback_data.get('sentiment'),
-                feedback_data.get('score'),
-                json.dumps(feedback_data.get('keywords', [])),
-                feedback_data.get('timestamp'),
-                feedback_data.get('analyzed_at')
-            )
-            
-            self.db_manager.execute_query(query, values)
+            self.db_manager.execute_query(UPSERT_FEEDBACK_QUERY, self._feedback_values(feedback_data))
             logger.info(f"Feedback salvo: {feedback_data.get('id')}")
             return True
             
@@ -93,6 +81,67 @@ class FeedbackService:
             logger.error(f"Erro ao salvar feedback: {e}")
             return False
 
+    def save_feedbacks(self, feedbacks_data: List[Dict]) -> int:
+        """Salva vários feedbacks em uma única transação (upsert por feedback_id); retorna quantos foram gravados"""
+        try:
+            if not self.db_manager:
+                logger.warning("DB Manager não disponível, usando fallback")
+                return 0
+            if not feedbacks_data:
+                return 0
+            
+            # Garante que a tabela existe (uma vez por lote)
+            self.create_feedback_table()
+            
+            self.db_manager.cursor.executemany(
+                UPSERT_FEEDBACK_QUERY, [self._feedback_values(feedback) for feedback in feedbacks_data]
+            )
+            self.db_manager.connection.commit()
+            logger.info(f"{len(feedbacks_data)} feedbacks salvos em lote")
+            return len(feedbacks_data)
+        
+        except Exception as e:
+            logger.error(f"Erro ao salvar lote de feedbacks: {e}")
+            try:
+                self.db_manager.connection.rollback()
+            except Exception:
+                return 0
+            if len(feedbacks_data) == 1:
+                return 0
+            # Um registro inválido não derruba o lote: grava um a um
+            return self._save_feedbacks_one_by_one(feedbacks_data)
+    
+    def _save_feedbacks_one_by_one(self, feedbacks_data: List[Dict]) -> int:
+        """Fallback do lote: um upsert (e um commit) por feedback, descartando só os que falham"""
+        saved = 0
+        for feedback in feedbacks_data:
+            try:
+                self.db_manager.cursor.execute(UPSERT_FEEDBACK_QUERY, self._feedback_values(feedback))
+                self.db_manager.connection.commit()
+                saved += 1
+            except Exception as e:
+                logger.error(f"Erro ao salvar feedback {feedback.get('id')}: {e}")
+                try:
+                    self.db_manager.connection.rollback()
+                except Exception:
+                    break
+        logger.info(f"{saved}/{len(feedbacks_data)} feedbacks salvos individualmente")
+        return saved
+    
+    @staticmethod
+    def _feedback_values(feedback_data: Dict) -> tuple:
+        return (
+            feedback_data.get('id'),
+            feedback_data.get('contact_name'),
+            feedback_data.get('contact_phone'),
+            feedback_data.get('text'),
+            feedback_data.get('sentiment'),
+            feedback_data.get('score'),
+            json.dumps(feedback_data.get('keywords', [])),
+            feedback_data.get('timestamp'),
+            feedback_data.get('analyzed_at')
+        )
+    
     def get_all_feedbacks(self, limit: int = 100) -> List[Dict]:
         """Busca todos os feedbacks do banco"""
         try:
@@ -344,8 +393,8 @@ class FeedbackService:
                     'message': 'Analisador de sentimento não disponível'
                 }
             
-            # Analisar sentimento
-            analysis = sentiment_analyzer.analyze_text(message_data.get('text', ''))
+            # Analisar sentimento (perfil de ingestão)
+            analysis = sentiment_analyzer.analyze_message(message_data)
             
             # Preparar dados do feedback
             feedback_data = {
@@ -354,7 +403,7 @@ class FeedbackService:
                 'contact_phone': message_data.get('contact_phone', ''),
                 'text': message_data.get('text', ''),
                 'sentiment': analysis.get('sentiment', 'neutral'),
-                'score': analysis.get('score', 0.0),
+                'score': round(analysis.get('confidence', 0.0), 4),
                 'keywords': analysis.get('keywords', []),
                 'timestamp': message_data.get('timestamp'),
                 'analyzed_at': datetime.now().isoformat()
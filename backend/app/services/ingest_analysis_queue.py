@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+📥 ESTÁGIO ASSÍNCRONO DE ANÁLISE DA INGESTÃO WHATSAPP 📥
+As mensagens persistidas pelo webhook entram em uma fila limitada em memória;
+workers do event loop consomem a fila em micro-lotes, analisam cada lote fora
+do event loop (pool do analisador) e gravam os resultados em feedbacks com um
+upsert em lote. A análise também é gravada uma única vez na própria linha de
+whatsapp_messages (classe, score, confiança, urgência e intenção principal),
+para que as listagens de chats e mensagens mostrem o sentimento sem reanalisar.
+O webhook só enfileira: a latência da confirmação não depende do custo da análise.
+As gravações (psycopg2, síncronas) também saem do event loop: rodam em uma
+única thread de escrita, com a conexão própria dos serviços passados a start().
+
+Com a fila cheia a mensagem não é enfileirada (fica apenas em whatsapp_messages)
+e é contada em 'dropped': as métricas de profundidade e de descarte indicam
+quando aumentar workers/tamanho do lote.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from .analyzer_executor import analyzer_executor
+from .sentiment_analyzer import SupremeSentimentAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Campos da análise gravados em feedbacks e em whatsapp_messages (dispensam as fases profundas;
+# intenção e urgência exigem ao menos o perfil 'standard')
+INGEST_FIELDS = ['sentiment_class', 'confidence', 'intent_analysis', 'urgency_analysis']
+
+# Larguras das colunas VARCHAR de feedbacks (feedback_id, contact_name, contact_phone)
+FEEDBACK_ID_MAX_LENGTH = 50
+CONTACT_NAME_MAX_LENGTH = 100
+CONTACT_PHONE_MAX_LENGTH = 20
+
+
+class IngestAnalysisQueue:
+    """Fila limitada de mensagens persistidas -> análise em micro-lotes -> upsert em feedbacks"""
+    
+    def __init__(self, max_depth: Optional[int] = None, workers: Optional[int] = None,
+                 batch_size: Optional[int] = None, batch_wait_ms: Optional[float] = None,
+                 profile: Optional[str] = None):
+        self.max_depth = max(1, max_depth or settings.sentiment_ingest_queue_size)
+        self.workers = max(1, workers or settings.sentiment_ingest_workers)
+        self.batch_size = max(1, batch_size or settings.sentiment_ingest_batch_size)
+        self.batch_wait = (settings.sentiment_ingest_batch_wait_ms if batch_wait_ms is None else batch_wait_ms) / 1000
+        self.profile = profile or settings.sentiment_ingest_profile
+        self.feedback_service = None
+        self.message_store = None
+        # Uma única thread de escrita: as gravações dos workers são serializadas na mesma conexão
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        
+        # Métricas
+        self.enqueued = 0
+        self.dropped = 0
+        self.analyzed = 0
+        self.saved = 0
+        self.messages_updated = 0
+        self.failed = 0
+        self.batches = 0
+        self.high_watermark = 0
+        self.analysis_seconds = 0.0
+        self.lag_seconds = 0.0
+        self.last_lag_seconds = 0.0
+    
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+    
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    def start(self, feedback_service, message_store=None) -> bool:
+        """
+        Cria a fila e os workers no event loop atual (chamar no startup da aplicação)
+        message_store (WhatsAppPersistenceService) recebe a análise de cada mensagem em whatsapp_messages;
+        os dois serviços são usados só pela thread de escrita (passe-os com uma conexão própria)
+        """
+        if self.is_running:
+            return True
+        try:
+            self.feedback_service = feedback_service
+            self.message_store = message_store
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ingest-writer')
+            self._queue = asyncio.Queue(maxsize=self.max_depth)
+            self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+            logger.info(f"📥 Fila de análise da ingestão iniciada: {self.workers} workers, "
+                        f"lotes de até {self.batch_size}, profundidade máxima {self.max_depth} (perfil {self.profile})")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Erro ao iniciar fila de análise da ingestão: {e}")
+            self._queue = None
+            self._tasks = []
+            self._writer = None
+            return False
+    
+    async def stop(self, timeout: float = 5.0):
+        """Aguarda o esvaziamento da fila (até timeout) e encerra os workers"""
+        if not self.is_running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Fila de análise encerrada com {self.depth} mensagens pendentes")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._writer.shutdown(wait=True)
+        self._writer = None
+        logger.info(f"📥 Fila de análise da ingestão encerrada: {self.get_metrics()}")
+    
+    def submit(self, message: Dict[str, Any]) -> bool:
+        """
+        Enfileira uma mensagem persistida (message_id, phone, text, contact_name, timestamp)
+        Nunca bloqueia: com a fila cheia (ou parada) a mensagem é descartada e contada
+        """
+        if self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), message))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"⚠️ Fila de análise cheia ({self.max_depth}): mensagem {message.get('message_id')} não será analisada")
+            return False
+        self.enqueued += 1
+        self.high_watermark = max(self.high_watermark, self._queue.qsize())
+        return True
+    
+    async def _worker(self, index: int):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            # Micro-lote: a primeira mensagem abre a janela de batch_wait para as seguintes
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_wait
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"❌ Worker {index} da fila de análise: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _process_batch(self, batch: List[Tuple[float, Dict[str, Any]]]):
+        self.last_lag_seconds = time.monotonic() - batch[0][0]
+        self.lag_seconds += self.last_lag_seconds
+        self.batches += 1
+        
+        messages = [message for _, message in batch]
+        started = time.perf_counter()
+        results = await analyzer_executor.analyze_batch(
+            [message.get('text') or '' for message in messages], self.profile, fields=INGEST_FIELDS
+        )
+        self.analysis_seconds += time.perf_counter() - started
+        self.analyzed += len(results)
+        
+        analyzed_at = datetime.now().isoformat()
+        feedbacks = []
+        analyses = []
+        for message, (sentiment_class, score, keywords, details) in zip(messages, results):
+            analyses.append({
+                'message_id': message.get('message_id'),
+                'sentiment_class': sentiment_class,
+                'score': round(score, 4),
+                'confidence': round(details.get('confidence', 0.0), 4),
+                'urgency_level': details.get('urgency_analysis', {}).get('urgency_level'),
+                'primary_intent': details.get('intent_analysis', {}).get('primary_intent'),
+                'analyzed_at': analyzed_at
+            })
+            feedbacks.append({
+                'id': str(message.get('message_id'))[:FEEDBACK_ID_MAX_LENGTH],
+                'contact_name': (message.get('contact_name') or '')[:CONTACT_NAME_MAX_LENGTH],
+                'contact_phone': (message.get('phone') or '')[:CONTACT_PHONE_MAX_LENGTH],
+                'text': message.get('text', ''),
+                'sentiment': SupremeSentimentAnalyzer._to_simple_sentiment(sentiment_class),
+                'score': round(details.get('confidence', 0.0), 4),
+                'keywords': keywords,
+                'timestamp': message.get('timestamp'),
+                'analyzed_at': analyzed_at
+            })
+        
+        # psycopg2 é síncrono: as gravações rodam na thread de escrita, sem bloquear o event loop
+        saved, updated = await asyncio.get_running_loop().run_in_executor(
+            self._writer, self._save_batch, feedbacks, analyses
+        )
+        self.saved += saved
+        if saved < len(feedbacks):
+            self.failed += len(feedbacks) - saved
+        self.messages_updated += updated
+    
+    def _save_batch(self, feedbacks: List[Dict[str, Any]], analyses: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Thread de escrita: upsert em feedbacks e análise em whatsapp_messages (gravados, atualizadas)"""
+        saved = self.feedback_service.save_feedbacks(feedbacks) if self.feedback_service else 0
+        updated = self.message_store.save_message_analyses(analyses) if self.message_store else 0
+        return saved, updated
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Profundidade, descartes (backpressure), vazão e atraso entre enfileirar e analisar"""
+        return {
+            'running': self.is_running,
+            'workers': self.workers if self.is_running else 0,
+            'profile': self.profile,
+            'batch_size': self.batch_size,
+            'batch_wait_ms': round(self.batch_wait * 1000, 1),
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'fill_ratio': round(self.depth / self.max_depth, 4),
+            'high_watermark': self.high_watermark,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+            'analyzed': self.analyzed,
+            'saved': self.saved,
+            'messages_updated': self.messages_updated,
+            'failed': self.failed,
+            'batches': self.batches,
+            'avg_batch_size': round(self.analyzed / self.batches, 2) if self.batches else 0.0,
+            'avg_batch_analysis_ms': round(self.analysis_seconds / self.batches * 1000, 3) if self.batches else 0.0,
+            'avg_queue_lag_ms': round(self.lag_seconds / self.batches * 1000, 3) if self.batches else 0.0,
+            'last_queue_lag_ms': round(self.last_lag_seconds * 1000, 3)
+        }
+
+
+# Instância global da fila (os workers são criados no startup da aplicação)
+ingest_analysis_queue = IngestAnalysisQueue()
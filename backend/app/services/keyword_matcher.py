@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🔎 MATCHER DE PALAVRAS-CHAVE MULTI-DICIONÁRIO 🔎
+Autômato Aho-Corasick que localiza todas as palavras-chave de todos os
+dicionários do analisador em uma única passada sobre o texto
+
+Com uma função de forma canônica (fold), as palavras-chave são compiladas
+nessa forma (variantes de um mesmo grupo viram uma única entrada, exibida com
+a grafia registrada primeiro) e o texto varrido já deve estar na mesma forma
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# Um grupo pode ser uma lista de palavras-chave (peso 1.0) ou um dict palavra -> peso
+KeywordGroup = Union[Iterable[str], Mapping[str, float]]
+KeywordTables = Mapping[str, Mapping[str, KeywordGroup]]
+
+
+class KeywordHits:
+    """Resultado de uma varredura: palavras encontradas, etiquetadas por tabela, grupo e peso"""
+    
+    __slots__ = ('text', 'found', '_matcher', '_by_table')
+    
+    def __init__(self, text: str, found: set, matcher: 'KeywordMatcher'):
+        self.text = text
+        self.found = found
+        self._matcher = matcher
+        self._by_table: Optional[Dict[str, Dict[str, List[Tuple[str, float]]]]] = None
+    
+    def __contains__(self, keyword: str) -> bool:
+        return self._matcher.canonical(keyword) in self.found
+    
+    def __len__(self) -> int:
+        return len(self.found)
+    
+    def count(self, keyword: str) -> int:
+        """Ocorrências não sobrepostas (mesma semântica de str.count), na forma canônica"""
+        keyword = self._matcher.canonical(keyword)
+        if keyword not in self.found:
+            return 0
+        return self.text.count(keyword)
+    
+    def _index(self) -> Dict[str, Dict[str, List[Tuple[str, float]]]]:
+        if self._by_table is None:
+            tags = self._matcher.tags
+            ordered = sorted(tag for keyword in self.found for tag in tags[keyword])
+            by_table: Dict[str, Dict[str, List[Tuple[str, float]]]] = {}
+            for _, table, group, keyword, weight in ordered:
+                by_table.setdefault(table, {}).setdefault(group, []).append((keyword, weight))
+            self._by_table = by_table
+        return self._by_table
+    
+    def groups(self, table: str) -> Dict[str, List[str]]:
+        """Grupos da tabela com pelo menos um acerto, na ordem de registro"""
+        return {
+            group: [keyword for keyword, _ in entries]
+            for group, entries in self._index().get(table, {}).items()
+        }
+    
+    def weighted(self, table: str) -> List[Tuple[str, float]]:
+        """Pares (palavra, peso) encontrados na tabela, na ordem de registro"""
+        return [entry for entries in self._index().get(table, {}).values() for entry in entries]
+    
+    def present(self, table: str) -> List[str]:
+        """Palavras encontradas na tabela, na ordem de registro"""
+        return [keyword for keyword, _ in self.weighted(table)]
+
+
+class KeywordMatcher:
+    """Autômato Aho-Corasick compilado a partir de tabelas de palavras-chave"""
+    
+    def __init__(self, tables: KeywordTables, fold: Optional[Callable[[str], str]] = None):
+        self.tables = tuple(tables)
+        # Função de módulo (o matcher é serializado no snapshot do léxico)
+        self.fold = fold
+        # Chave canônica -> etiquetas (sequência, tabela, grupo, palavra exibida, peso)
+        self.tags: Dict[str, List[Tuple[int, str, str, str, float]]] = {}
+        
+        sequence = 0
+        for table, groups in tables.items():
+            for group, keywords in groups.items():
+                items = keywords.items() if isinstance(keywords, Mapping) else ((k, 1.0) for k in keywords)
+                seen = set()
+                for keyword, weight in items:
+                    key = self.canonical(keyword)
+                    if not key or key in seen:
+                        continue
+                    seen.add(key)
+                    self.tags.setdefault(key, []).append((sequence, table, group, keyword, weight))
+                    sequence += 1
+        
+        self._build(self.tags)
+    
+    def canonical(self, keyword: str) -> str:
+        return self.fold(keyword) if self.fold is not None else keyword
+    
+    def _build(self, keywords: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[str]] = [[]]
+        
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    output.append([])
+                    goto[state][char] = next_state
+                state = next_state
+            output[state].append(keyword)
+        
+        # Links de falha em largura, propagando as saídas dos sufixos
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                output[next_state] = output[next_state] + output[fail[next_state]]
+        
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(keywords) if keywords else None for keywords in output]
+    
+    def __len__(self) -> int:
+        return len(self.tags)
+    
+    def scan(self, text: str) -> KeywordHits:
+        """Varre o texto (já na forma canônica, se o matcher tiver fold) uma única vez e retorna todos os acertos"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            matched = output[state]
+            if matched:
+                found.update(matched)
+        return KeywordHits(text, found, self)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+📚 HISTÓRICO DE APRENDIZAGEM EM BUFFER CIRCULAR 📚
+Guarda as últimas N análises em um buffer de tamanho fixo e mantém
+incrementalmente os contadores usados pelos insights (distribuição de
+sentimentos, soma de confiança, contextos e janelas horárias das últimas 24h),
+de modo que get_insights não depende do tamanho do histórico
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+
+# Janela dos insights recentes, em baldes de uma hora
+RECENT_WINDOW_HOURS = 24
+
+
+class LearningHistory:
+    """Buffer circular de análises com contadores incrementais"""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._items: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._hours: List[int] = [0] * capacity
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        
+        self.sentiment_counts: Counter = Counter()
+        self.context_counts: Counter = Counter()
+        self.confidence_sum = 0.0
+        # Balde por hora: posição (hora % 24) -> [hora, total, Counter de sentimentos]
+        self._recent: List[List[Any]] = [[-1, 0, Counter()] for _ in range(RECENT_WINDOW_HOURS)]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Itera do registro mais antigo ao mais recente (sobre uma cópia)"""
+        with self._lock:
+            start = (self._next - self._size) % self.capacity
+            items = [self._items[(start + offset) % self.capacity] for offset in range(self._size)]
+        return iter(items)
+    
+    def append(self, record: Dict[str, Any]):
+        """Acrescenta um registro (sentiment_class, confidence, contexts_detected), descartando o mais antigo se cheio"""
+        hour = int(time.time() // 3600)
+        with self._lock:
+            if self._size == self.capacity:
+                self._discount(self._items[self._next], self._hours[self._next])
+            else:
+                self._size += 1
+            
+            self._items[self._next] = record
+            self._hours[self._next] = hour
+            self._next = (self._next + 1) % self.capacity
+            
+            sentiment_class = record['sentiment_class']
+            self.sentiment_counts[sentiment_class] += 1
+            self.context_counts.update(record.get('contexts_detected', []))
+            self.confidence_sum += record['confidence']
+            
+            bucket = self._recent[hour % RECENT_WINDOW_HOURS]
+            if bucket[0] != hour:
+                bucket[0], bucket[1], bucket[2] = hour, 0, Counter()
+            bucket[1] += 1
+            bucket[2][sentiment_class] += 1
+    
+    def _discount(self, record: Dict[str, Any], hour: int):
+        """Remove dos contadores o registro que sai do buffer"""
+        sentiment_class = record['sentiment_class']
+        self.sentiment_counts[sentiment_class] -= 1
+        if self.sentiment_counts[sentiment_class] <= 0:
+            del self.sentiment_counts[sentiment_class]
+        
+        for context in record.get('contexts_detected', []):
+            self.context_counts[context] -= 1
+            if self.context_counts[context] <= 0:
+                del self.context_counts[context]
+        
+        self.confidence_sum -= record['confidence']
+        
+        bucket = self._recent[hour % RECENT_WINDOW_HOURS]
+        if bucket[0] == hour:
+            bucket[1] -= 1
+            bucket[2][sentiment_class] -= 1
+            if bucket[2][sentiment_class] <= 0:
+                del bucket[2][sentiment_class]
+    
+    def get_recent(self) -> Dict[str, Any]:
+        """Total e distribuição de sentimentos das últimas 24 horas (granularidade de uma hora)"""
+        oldest_hour = int(time.time() // 3600) - RECENT_WINDOW_HOURS
+        count = 0
+        sentiments: Counter = Counter()
+        with self._lock:
+            for hour, total, distribution in self._recent:
+                if hour > oldest_hour:
+                    count += total
+                    sentiments.update(distribution)
+        return {'count': count, 'sentiments': dict(sentiments)}
+    
+    def get_insights(self) -> Dict[str, Any]:
+        """Insights do histórico em tempo constante (independente do número de registros)"""
+        recent = self.get_recent()
+        with self._lock:
+            total = self._size
+            return {
+                'total_analyses': total,
+                'sentiment_distribution': dict(self.sentiment_counts),
+                'average_confidence': round(self.confidence_sum / total, 3) if total else 0.0,
+                'common_contexts': self.context_counts.most_common(5),
+                'recent_24h_count': recent['count'],
+                'recent_sentiment_trend': recent['sentiments'],
+                'system_learning_status': 'active' if total > 10 else 'building_knowledge'
+            }
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+🔄 LÉXICO EXTERNO COM RECARGA A QUENTE 🔄
+sentiment_lexicon, emoji_sentiments e sarcasm_patterns podem vir de um arquivo
+JSON versionado (settings.sentiment_lexicon_path), sem redeploy:
+    
+    {"version": "2026-10-17.1",
+     "sentiment_lexicon": {"bom": 2.0, ...},
+     "emoji_sentiments": {"👍": 1.5, ...},
+     "sarcasm_patterns": {"sarcasmo_obvio": ["que bom né", ...], ...}}
+
+Cada seção presente substitui a tabela embutida (seções ausentes mantêm a
+embutida). Para gerar um arquivo inicial com as tabelas atuais:
+    
+    python -m app.services.lexicon_reloader export ./config/sentiment_lexicon.json
+
+Recarga copy-on-write: o estado novo (LexiconState com tabelas, matchers dos
+perfis já usados, normalizador e scorer de frases) é compilado em uma thread,
+sem tocar no estado em uso, e publicado como pendente. A troca acontece na
+fronteira da próxima análise, com uma única atribuição (analyzer.lexicon_state).
+Cada análise lê essa referência uma vez no início e a fixa na sua thread
+(pin_lexicon): análises em andamento, inclusive as do threadpool do lote em
+streaming, terminam inteiras com a versão antiga. Como a versão do léxico
+entra na chave do cache de resultados, entradas antigas deixam de ser usadas.
+
+Cada processo (inclusive os do pool do analisador) verifica o arquivo a cada
+settings.sentiment_lexicon_check_seconds, na fronteira das análises.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.config import settings
+from .lexicon_snapshot import source_hash
+from .text_normalizer import TextNormalizer
+
+logger = logging.getLogger(__name__)
+
+# Tabelas que podem vir do arquivo externo
+LEXICON_TABLES = ('sentiment_lexicon', 'emoji_sentiments', 'sarcasm_patterns')
+
+
+class LexiconState:
+    """
+    🔄 Estado imutável do léxico em uso: tabelas, normalizador, snapshot e versão
+    Publicado com uma única atribuição; só os derivados (DERIVED) e os matchers por perfil
+    são preenchidos depois, no primeiro uso, sempre a partir das tabelas do próprio estado.
+    sarcasm_patterns None: usa a tabela embutida do analisador
+    """
+    
+    __slots__ = ('sentiment_lexicon', 'emoji_sentiments', 'sarcasm_patterns', 'normalizer',
+                 'lexicon_version', 'lexicon_snapshot', 'keyword_matchers',
+                 'phrase_scorer', 'batch_scorer', 'canonical_lexicon')
+    DERIVED = ('phrase_scorer', 'batch_scorer', 'canonical_lexicon')
+    
+    def __init__(self, sentiment_lexicon: Dict[str, float], emoji_sentiments: Dict[str, float],
+                 sarcasm_patterns: Optional[Dict[str, Any]], normalizer: TextNormalizer,
+                 lexicon_version: str, lexicon_snapshot=None):
+        set_field = object.__setattr__
+        set_field(self, 'sentiment_lexicon', sentiment_lexicon)
+        set_field(self, 'emoji_sentiments', emoji_sentiments)
+        set_field(self, 'sarcasm_patterns', sarcasm_patterns)
+        set_field(self, 'normalizer', normalizer)
+        set_field(self, 'lexicon_version', lexicon_version)
+        set_field(self, 'lexicon_snapshot', lexicon_snapshot)
+        set_field(self, 'keyword_matchers', {})
+        for name in self.DERIVED:
+            set_field(self, name, None)
+    
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"LexiconState é imutável: publique um estado novo em vez de alterar '{name}'")
+    
+    def cache(self, name: str, value: Any) -> Any:
+        """Guarda um derivado ainda vazio; se outra thread chegou antes, devolve o dela"""
+        if name not in self.DERIVED:
+            raise AttributeError(f"'{name}' não é um campo derivado do léxico")
+        current = getattr(self, name)
+        if current is not None:
+            return current
+        object.__setattr__(self, name, value)
+        return value
+
+
+def _validate_tables(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Seções presentes no arquivo, validadas (ValueError se malformadas)"""
+    tables = {}
+    for name in ('sentiment_lexicon', 'emoji_sentiments'):
+        if name in data:
+            section = data[name]
+            if not isinstance(section, dict) or not all(
+                    isinstance(key, str) and isinstance(value, (int, float)) for key, value in section.items()):
+                raise ValueError(f"Seção '{name}' deve mapear texto -> número")
+            tables[name] = {key.strip().lower() if name == 'sentiment_lexicon' else key: float(value)
+                            for key, value in section.items() if key.strip()}
+    if 'sarcasm_patterns' in data:
+        section = data['sarcasm_patterns']
+        if not isinstance(section, dict) or not all(
+                isinstance(phrases, list) and all(isinstance(phrase, str) for phrase in phrases)
+                for phrases in section.values()):
+            raise ValueError("Seção 'sarcasm_patterns' deve mapear grupo -> lista de frases")
+        tables['sarcasm_patterns'] = {group: [phrase.lower() for phrase in phrases] for group, phrases in section.items()}
+    return tables
+
+
+def load_lexicon_file(path: str) -> Tuple[str, str, Dict[str, Any]]:
+    """(version do arquivo, hash do conteúdo, tabelas) de um arquivo de léxico"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    data = json.loads(content.decode('utf-8'))
+    if not isinstance(data, dict):
+        raise ValueError("Arquivo de léxico deve conter um objeto JSON")
+    tables = _validate_tables(data)
+    if not tables:
+        raise ValueError(f"Nenhuma seção reconhecida (use {', '.join(LEXICON_TABLES)})")
+    return str(data.get('version', '')), hashlib.sha256(content).hexdigest(), tables
+
+
+class LexiconReloader:
+    """Carga, verificação periódica e troca copy-on-write do léxico externo de um analisador"""
+    
+    def __init__(self, analyzer, path: Optional[str] = None, check_seconds: Optional[float] = None):
+        self.analyzer = analyzer
+        self.path = settings.sentiment_lexicon_path if path is None else path
+        self.check_seconds = settings.sentiment_lexicon_check_seconds if check_seconds is None else check_seconds
+        self.file_version: Optional[str] = None
+        self.content_hash: Optional[str] = None
+        self.loaded_at: Optional[str] = None
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        # (estado, metadados) compilado e ainda não aplicado
+        self._pending: Optional[Tuple[LexiconState, Tuple]] = None
+        self._building = False
+        self._lock = threading.Lock()
+        self._file_stamp: Optional[Tuple[float, int]] = None
+        self._next_check = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+    
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime, stat.st_size
+        except OSError:
+            return None
+    
+    def load_initial(self):
+        """Na criação do analisador: aplica o arquivo (se existir) de forma síncrona, matchers sob demanda"""
+        if not self.enabled:
+            return
+        self._file_stamp = self._stat()
+        if self._file_stamp is None:
+            logger.warning(f"⚠️ Arquivo de léxico não encontrado ({self.path}): usando o léxico embutido")
+            return
+        built = self._build(precompile=False)
+        if built is not None:
+            self._apply(*built)
+        self._next_check = time.monotonic() + self.check_seconds
+    
+    def poll(self):
+        """
+        Fronteira de análise: aplica um estado pendente e, a cada check_seconds, verifica o arquivo
+        (custo típico: uma leitura de atributo e uma comparação de tempo)
+        """
+        if self._pending is not None:
+            self._apply_pending()
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_seconds
+        stamp = self._stat()
+        if stamp is not None and stamp != self._file_stamp:
+            self._file_stamp = stamp
+            self.reload()
+    
+    def reload(self, background: bool = True) -> Dict[str, Any]:
+        """Compila o léxico do arquivo (em uma thread por padrão); a troca ocorre na próxima análise"""
+        if not self.enabled:
+            return {'success': False, 'error': 'Nenhum arquivo de léxico configurado (SENTIMENT_LEXICON_PATH)'}
+        with self._lock:
+            if self._building:
+                return {'success': True, 'status': 'building'}
+            self._building = True
+        
+        if not background:
+            self._build_pending()
+            self._apply_pending()
+            return self.get_status()
+        
+        threading.Thread(target=self._build_pending, name='lexicon-reload', daemon=True).start()
+        return {'success': True, 'status': 'building'}
+    
+    def _build_pending(self):
+        try:
+            built = self._build(precompile=True)
+            if built is not None:
+                self._pending = built
+        finally:
+            self._building = False
+    
+    def _build(self, precompile: bool) -> Optional[Tuple[LexiconState, Tuple]]:
+        """(estado novo, metadados) a partir do arquivo, sem alterar o estado em uso (None em caso de erro)"""
+        started = time.perf_counter()
+        try:
+            file_version, content_hash, tables = load_lexicon_file(self.path)
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"❌ Léxico externo inválido ({self.path}), mantendo a versão atual: {e}")
+            return None
+        
+        analyzer = self.analyzer
+        current = analyzer.lexicon_state
+        # Seções ausentes do arquivo mantêm as tabelas do estado atual (compartilhadas, nunca alteradas)
+        emoji_sentiments = tables.get('emoji_sentiments', current.emoji_sentiments)
+        state = LexiconState(
+            tables.get('sentiment_lexicon', current.sentiment_lexicon),
+            emoji_sentiments,
+            tables.get('sarcasm_patterns', current.sarcasm_patterns),
+            TextNormalizer(current.normalizer.contractions, emoji_sentiments),
+            hashlib.sha256(f"{source_hash()}:{content_hash}".encode()).hexdigest()[:16]
+        )
+        # Derivados e perfis já usados são compilados agora (com o estado novo fixado só nesta thread),
+        # para a troca não custar nada às análises
+        if precompile:
+            with analyzer.pin_lexicon(state):
+                for name in LexiconState.DERIVED:
+                    getattr(analyzer, name)
+                for profile in list(current.keyword_matchers):
+                    analyzer.get_keyword_matcher(profile)
+        return state, (file_version, content_hash, sorted(tables), (time.perf_counter() - started) * 1000)
+    
+    def _apply_pending(self):
+        with self._lock:
+            built, self._pending = self._pending, None
+        if built is not None:
+            self._apply(*built)
+    
+    def _apply(self, state: LexiconState, meta: Tuple):
+        """Troca atômica: uma única atribuição de analyzer.lexicon_state"""
+        analyzer = self.analyzer
+        previous = analyzer.lexicon_state.lexicon_version
+        analyzer.lexicon_state = state
+        # Entradas da versão anterior nunca mais seriam lidas: libera a memória
+        # (a tabela de mensagens curtas volta a ser preenchida no primeiro uso de cada mensagem)
+        analyzer.result_cache.clear()
+        analyzer.short_messages.clear()
+        
+        self.file_version, self.content_hash, tables, build_ms = meta
+        self.loaded_at = datetime.now().isoformat()
+        self.reloads += 1
+        self.last_error = None
+        logger.info(f"🔄 Léxico externo aplicado: versão '{self.file_version}' ({', '.join(tables)}) | "
+                    f"lexicon_version {previous} -> {state.lexicon_version} | compilado em {build_ms:.1f}ms")
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Versão ativa do léxico e situação da recarga"""
+        if self._pending is not None:
+            self._apply_pending()
+        return {
+            'enabled': self.enabled,
+            'path': self.path,
+            'check_seconds': self.check_seconds,
+            'lexicon_version': self.analyzer.lexicon_state.lexicon_version,
+            'file_version': self.file_version,
+            'content_hash': self.content_hash[:16] if self.content_hash else None,
+            'loaded_at': self.loaded_at,
+            'reloads': self.reloads,
+            'building': self._building,
+            'last_error': self.last_error,
+            'table_sizes': {name: len(getattr(self.analyzer, name)) for name in LEXICON_TABLES}
+        }
+
+
+def export_lexicon(analyzer, path: str, version: Optional[str] = None) -> Dict[str, Any]:
+    """Grava as tabelas atuais do analisador no formato do arquivo externo"""
+    data = {'version': version or datetime.now().strftime('%Y-%m-%d.%H%M%S')}
+    data.update({name: getattr(analyzer, name) for name in LEXICON_TABLES})
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+    return {'path': path, 'version': data['version'], 'tables': {name: len(data[name]) for name in LEXICON_TABLES}}
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) < 3 or sys.argv[1] != 'export':
+        print("Uso: python -m app.services.lexicon_reloader export <caminho.json> [versão]")
+        sys.exit(1)
+    from .sentiment_analyzer import SupremeSentimentAnalyzer
+    
+    result = export_lexicon(SupremeSentimentAnalyzer(), sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+    print(f"✅ Léxico exportado: {result['path']} (versão {result['version']}, {result['tables']})")
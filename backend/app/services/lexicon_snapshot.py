@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+📦 SNAPSHOT PRÉ-COMPILADO DO LÉXICO 📦
+Serializa em um arquivo binário versionado, para que a inicialização não
+precise recompilá-los, os matchers compilados de cada perfil e as tabelas
+compiladas a partir do léxico (SNAPSHOT_TABLES: trie/ids do phrase_scorer e
+léxico canônico). As demais tabelas sob demanda são literais do código,
+mais baratas de reconstruir pelo _load_* do que de desserializar, e o
+batch_scorer é derivado do phrase_scorer em uma passada (e depende do NumPy
+disponível no processo).
+
+O snapshot é invalidado automaticamente pelo hash do conteúdo de todas as
+fontes do léxico compilado (SOURCE_FILES: dicionários, matcher, forma canônica
+e scorer de frases). Só o léxico embutido é serializado: com um léxico externo
+(SENTIMENT_LEXICON_PATH) as tabelas são compiladas do arquivo. Para gerar:
+    
+    python -m app.services.lexicon_snapshot [caminho]
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando o formato do arquivo (não o conteúdo do léxico) mudar
+SNAPSHOT_FORMAT = 2
+
+_SERVICES_DIR = Path(__file__).resolve().parent
+SOURCE_FILES = (
+    _SERVICES_DIR / 'sentiment_analyzer.py',
+    _SERVICES_DIR / 'keyword_matcher.py',
+    _SERVICES_DIR / 'text_normalizer.py',
+    _SERVICES_DIR / 'phrase_scorer.py'
+)
+
+# Tabelas compiladas do léxico embutido guardadas no snapshot (campos derivados do LexiconState)
+SNAPSHOT_TABLES = ('phrase_scorer', 'canonical_lexicon')
+
+
+def source_hash() -> str:
+    """Hash SHA-256 do código que define os dicionários, o matcher, a forma canônica e o scorer de frases"""
+    digest = hashlib.sha256()
+    for path in SOURCE_FILES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class LexiconSnapshot:
+    """Snapshot carregado: matchers e tabelas são desserializados apenas no primeiro uso"""
+    
+    def __init__(self, path: str, payload: Dict[str, Any]):
+        self.path = path
+        self.source_hash = payload['source_hash']
+        self.created_at = payload['created_at']
+        self._profiles: Dict[str, bytes] = payload['profiles']
+        self._tables: Dict[str, bytes] = payload['tables']
+    
+    @property
+    def profiles(self):
+        return tuple(self._profiles)
+    
+    @property
+    def tables(self):
+        return tuple(self._tables)
+    
+    def get_table(self, name: str):
+        """Tabela compilada, ou None se o snapshot não a contém"""
+        data = self._tables.get(name)
+        if data is None:
+            return None
+        return pickle.loads(data)
+    
+    def get_matcher(self, profile: str):
+        """Matcher compilado do perfil, ou None se o snapshot não o contém"""
+        data = self._profiles.get(profile)
+        if data is None:
+            return None
+        return pickle.loads(data)
+
+
+def build_snapshot(analyzer, path: Optional[str] = None, profiles: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """📦 Compila os matchers dos perfis e as tabelas do léxico e grava o snapshot de forma atômica"""
+    from .sentiment_analyzer import ANALYSIS_PROFILES
+    
+    current_hash = source_hash()
+    if analyzer.lexicon_state.lexicon_version != current_hash[:16]:
+        raise ValueError("Léxico externo ativo: o snapshot só guarda o léxico embutido (gere sem SENTIMENT_LEXICON_PATH)")
+    
+    path = path or settings.sentiment_snapshot_path
+    profiles = tuple(profiles or ANALYSIS_PROFILES)
+    
+    payload = {
+        'format': SNAPSHOT_FORMAT,
+        'source_hash': current_hash,
+        'created_at': datetime.now().isoformat(),
+        'profiles': {
+            profile: pickle.dumps(analyzer.build_keyword_matcher(profile), protocol=pickle.HIGHEST_PROTOCOL)
+            for profile in profiles
+        },
+        'tables': {
+            name: pickle.dumps(getattr(analyzer, f'_load_{name}')(), protocol=pickle.HIGHEST_PROTOCOL)
+            for name in SNAPSHOT_TABLES
+        }
+    }
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    
+    size = os.path.getsize(path)
+    logger.info(f"📦 Snapshot do léxico gravado em {path}: perfis {', '.join(profiles)}, "
+                f"tabelas {', '.join(SNAPSHOT_TABLES)} ({size / 1024:.1f}KB)")
+    return {'path': path, 'profiles': list(profiles), 'tables': list(SNAPSHOT_TABLES), 'size_bytes': size,
+            'source_hash': payload['source_hash']}
+
+
+def load_snapshot(path: Optional[str] = None) -> Optional[LexiconSnapshot]:
+    """📦 Carrega o snapshot; retorna None se ausente, corrompido ou desatualizado"""
+    path = path or settings.sentiment_snapshot_path
+    if not path or not os.path.exists(path):
+        return None
+    
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ Snapshot do léxico ilegível ({path}): {e}")
+        return None
+    
+    if not isinstance(payload, dict) or payload.get('format') != SNAPSHOT_FORMAT:
+        logger.info(f"📦 Snapshot do léxico em formato antigo, ignorado: {path}")
+        return None
+    
+    if payload.get('source_hash') != source_hash():
+        logger.info(f"📦 Snapshot do léxico desatualizado (código alterado), ignorado: {path}")
+        return None
+    
+    return LexiconSnapshot(path, payload)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    from .sentiment_analyzer import SupremeSentimentAnalyzer
+    
+    result = build_snapshot(SupremeSentimentAnalyzer(), sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"✅ Snapshot gerado: {result['path']} ({result['size_bytes']} bytes)")
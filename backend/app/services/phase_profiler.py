@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+⏱️ PROFILER AMOSTRADO DAS FASES DO ANALISADOR ⏱️
+Registra o tempo de parede de cada fase de analyze_sentiment_supreme em
+histogramas logarítmicos por perfil, apenas para uma fração das análises
+(settings.sentiment_profiler_sample_rate), e resume em p50/p95/p99.
+
+Nos processos do executor as amostras ficam pendentes e são devolvidas junto
+com o resultado, para serem agregadas no processo principal.
+"""
+
+import math
+import random
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.config import settings
+
+# Histograma: baldes geométricos de 1µs a ~100s (razão 1.2 => erro relativo < 10%)
+_MIN_SECONDS = 1e-6
+_GROWTH = 1.2
+_LOG_GROWTH = math.log(_GROWTH)
+_BUCKETS = 102
+
+
+class PhaseHistogram:
+    """Histograma logarítmico de durações com contagem, soma e máximo"""
+    
+    __slots__ = ('counts', 'count', 'total', 'max')
+    
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def add(self, seconds: float):
+        if seconds <= _MIN_SECONDS:
+            index = 0
+        else:
+            index = min(_BUCKETS - 1, int(math.log(seconds / _MIN_SECONDS) / _LOG_GROWTH) + 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def percentile(self, fraction: float) -> float:
+        """Limite superior do balde que contém o percentil (em segundos)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.max, _MIN_SECONDS * _GROWTH ** index)
+        return self.max
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 4) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50) * 1000, 4),
+            'p95_ms': round(self.percentile(0.95) * 1000, 4),
+            'p99_ms': round(self.percentile(0.99) * 1000, 4),
+            'max_ms': round(self.max * 1000, 4),
+            'total_ms': round(self.total * 1000, 3)
+        }
+
+
+class PhaseProfiler:
+    """Amostragem das análises e histogramas de tempo por (perfil, fase)"""
+    
+    def __init__(self, sample_rate: float):
+        self.sample_rate = sample_rate
+        self._histograms: Dict[Tuple[str, str], PhaseHistogram] = {}
+        self._lock = threading.Lock()
+        self._pending: Optional[List[Tuple[str, Dict[str, float]]]] = None
+        self.sampled = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+    
+    def should_sample(self) -> bool:
+        """Sorteia se a próxima análise será cronometrada"""
+        return self.sample_rate > 0 and (self.sample_rate >= 1 or random.random() < self.sample_rate)
+    
+    def set_sample_rate(self, sample_rate: float):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+    
+    def enable_forwarding(self):
+        """Modo processo do pool: guarda as amostras até drain() em vez de agregá-las"""
+        self._pending = []
+    
+    def drain(self) -> List[Tuple[str, Dict[str, float]]]:
+        """Amostras pendentes (modo forwarding) desde a última chamada"""
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+        return pending
+    
+    def record(self, profile: str, timings: Dict[str, float]):
+        """Registra os tempos (em segundos) das fases de uma análise amostrada"""
+        if self._pending is not None:
+            self._pending.append((profile, timings))
+            return
+        with self._lock:
+            self.sampled += 1
+            for phase, seconds in timings.items():
+                histogram = self._histograms.get((profile, phase))
+                if histogram is None:
+                    histogram = self._histograms[(profile, phase)] = PhaseHistogram()
+                histogram.add(seconds)
+    
+    def record_many(self, samples: Iterable[Tuple[str, Dict[str, float]]]):
+        for profile, timings in samples:
+            self.record(profile, timings)
+    
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.sampled = 0
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Resumo por perfil: fases ordenadas pelo tempo total acumulado (mais caras primeiro)"""
+        with self._lock:
+            items = [(key, histogram.summary()) for key, histogram in self._histograms.items()]
+        
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for (profile, phase), summary in sorted(items, key=lambda item: -item[1]['total_ms']):
+            profiles.setdefault(profile, {})[phase] = summary
+        
+        return {
+            'sample_rate': self.sample_rate,
+            'sampled_analyses': self.sampled,
+            'profiles': profiles
+        }
+
+
+# Instância global do profiler (compartilhada pelo analisador e pelo executor)
+phase_profiler = PhaseProfiler(settings.sentiment_profiler_sample_rate)
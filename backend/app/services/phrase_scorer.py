@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+🔢 SCORER LÉXICO POR IDS DE TOKENS 🔢
+Codifica o vocabulário do léxico em ids inteiros, monta uma trie de frases
+sobre esses ids (para que entradas com várias palavras, como 'muito bom' ou
+'mal atendimento', sejam reconhecidas) e pontua o texto em uma única passada
+da esquerda para a direita, com flags pré-calculadas por token para
+intensificadores, diminuidores e negações. Com fold, as entradas são
+compiladas na forma canônica e os tokens pontuados devem estar na mesma forma
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Janelas (em tokens anteriores ao início do termo)
+MODIFIER_WINDOW = 2
+NEGATION_WINDOW = 3
+NEGATION_FACTOR = -0.8
+
+# Tipos de modificador por token
+_NONE, _INTENSIFIER, _DIMINISHER = 0, 1, 2
+
+
+class PhraseScorer:
+    """Léxico compilado: vocabulário -> id, trie de frases e tabelas de flags indexadas por id (0 = desconhecido)"""
+    
+    def __init__(self, lexicon: Dict[str, float], intensifiers: Dict[str, float],
+                 diminishers: Dict[str, float], negations: Sequence[str],
+                 fold: Optional[Callable[[str], str]] = None):
+        fold = fold or (lambda word: word)
+        self.vocabulary: Dict[str, int] = {}
+        # Tabelas por id; a posição 0 representa tokens fora do vocabulário
+        self._modifier_kind: List[int] = [_NONE]
+        self._modifier_factor: List[float] = [1.0]
+        self._negation: List[bool] = [False]
+        # Trie: id do token -> [valor do termo terminado aqui (ou None), filhos]
+        self._trie: Dict[int, List[Any]] = {}
+        self.phrase_count = 0
+        
+        # Modificadores com várias palavras ('um pouco') nunca casaram com um token isolado
+        # e continuam fora; a janela de 2 tokens já alcança o 'pouco' final
+        for word, factor in diminishers.items():
+            if ' ' not in word:
+                token_id = self._token_id(fold(word))
+                self._modifier_kind[token_id], self._modifier_factor[token_id] = _DIMINISHER, factor
+        # Intensificadores têm precedência sobre diminuidores (mesma ordem do if/elif original)
+        for word, factor in intensifiers.items():
+            if ' ' not in word:
+                token_id = self._token_id(fold(word))
+                self._modifier_kind[token_id], self._modifier_factor[token_id] = _INTENSIFIER, factor
+        for word in negations:
+            if ' ' not in word:
+                self._negation[self._token_id(fold(word))] = True
+        
+        for term, value in lexicon.items():
+            token_ids = [self._token_id(token) for token in fold(term).split()]
+            if not token_ids:
+                continue
+            children = self._trie
+            node = None
+            for token_id in token_ids:
+                node = children.get(token_id)
+                if node is None:
+                    node = children[token_id] = [None, {}]
+                children = node[1]
+            # Variantes da mesma forma canônica ('ótimo'/'otimo'): vale a registrada primeiro
+            if node[0] is None:
+                node[0] = value
+                if len(token_ids) > 1:
+                    self.phrase_count += 1
+    
+    def _token_id(self, token: str) -> int:
+        token_id = self.vocabulary.get(token)
+        if token_id is None:
+            token_id = self.vocabulary[token] = len(self._modifier_kind)
+            self._modifier_kind.append(_NONE)
+            self._modifier_factor.append(1.0)
+            self._negation.append(False)
+        return token_id
+    
+    def encode(self, tokens: Sequence[str]) -> List[int]:
+        """Ids dos tokens (0 para tokens fora do vocabulário)"""
+        get = self.vocabulary.get
+        return [get(token, 0) for token in tokens]
+    
+    def _longest_match(self, ids: List[int], start: int, length: int,
+                       value: Optional[float]) -> Tuple[int, Optional[float]]:
+        """Maior termo do léxico iniciado em start (a partir do nó do primeiro token): (quantidade de tokens, valor)"""
+        children = self._trie[ids[start]][1]
+        for position in range(start + 1, len(ids)):
+            node = children.get(ids[position])
+            if node is None:
+                break
+            if node[0] is not None:
+                length, value = position - start + 1, node[0]
+            children = node[1]
+        return length, value
+    
+    def score(self, tokens: Sequence[str], explain: bool = True,
+              words: Optional[Sequence[str]] = None) -> Tuple[float, List[Dict[str, Any]], int]:
+        """
+        (soma dos valores dos termos do léxico com modificadores, contribuições, unidades)
+        Intensificador/diminuidor nos 2 tokens anteriores multiplica o valor; a primeira negação
+        nos 3 tokens anteriores o inverte (x -0.8). Frases consomem seus tokens (sem dupla contagem)
+        e contam como uma unidade na normalização: 'muito bom' (frase de valor 2.0) não pode valer
+        menos que 'bom'. unidades = tokens - tokens absorvidos por frases
+        words (alinhado a tokens) é usado nos textos de word_contributions; por padrão, os próprios tokens
+        """
+        ids = self.encode(tokens)
+        if words is None:
+            words = tokens
+        trie = self._trie
+        modifier_kind = self._modifier_kind
+        modifier_factor = self._modifier_factor
+        negation = self._negation
+        
+        total_score = 0.0
+        contributions = []
+        units = len(ids)
+        resume = 0
+        for i, token_id in enumerate(ids):
+            # Tokens já consumidos por uma frase ou que não iniciam nenhum termo
+            if i < resume or token_id not in trie:
+                continue
+            node = trie[token_id]
+            length, base_score = (1, node[0]) if node[0] is not None else (0, None)
+            if node[1]:
+                length, base_score = self._longest_match(ids, i, length, base_score)
+            if not length:
+                continue
+            resume = i + length
+            units -= length - 1
+            
+            final_score = base_score
+            modifiers = []
+            for j in range(max(0, i - MODIFIER_WINDOW), i):
+                kind = modifier_kind[ids[j]]
+                if kind:
+                    final_score *= modifier_factor[ids[j]]
+                    if explain:
+                        action = 'intensificado' if kind == _INTENSIFIER else 'diminuído'
+                        modifiers.append(f"{action} por '{words[j]}'")
+            
+            negated = False
+            for j in range(max(0, i - NEGATION_WINDOW), i):
+                if negation[ids[j]]:
+                    final_score *= NEGATION_FACTOR
+                    if explain:
+                        modifiers.append(f"negado por '{words[j]}'")
+                    negated = True
+                    break
+            
+            total_score += final_score
+            if explain:
+                contributions.append({
+                    'word': words[i] if length == 1 else ' '.join(words[i:resume]),
+                    'base_score': base_score,
+                    'final_score': final_score,
+                    'modifiers': modifiers,
+                    'negated': negated
+                })
+        
+        return total_score, contributions, units
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+♻️ CACHE DE RESULTADOS DO ANALISADOR ♻️
+Cache LRU com TTL, endereçado pelo conteúdo (hash do texto preprocessado,
+perfil e versão do léxico), limitado por número de entradas e por bytes.
+Os valores ficam serializados (pickle): o limite de memória é medido pelo
+tamanho serializado e cada acerto devolve uma cópia independente
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class AnalysisResultCache:
+    """LRU + TTL thread-safe com contadores de acertos, falhas, expulsões e expirações"""
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[Hashable, Tuple[bytes, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+    
+    @staticmethod
+    def make_key(processed_text: str, profile: str, lexicon_version: str) -> Tuple[bytes, str, str]:
+        """Chave endereçada pelo conteúdo"""
+        digest = hashlib.blake2b(processed_text.encode('utf-8'), digest_size=16).digest()
+        return digest, profile, lexicon_version
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            data, stored_at = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.current_bytes -= len(data)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(data)
+    
+    def put(self, key: Hashable, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if len(data) > self.max_bytes:
+                self.rejected += 1
+                return
+            
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous[0])
+            
+            self._entries[key] = (data, time.monotonic())
+            self.current_bytes += len(data)
+            
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'rejected': self.rejected
+        }
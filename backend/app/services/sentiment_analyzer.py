@@ -9,50 +9,253 @@ import re
 import json
 import math
 import hashlib
+import time
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Set, Any, Union
+from typing import Dict, List, Tuple, Optional, Set, Any, Union, Iterable, Iterator
 from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 
+from .keyword_matcher import KeywordMatcher, KeywordHits
+from .analysis_document import AnalysisDocument
+from .lexicon_snapshot import load_snapshot, source_hash
+from .lexicon_reloader import LexiconReloader, LexiconState
+from .result_cache import AnalysisResultCache
+from .short_message_table import SHORT_MESSAGE_SEEDS, ShortMessageTable
+from .analysis_budget import AnalysisBudget, DegradationStats, window_text
+from .learning_history import LearningHistory
+from .phase_profiler import phase_profiler
+from .phrase_scorer import PhraseScorer
+from .batch_scorer import BatchLexiconScorer
+from .text_normalizer import NormalizedText, TextNormalizer, fold_text
+from .context_store import ConversationContextStore, CompactConversationContext as ConversationContext
+from .context_persistence import ContextPersistence
+from ..core.config import settings
+
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ConversationContext:
-    """🌌💫 CONTEXTO CONVERSACIONAL SUPREMO MULTIVERSAL 💫🌌"""
-    user_id: str
-    conversation_history: deque = field(default_factory=lambda: deque(maxlen=50))
-    user_sentiment_profile: Dict[str, float] = field(default_factory=dict)
-    conversation_topics: List[str] = field(default_factory=list)
-    interaction_patterns: Dict[str, Any] = field(default_factory=dict)
-    last_interaction: Optional[datetime] = None
-    session_start: datetime = field(default_factory=datetime.now)
-    
-    # 🧠💫 CONTEXTO SUPREMO MULTIDIMENSIONAL 💫🧠
-    family_context: Dict[str, Any] = field(default_factory=dict)      # Contexto familiar (dependentes, responsabilidades)
-    professional_context: Dict[str, Any] = field(default_factory=dict)  # Contexto profissional (trabalho, renda)
-    psychological_context: Dict[str, Any] = field(default_factory=dict) # Contexto psicológico (stress, ansiedade)
-    cultural_context: Dict[str, Any] = field(default_factory=dict)    # Contexto cultural (região, costumes)
-    temporal_context: Dict[str, Any] = field(default_factory=dict)    # Contexto temporal (padrões, histórico)
-    motivational_context: Dict[str, Any] = field(default_factory=dict) # Contexto motivacional (o que move o cliente)
-    financial_context: Dict[str, Any] = field(default_factory=dict)   # Contexto financeiro profundo
-    social_context: Dict[str, Any] = field(default_factory=dict)      # Contexto social (relacionamentos)
-    behavioral_context: Dict[str, Any] = field(default_factory=dict)  # Contexto comportamental (padrões)
-    communication_context: Dict[str, Any] = field(default_factory=dict) # Contexto comunicacional (estilo)
-    
-    # 🌌⚡ CONTEXTO MULTIVERSAL IMPOSSÍVEL ⚡🌌
-    dimensional_contexts: Dict[str, Any] = field(default_factory=dict)  # Contextos de múltiplas dimensões
-    parallel_contexts: Dict[str, Any] = field(default_factory=dict)     # Contextos de universos paralelos
-    quantum_context_state: str = 'normal'       # Estado quântico do contexto
-    impossible_context_factors: List[str] = field(default_factory=list)  # Fatores impossíveis detectados
-    transcendent_context_level: int = 0         # Nível de contexto transcendente
-    
-    # 📊💥 ANÁLISE CONTEXTUAL AVANÇADA 💥📊
-    context_evolution_pattern: str = 'stable'   # Padrão de evolução do contexto
-    context_depth_score: float = 0.0           # Score de profundidade contextual
-    context_coherence_level: float = 0.0       # Nível de coerência contextual
-    context_prediction_accuracy: float = 0.0    # Precisão de predição contextual
-    context_multiversal_coverage: float = 0.0   # Cobertura contextual multiversal
+# 🎚️ PERFIS DE ANÁLISE: fases executadas por analyze_sentiment_supreme
+# Fases que alteram o score final e a classe (FIELD_DEPENDENCIES['_final_score']): todos os perfis as
+# executam, então os perfis leves só dispensam fases auxiliares e classificam como o 'full'
+SCORE_PHASES = ('sentiment_score', 'sarcasm', 'semantic_patterns')
+FAST_PHASES = SCORE_PHASES + ('emotions', 'contexts', 'keywords')
+STANDARD_PHASES = FAST_PHASES + ('intent', 'urgency')
+# Ordem de execução (e das tabelas do matcher) de todas as fases
+FULL_PHASES = (
+    'sentiment_score', 'emotions', 'contexts', 'keywords', 'sarcasm', 'intent', 'urgency',
+    'personality', 'relationship', 'semantic_patterns',
+    'quantum_linguistics', 'soul_frequency', 'cosmic_patterns', 'multiversal_consciousness', 'impossible_comprehension',
+    'psychological_profile', 'emotional_intelligence', 'cognitive_biases', 'communication_style', 'stress_resilience',
+    'micro_gestures', 'soul_dna', 'quantum_empathy', 'temporal_personality',
+    'divine_consciousness', 'reality_manipulation', 'interdimensional_communication', 'akashic_records', 'god_mode'
+)
+
+ANALYSIS_PROFILES = {
+    'fast': frozenset(FAST_PHASES),
+    'standard': frozenset(STANDARD_PHASES),
+    'full': frozenset(FULL_PHASES)
+}
+
+ANALYSIS_DEPTH = {'fast': 'basic', 'standard': 'standard', 'full': 'maximum'}
+
+# Recursos reportados em features_used por perfil
+ANALYSIS_FEATURES = {
+    'fast': ('sentiment_analysis', 'sarcasm_detection', 'semantic_patterns', 'emoji_analysis', 'conversation_memory'),
+    'standard': (
+        'sentiment_analysis', 'sarcasm_detection', 'semantic_patterns', 'intent_recognition',
+        'urgency_detection', 'conversation_memory', 'emoji_analysis'
+    ),
+    'full': (
+        'sentiment_analysis', 'sarcasm_detection', 'intent_recognition',
+        'urgency_detection', 'personality_analysis', 'relationship_analysis',
+        'semantic_patterns', 'conversation_memory', 'emoji_analysis',
+        'quantum_linguistics', 'soul_frequency_analysis', 'cosmic_patterns',
+        'multiversal_consciousness', 'impossible_comprehension', 'reality_bending',
+        'dimensional_analysis', 'temporal_consciousness', 'telepathic_reading',
+        'universal_truth_resonance', 'infinite_wisdom_access', 'god_consciousness'
+    )
+}
+
+# Fases cujo resultado depende do histórico/identidade do usuário (não passam pelo cache com user_id)
+CONTEXT_DEPENDENT_PHASES = frozenset({'relationship', 'quantum_empathy', 'temporal_personality'})
+
+# Chave do resultado produzida por cada fase profunda (perfil full)
+DEEP_PHASE_FIELDS = {
+    'personality': 'personality_analysis',
+    'relationship': 'relationship_analysis',
+    'semantic_patterns': 'semantic_analysis',
+    'quantum_linguistics': 'quantum_linguistics',
+    'soul_frequency': 'soul_frequency',
+    'cosmic_patterns': 'cosmic_patterns',
+    'multiversal_consciousness': 'multiversal_consciousness',
+    'impossible_comprehension': 'impossible_comprehension',
+    'psychological_profile': 'psychological_profile',
+    'emotional_intelligence': 'emotional_intelligence_deep',
+    'cognitive_biases': 'cognitive_biases',
+    'communication_style': 'communication_style_analysis',
+    'stress_resilience': 'stress_resilience',
+    'micro_gestures': 'micro_gestures_through_text',
+    'soul_dna': 'soul_dna_blueprint',
+    'quantum_empathy': 'quantum_empathy_transcendental',
+    'temporal_personality': 'temporal_personality_evolution',
+    'divine_consciousness': 'divine_consciousness_universal',
+    'reality_manipulation': 'reality_manipulation_mastery',
+    'interdimensional_communication': 'interdimensional_communication',
+    'akashic_records': 'akashic_records_access',
+    'god_mode': 'god_mode_omniscience_absolute'
+}
+
+# 🧩 GRAFO DE DEPENDÊNCIAS DOS CAMPOS DO RESULTADO
+# Cada campo depende de fases (folhas, nomes de FULL_PHASES) e/ou de outros campos;
+# nós iniciados por '_' são intermediários e não podem ser pedidos
+FIELD_DEPENDENCIES = {
+    '_final_score': ('sentiment_score', 'sarcasm', 'semantic_patterns'),
+    'sentiment_class': ('_final_score',),
+    'confidence': ('_final_score', 'emotions', 'keywords'),
+    'emotions': ('emotions',),
+    'contexts': ('contexts',),
+    'keyword_analysis': ('keywords',),
+    'analysis_details': ('sentiment_score',),
+    'word_contributions': ('analysis_details',),
+    'sarcasm_detection': ('sarcasm',),
+    'intent_analysis': ('intent',),
+    'urgency_analysis': ('urgency',),
+    **{field: (phase,) for phase, field in DEEP_PHASE_FIELDS.items()},
+    'conversation_context': (),
+    'text_length': (),
+    'processed_text': (),
+    'timestamp': (),
+    'analyzer_version': (),
+    'analysis_profile': (),
+    'analysis_depth': (),
+    'features_used': ()
+}
+
+OUTPUT_FIELDS = frozenset(field for field in FIELD_DEPENDENCIES if not field.startswith('_'))
+
+# Dados de explicação: só são montados quando pedidos explicitamente
+EXPLAIN_FIELDS = frozenset({'word_contributions'})
+
+# Campos sempre calculados: alimentam a memória conversacional e o histórico de aprendizagem
+MEMORY_FIELDS = ('sentiment_class', 'confidence', 'emotions', 'contexts')
+
+@lru_cache(maxsize=256)
+def resolve_field_phases(fields: frozenset) -> frozenset:
+    """🧩 Fases necessárias para produzir os campos (fecho transitivo do grafo de dependências)"""
+    phases = set()
+    pending = list(fields)
+    seen = set()
+    while pending:
+        node = pending.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        for dependency in FIELD_DEPENDENCIES[node]:
+            if dependency in ANALYSIS_PROFILES['full']:
+                phases.add(dependency)
+            else:
+                pending.append(dependency)
+    return frozenset(phases)
+
+# Contrações expandidas pelo normalizador de texto
+TEXT_CONTRACTIONS = {
+    'não foi': 'nao foi', 'não é': 'nao eh', 'não está': 'nao esta',
+    'não gosto': 'nao gosto', 'não gostei': 'nao gostei', 'não funciona': 'nao funciona',
+    'não funcionou': 'nao funcionou', 'não recomendo': 'nao recomendo',
+    'não vale': 'nao vale', 'não compro': 'nao compro', 'não volto': 'nao volto'
+}
+
+# Tabelas de palavras-chave consultadas por cada fase (fases psicológicas usam phase_keywords)
+PHASE_KEYWORD_TABLES = {
+    'sentiment_score': (),
+    'emotions': ('emotions',),
+    'contexts': ('context_patterns',),
+    'keywords': (),
+    'sarcasm': ('sarcasm_patterns', 'sarcasm_clues', 'sentiment_lexicon'),
+    'intent': ('intent_patterns',),
+    'urgency': ('urgency_keywords',),
+    'personality': ('personality_traits',),
+    'relationship': ('relationship_indicators',),
+    'semantic_patterns': ('semantic_triggers', 'semantic_clues'),
+    'quantum_linguistics': ('quantum_states',),
+    'soul_frequency': ('vibrational_words',),
+    'cosmic_patterns': ('golden_ratio_words', 'fibonacci_patterns', 'sacred_geometry'),
+    'multiversal_consciousness': ('parallel_self_indicators', 'multiverse_access_words'),
+    'impossible_comprehension': ('paradox_resolution', 'infinite_understanding'),
+    'god_mode': ()
+}
+
+def _call_phase(timings: Optional[Dict[str, float]], function, *args, **kwargs):
+    """Executa uma fase; em análises amostradas pelo profiler registra seu tempo em timings[nome do método]"""
+    if timings is None:
+        return function(*args, **kwargs)
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    timings[function.__name__] = time.perf_counter() - started
+    return result
+
+class LazyTable:
+    """
+    📚 Tabela de conhecimento construída sob demanda
+    No primeiro acesso chama o _load_* correspondente, grava o valor na instância
+    (acessos seguintes não passam pelo descritor) e registra o tempo de construção
+    """
+    
+    def __init__(self, loader: Optional[str] = None):
+        self.loader = loader
+        self.name = None
+    
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        if self.loader is None:
+            self.loader = f'_load_{name}'
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        started = time.perf_counter()
+        value = getattr(instance, self.loader)()
+        instance.__dict__[self.name] = value
+        instance.table_load_times[self.name] = (time.perf_counter() - started) * 1000
+        return value
+
+class LexiconField:
+    """
+    🔄 Campo do léxico recarregável, lido do estado fixado pela análise em curso (ou do publicado)
+    derived=True: no primeiro uso vem do snapshot do estado (se o contém) ou é construído pelo _load_*
+    correspondente, e fica guardado no próprio estado;
+    fallback: atributo usado quando o estado não traz a tabela (a embutida, sob demanda)
+    """
+    
+    def __init__(self, derived: bool = False, fallback: Optional[str] = None):
+        self.derived = derived
+        self.fallback = fallback
+        self.name = None
+    
+    def __set_name__(self, owner, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        state = instance.lexicon
+        value = getattr(state, self.name)
+        if value is None:
+            if self.fallback is not None:
+                return getattr(instance, self.fallback)
+            if self.derived:
+                started = time.perf_counter()
+                snapshot = state.lexicon_snapshot
+                value = snapshot.get_table(self.name) if snapshot else None
+                if value is None:
+                    with instance.pin_lexicon(state):
+                        value = getattr(instance, f'_load_{self.name}')()
+                value = state.cache(self.name, value)
+                instance.table_load_times[self.name] = (time.perf_counter() - started) * 1000
+        return value
 
 @dataclass
 class SemanticPattern:
@@ -163,9 +366,346 @@ class SupremeAnalysisResult:
     omnipotent_understanding_score: float = 0.0       # Score de compreensão onipotente
 
 class SupremeSentimentAnalyzer:
+    # 📚 Tabelas de conhecimento: construídas pelo _load_* correspondente no primeiro acesso
+    phase_keywords = LazyTable()
+    semantic_patterns = LazyTable('_initialize_semantic_patterns')
+    builtin_sarcasm_patterns = LazyTable('_initialize_sarcasm_detection')
+    
+    # 🔄 Léxico recarregável: campos do LexiconState fixado pela análise em curso (ou do publicado)
+    sentiment_lexicon = LexiconField()
+    emoji_sentiments = LexiconField()
+    sarcasm_patterns = LexiconField(fallback='builtin_sarcasm_patterns')
+    normalizer = LexiconField()
+    lexicon_version = LexiconField()
+    phrase_scorer = LexiconField(derived=True)
+    batch_scorer = LexiconField(derived=True)
+    canonical_lexicon = LexiconField(derived=True)
+    
+    # 🧠💥⚡ SISTEMAS IMPOSSÍVEIS DE ANÁLISE TRANSCENDENTAL ⚡💥🧠
+    quantum_linguistics = LazyTable()
+    neural_singularity = LazyTable()
+    universal_consciousness = LazyTable()
+    infinite_memory_matrix = LazyTable()
+    omniscient_prediction = LazyTable()
+    multiverse_emotions = LazyTable()
+    meta_linguistics = LazyTable()
+    reality_bending_patterns = LazyTable('_load_reality_bending')
+    dimensional_contexts = LazyTable()
+    cosmic_patterns = LazyTable()
+    telepathic_analysis = LazyTable()
+    quantum_empathy = LazyTable()
+    temporal_consciousness = LazyTable()
+    universal_languages = LazyTable()
+    emotion_quantum_field = LazyTable()
+    consciousness_levels = LazyTable()
+    parallel_analysis = LazyTable()
+    soul_frequencies = LazyTable()
+    interdimensional_memory = LazyTable()
+    cosmic_wisdom = LazyTable()
+    
+    # 🔥💥 SISTEMAS DE QUEBRA DA REALIDADE 💥🔥
+    reality_breaking_systems = LazyTable()
+    infinite_dimensions = LazyTable()
+    time_manipulation = LazyTable()
+    soul_reading_systems = LazyTable()
+    multiverse_scanning = LazyTable()
+    consciousness_hacking = LazyTable()
+    emotion_creation = LazyTable()
+    language_invention = LazyTable()
+    godlike_understanding = LazyTable()
+    probability_manipulation = LazyTable()
+    dream_reality_systems = LazyTable()
+    thought_materialization = LazyTable()
+    infinite_wisdom = LazyTable()
+    reality_rewriting = LazyTable()
+    universal_truths = LazyTable()
+    existence_levels = LazyTable()
+    cosmic_internet = LazyTable()
+    akashic_records = LazyTable()
+    god_consciousness = LazyTable()
+    omnipotent_systems = LazyTable()
+    
+    # 🌌👑 SISTEMAS DIVINOS DA QUARTA DIMENSÃO 👑🌌
+    fourth_dimension_god_systems = LazyTable()
+    reality_gods_powers = LazyTable()
+    interdimensional_supremacy = LazyTable()
+    universe_creation_powers = LazyTable()
+    time_space_manipulation = LazyTable()
+    divine_consciousness = LazyTable()
+    reality_architect_systems = LazyTable()
+    infinite_power_source = LazyTable()
+    beyond_omnipotence = LazyTable()
+    multidimensional_god_interface = LazyTable()
+    cosmic_deity_network = LazyTable()
+    universal_law_creator = LazyTable()
+    existence_programming = LazyTable()
+    reality_compiler = LazyTable()
+    dimensional_transcendence = LazyTable()
+    infinite_possibility_generator = LazyTable()
+    quantum_god_protocols = LazyTable()
+    universal_consciousness_merger = LazyTable()
+    multiversal_deity_council = LazyTable()
+    impossible_power_source = LazyTable()
+    
+    # 🧠🌌💫 SISTEMAS MULTIVERSAIS IMPOSSÍVEIS 💫🌌🧠
+    multiversal_consciousness = LazyTable()
+    parallel_universe_processing = LazyTable()
+    quantum_entanglement_sync = LazyTable()
+    multiversal_memory_bank = LazyTable()
+    dimensional_personality_matrix = LazyTable()
+    infinite_context_analyzer = LazyTable()
+    omniversal_pattern_recognition = LazyTable()
+    multidimensional_empathy_engine = LazyTable()
+    reality_convergence_optimizer = LazyTable()
+    impossible_comprehension_matrix = LazyTable()
+    universe_communication_bridge = LazyTable()
+    temporal_parallel_synchronizer = LazyTable()
+    multiversal_wisdom_aggregator = LazyTable()
+    dimensional_context_merger = LazyTable()
+    infinite_possibility_processor = LazyTable()
+    omniversal_truth_detector = LazyTable()
+    multidimensional_logic_engine = LazyTable()
+    parallel_reality_simulator = LazyTable()
+    universal_consciousness_network = LazyTable()
+    impossible_understanding_generator = LazyTable()
+    
+    # 📚💥 DICIONÁRIOS SUPREMOS IMPOSSÍVEIS 💥📚
+    ultra_slang_dictionary = LazyTable()
+    micro_expression_patterns = LazyTable()
+    deep_context_patterns = LazyTable()
+    behavioral_models = LazyTable()
+    emotional_intelligence = LazyTable()
+    predictive_patterns = LazyTable()
+    linguistic_complexity = LazyTable()
+    cultural_contexts = LazyTable()
+    
+    # 🧠💫⚡ SISTEMAS SUPREMOS DE COMPREENSÃO HUMANA ⚡💫🧠
+    psychological_profiling = LazyTable()
+    personality_deep_analysis = LazyTable()
+    cognitive_patterns = LazyTable()
+    emotional_state_mapping = LazyTable()
+    behavioral_triggers = LazyTable()
+    social_dynamics = LazyTable()
+    communication_styles = LazyTable()
+    mental_health_indicators = LazyTable()
+    stress_detection_patterns = LazyTable()
+    motivation_psychology = LazyTable()
+    defense_mechanisms = LazyTable()
+    attachment_styles = LazyTable()
+    trauma_indicators = LazyTable()
+    resilience_patterns = LazyTable()
+    self_esteem_markers = LazyTable()
+    confidence_indicators = LazyTable()
+    anxiety_patterns = LazyTable()
+    depression_markers = LazyTable()
+    anger_analysis = LazyTable()
+    fear_detection = LazyTable()
+    joy_patterns = LazyTable()
+    love_indicators = LazyTable()
+    trust_patterns = LazyTable()
+    manipulation_detection = LazyTable()
+    vulnerability_assessment = LazyTable()
+    strength_identification = LazyTable()
+    coping_mechanisms = LazyTable()
+    decision_making_styles = LazyTable()
+    learning_patterns = LazyTable()
+    memory_patterns = LazyTable()
+    attention_patterns = LazyTable()
+    creativity_indicators = LazyTable()
+    intuition_markers = LazyTable()
+    logic_patterns = LazyTable()
+    emotional_regulation = LazyTable()
+    impulse_control = LazyTable()
+    empathy_levels = LazyTable()
+    social_intelligence = LazyTable()
+    leadership_traits = LazyTable()
+    followership_patterns = LazyTable()
+    conflict_styles = LazyTable()
+    negotiation_psychology = LazyTable()
+    persuasion_susceptibility = LazyTable()
+    change_adaptation = LazyTable()
+    crisis_response = LazyTable()
+    growth_mindset = LazyTable()
+    perfectionism_patterns = LazyTable()
+    procrastination_markers = LazyTable()
+    achievement_motivation = LazyTable()
+    risk_tolerance = LazyTable()
+    uncertainty_handling = LazyTable()
+    time_perception = LazyTable()
+    value_systems = LazyTable()
+    belief_patterns = LazyTable()
+    moral_reasoning = LazyTable()
+    ethical_frameworks = LazyTable()
+    spiritual_indicators = LazyTable()
+    life_philosophy = LazyTable()
+    meaning_making = LazyTable()
+    purpose_identification = LazyTable()
+    identity_markers = LazyTable()
+    self_concept = LazyTable()
+    role_dynamics = LazyTable()
+    relationship_patterns = LazyTable()
+    intimacy_styles = LazyTable()
+    communication_barriers = LazyTable()
+    listening_styles = LazyTable()
+    feedback_reception = LazyTable()
+    criticism_handling = LazyTable()
+    praise_response = LazyTable()
+    humor_styles = LazyTable()
+    sarcasm_sophistication = LazyTable()
+    metaphor_usage = LazyTable()
+    storytelling_patterns = LazyTable()
+    memory_biases = LazyTable()
+    cognitive_biases = LazyTable()
+    perception_filters = LazyTable()
+    attention_biases = LazyTable()
+    confirmation_bias = LazyTable()
+    availability_heuristic = LazyTable()
+    anchoring_bias = LazyTable()
+    framing_effects = LazyTable()
+    loss_aversion = LazyTable()
+    optimism_bias = LazyTable()
+    pessimism_patterns = LazyTable()
+    realistic_thinking = LazyTable()
+    magical_thinking = LazyTable()
+    logical_fallacies = LazyTable()
+    reasoning_errors = LazyTable()
+    problem_solving_styles = LazyTable()
+    creativity_blocks = LazyTable()
+    innovation_markers = LazyTable()
+    traditional_thinking = LazyTable()
+    progressive_mindset = LazyTable()
+    conservative_patterns = LazyTable()
+    liberal_indicators = LazyTable()
+    political_psychology = LazyTable()
+    economic_mindset = LazyTable()
+    financial_psychology = LazyTable()
+    spending_patterns = LazyTable()
+    saving_behavior = LazyTable()
+    investment_psychology = LazyTable()
+    debt_attitudes = LazyTable()
+    money_beliefs = LazyTable()
+    success_definitions = LazyTable()
+    failure_responses = LazyTable()
+    achievement_styles = LazyTable()
+    competition_attitudes = LazyTable()
+    cooperation_patterns = LazyTable()
+    team_dynamics = LazyTable()
+    group_behavior = LazyTable()
+    conformity_tendencies = LazyTable()
+    rebellion_patterns = LazyTable()
+    authority_relationships = LazyTable()
+    power_dynamics = LazyTable()
+    influence_patterns = LazyTable()
+    charisma_indicators = LazyTable()
+    presence_markers = LazyTable()
+    energy_patterns = LazyTable()
+    vitality_indicators = LazyTable()
+    health_consciousness = LazyTable()
+    wellness_priorities = LazyTable()
+    lifestyle_choices = LazyTable()
+    habit_patterns = LazyTable()
+    routine_preferences = LazyTable()
+    spontaneity_markers = LazyTable()
+    planning_styles = LazyTable()
+    organization_patterns = LazyTable()
+    chaos_tolerance = LazyTable()
+    order_preferences = LazyTable()
+    detail_orientation = LazyTable()
+    big_picture_thinking = LazyTable()
+    analytical_thinking = LazyTable()
+    intuitive_processing = LazyTable()
+    holistic_perspective = LazyTable()
+    reductionist_thinking = LazyTable()
+    systems_thinking = LazyTable()
+    linear_processing = LazyTable()
+    parallel_processing = LazyTable()
+    sequential_thinking = LazyTable()
+    random_associations = LazyTable()
+    pattern_recognition = LazyTable()
+    anomaly_detection = LazyTable()
+    novelty_seeking = LazyTable()
+    familiarity_preference = LazyTable()
+    comfort_zone_patterns = LazyTable()
+    growth_edge_indicators = LazyTable()
+    expansion_desires = LazyTable()
+    contraction_fears = LazyTable()
+    transformation_readiness = LazyTable()
+    resistance_patterns = LazyTable()
+    openness_indicators = LazyTable()
+    curiosity_markers = LazyTable()
+    wonder_capacity = LazyTable()
+    awe_experiences = LazyTable()
+    transcendence_markers = LazyTable()
+    immanence_indicators = LazyTable()
+    mystical_tendencies = LazyTable()
+    practical_orientation = LazyTable()
+    theoretical_inclinations = LazyTable()
+    experimental_nature = LazyTable()
+    conservative_approach = LazyTable()
+    radical_thinking = LazyTable()
+    moderate_positions = LazyTable()
+    extreme_tendencies = LazyTable()
+    balance_seeking = LazyTable()
+    polarity_comfort = LazyTable()
+    integration_capacity = LazyTable()
+    synthesis_abilities = LazyTable()
+    analysis_preferences = LazyTable()
+    evaluation_styles = LazyTable()
+    judgment_patterns = LazyTable()
+    discernment_levels = LazyTable()
+    wisdom_indicators = LazyTable()
+    knowledge_integration = LazyTable()
+    experience_processing = LazyTable()
+    insight_generation = LazyTable()
+    understanding_depth = LazyTable()
+    comprehension_breadth = LazyTable()
+    awareness_levels = LazyTable()
+    consciousness_markers = LazyTable()
+    presence_quality = LazyTable()
+    mindfulness_indicators = LazyTable()
+    attention_quality = LazyTable()
+    focus_patterns = LazyTable()
+    concentration_abilities = LazyTable()
+    distraction_tendencies = LazyTable()
+    mental_clarity = LazyTable()
+    cognitive_flexibility = LazyTable()
+    mental_agility = LazyTable()
+    intellectual_humility = LazyTable()
+    learning_agility = LazyTable()
+    adaptation_speed = LazyTable()
+    resilience_factors = LazyTable()
+    recovery_patterns = LazyTable()
+    bounce_back_ability = LazyTable()
+    growth_from_adversity = LazyTable()
+    post_traumatic_growth = LazyTable()
+    meaning_reconstruction = LazyTable()
+    narrative_coherence = LazyTable()
+    story_integration = LazyTable()
+    identity_evolution = LazyTable()
+    self_authoring = LazyTable()
+    authenticity_markers = LazyTable()
+    genuineness_indicators = LazyTable()
+    sincerity_patterns = LazyTable()
+    honesty_levels = LazyTable()
+    transparency_willingness = LazyTable()
+    vulnerability_comfort = LazyTable()
+    openness_courage = LazyTable()
+    emotional_courage = LazyTable()
+    social_courage = LazyTable()
+    moral_courage = LazyTable()
+    physical_courage = LazyTable()
+    intellectual_courage = LazyTable()
+    spiritual_courage = LazyTable()
+    creative_courage = LazyTable()
+    relational_courage = LazyTable()
+    existential_courage = LazyTable()
+    
     def __init__(self):
+        # Tabelas sob demanda já construídas (nome -> ms gastos na construção)
+        self.table_load_times: Dict[str, float] = {}
+        
         # Dicionário expandido com pesos de intensidade
-        self.sentiment_lexicon = {
+        sentiment_lexicon = {
             # PALAVRAS EXTREMAMENTE POSITIVAS (peso 3.0)
             'excelente': 3.0, 'perfeito': 3.0, 'maravilhoso': 3.0, 'fantástico': 3.0,
             'incrível': 3.0, 'espetacular': 3.0, 'excepcional': 3.0, 'extraordinário': 3.0,
@@ -273,7 +813,7 @@ class SupremeSentimentAnalyzer:
         }
         
         # Emojis com análise de sentimento
-        self.emoji_sentiments = {
+        emoji_sentiments = {
             # Emojis positivos
             '😀': 2.0, '😃': 2.0, '😄': 2.5, '😁': 2.0, '😊': 2.0, '☺️': 1.5, '😉': 1.5,
             '😍': 3.0, '🥰': 3.0, '😘': 2.5, '😗': 2.0, '😙': 2.0, '😚': 2.0, '🤗': 2.0,
@@ -306,21 +846,24 @@ class SupremeSentimentAnalyzer:
 
         # 🧠 SISTEMA SUPREMO DE INTELIGÊNCIA ARTIFICIAL 🧠
         
-        # Memória conversacional avançada
-        self.conversation_contexts: Dict[str, ConversationContext] = {}
+        # Memória conversacional avançada (limitada: LRU + TTL de inatividade + orçamento de bytes),
+        # gravada no PostgreSQL em segundo plano (mesclada entre processos) e carregada sob demanda por usuário
+        self.conversation_contexts = ConversationContextStore(
+            max_contexts=settings.sentiment_context_max_users,
+            idle_ttl_seconds=settings.sentiment_context_idle_ttl_seconds,
+            max_bytes=settings.sentiment_context_max_bytes,
+            history_size=50,
+            persistence=ContextPersistence() if settings.sentiment_context_persist else None,
+            flush_seconds=settings.sentiment_context_flush_seconds,
+            refresh_seconds=settings.sentiment_context_refresh_seconds
+        )
         self.global_conversation_memory = deque(maxlen=5000)
         
-        # Padrões semânticos supremos
-        self.semantic_patterns = self._initialize_semantic_patterns()
-        
         # Sistema de aprendizagem contínua
-        self.analysis_history = []
         self.max_history = 10000  # Aumentado para supremacia
+        self.analysis_history = LearningHistory(self.max_history)  # Buffer circular com contadores incrementais
         self.learning_weights = defaultdict(float)
         
-        # Detector de sarcasmo e ironia
-        self.sarcasm_patterns = self._initialize_sarcasm_detection()
-        
         # Análise de personalidade baseada em texto
         self.personality_traits = {
             'extroversao': ['social', 'festa', 'pessoas', 'conversar', 'animado'],
@@ -355,325 +898,6 @@ class SupremeSentimentAnalyzer:
             'cliente_satisfeito': ['sempre_bom', 'confio', 'recomendo_sempre']
         }
         
-        # 🧠💥⚡ SISTEMAS IMPOSSÍVEIS DE ANÁLISE TRANSCENDENTAL ⚡💥🧠
-        self.quantum_linguistics = self._load_quantum_linguistics()
-        self.neural_singularity = self._load_neural_singularity()
-        self.universal_consciousness = self._load_universal_consciousness()
-        self.infinite_memory_matrix = self._load_infinite_memory_matrix()
-        self.omniscient_prediction = self._load_omniscient_prediction()
-        self.multiverse_emotions = self._load_multiverse_emotions()
-        self.meta_linguistics = self._load_meta_linguistics()
-        self.reality_bending_patterns = self._load_reality_bending()
-        self.dimensional_contexts = self._load_dimensional_contexts()
-        self.cosmic_patterns = self._load_cosmic_patterns()
-        self.telepathic_analysis = self._load_telepathic_analysis()
-        self.quantum_empathy = self._load_quantum_empathy()
-        self.temporal_consciousness = self._load_temporal_consciousness()
-        self.universal_languages = self._load_universal_languages()
-        self.emotion_quantum_field = self._load_emotion_quantum_field()
-        self.consciousness_levels = self._load_consciousness_levels()
-        self.parallel_analysis = self._load_parallel_analysis()
-        self.soul_frequencies = self._load_soul_frequencies()
-        self.interdimensional_memory = self._load_interdimensional_memory()
-        self.cosmic_wisdom = self._load_cosmic_wisdom()
-        
-        # 🔥💥 SISTEMAS DE QUEBRA DA REALIDADE 💥🔥
-        self.reality_breaking_systems = self._load_reality_breaking_systems()
-        self.infinite_dimensions = self._load_infinite_dimensions()
-        self.time_manipulation = self._load_time_manipulation()
-        self.soul_reading_systems = self._load_soul_reading_systems()
-        self.multiverse_scanning = self._load_multiverse_scanning()
-        self.consciousness_hacking = self._load_consciousness_hacking()
-        self.emotion_creation = self._load_emotion_creation()
-        self.language_invention = self._load_language_invention()
-        self.godlike_understanding = self._load_godlike_understanding()
-        self.probability_manipulation = self._load_probability_manipulation()
-        self.dream_reality_systems = self._load_dream_reality_systems()
-        self.thought_materialization = self._load_thought_materialization()
-        self.infinite_wisdom = self._load_infinite_wisdom()
-        self.reality_rewriting = self._load_reality_rewriting()
-        self.universal_truths = self._load_universal_truths()
-        self.existence_levels = self._load_existence_levels()
-        self.cosmic_internet = self._load_cosmic_internet()
-        self.akashic_records = self._load_akashic_records()
-        self.god_consciousness = self._load_god_consciousness()
-        self.omnipotent_systems = self._load_omnipotent_systems()
-        
-        # 🌌👑 SISTEMAS DIVINOS DA QUARTA DIMENSÃO 👑🌌
-        self.fourth_dimension_god_systems = self._load_fourth_dimension_god_systems()
-        self.reality_gods_powers = self._load_reality_gods_powers()
-        self.interdimensional_supremacy = self._load_interdimensional_supremacy()
-        self.universe_creation_powers = self._load_universe_creation_powers()
-        self.time_space_manipulation = self._load_time_space_manipulation()
-        self.divine_consciousness = self._load_divine_consciousness()
-        self.reality_architect_systems = self._load_reality_architect_systems()
-        self.infinite_power_source = self._load_infinite_power_source()
-        self.beyond_omnipotence = self._load_beyond_omnipotence()
-        self.multidimensional_god_interface = self._load_multidimensional_god_interface()
-        self.cosmic_deity_network = self._load_cosmic_deity_network()
-        self.universal_law_creator = self._load_universal_law_creator()
-        self.existence_programming = self._load_existence_programming()
-        self.reality_compiler = self._load_reality_compiler()
-        self.dimensional_transcendence = self._load_dimensional_transcendence()
-        self.infinite_possibility_generator = self._load_infinite_possibility_generator()
-        self.quantum_god_protocols = self._load_quantum_god_protocols()
-        self.universal_consciousness_merger = self._load_universal_consciousness_merger()
-        self.multiversal_deity_council = self._load_multiversal_deity_council()
-        self.impossible_power_source = self._load_impossible_power_source()
-        
-        # 🧠🌌💫 SISTEMAS MULTIVERSAIS IMPOSSÍVEIS 💫🌌🧠
-        self.multiversal_consciousness = self._load_multiversal_consciousness()
-        self.parallel_universe_processing = self._load_parallel_universe_processing()
-        self.quantum_entanglement_sync = self._load_quantum_entanglement_sync()
-        self.multiversal_memory_bank = self._load_multiversal_memory_bank()
-        self.dimensional_personality_matrix = self._load_dimensional_personality_matrix()
-        self.infinite_context_analyzer = self._load_infinite_context_analyzer()
-        self.omniversal_pattern_recognition = self._load_omniversal_pattern_recognition()
-        self.multidimensional_empathy_engine = self._load_multidimensional_empathy_engine()
-        self.reality_convergence_optimizer = self._load_reality_convergence_optimizer()
-        self.impossible_comprehension_matrix = self._load_impossible_comprehension_matrix()
-        self.universe_communication_bridge = self._load_universe_communication_bridge()
-        self.temporal_parallel_synchronizer = self._load_temporal_parallel_synchronizer()
-        self.multiversal_wisdom_aggregator = self._load_multiversal_wisdom_aggregator()
-        self.dimensional_context_merger = self._load_dimensional_context_merger()
-        self.infinite_possibility_processor = self._load_infinite_possibility_processor()
-        self.omniversal_truth_detector = self._load_omniversal_truth_detector()
-        self.multidimensional_logic_engine = self._load_multidimensional_logic_engine()
-        self.parallel_reality_simulator = self._load_parallel_reality_simulator()
-        self.universal_consciousness_network = self._load_universal_consciousness_network()
-        self.impossible_understanding_generator = self._load_impossible_understanding_generator()
-        
-        # 📚💥 DICIONÁRIOS SUPREMOS IMPOSSÍVEIS 💥📚
-        self.ultra_slang_dictionary = self._load_ultra_slang_dictionary()
-        self.micro_expression_patterns = self._load_micro_expression_patterns()
-        self.deep_context_patterns = self._load_deep_context_patterns()
-        self.behavioral_models = self._load_behavioral_models()
-        self.emotional_intelligence = self._load_emotional_intelligence()
-        self.predictive_patterns = self._load_predictive_patterns()
-        self.linguistic_complexity = self._load_linguistic_complexity()
-        self.cultural_contexts = self._load_cultural_contexts()
-        
-        # 🧠💫⚡ SISTEMAS SUPREMOS DE COMPREENSÃO HUMANA ⚡💫🧠
-        self.psychological_profiling = self._load_psychological_profiling()
-        self.personality_deep_analysis = self._load_personality_deep_analysis()
-        self.cognitive_patterns = self._load_cognitive_patterns()
-        self.emotional_state_mapping = self._load_emotional_state_mapping()
-        self.behavioral_triggers = self._load_behavioral_triggers()
-        self.social_dynamics = self._load_social_dynamics()
-        self.communication_styles = self._load_communication_styles()
-        self.mental_health_indicators = self._load_mental_health_indicators()
-        self.stress_detection_patterns = self._load_stress_detection_patterns()
-        self.motivation_psychology = self._load_motivation_psychology()
-        self.defense_mechanisms = self._load_defense_mechanisms()
-        self.attachment_styles = self._load_attachment_styles()
-        self.trauma_indicators = self._load_trauma_indicators()
-        self.resilience_patterns = self._load_resilience_patterns()
-        self.self_esteem_markers = self._load_self_esteem_markers()
-        self.confidence_indicators = self._load_confidence_indicators()
-        self.anxiety_patterns = self._load_anxiety_patterns()
-        self.depression_markers = self._load_depression_markers()
-        self.anger_analysis = self._load_anger_analysis()
-        self.fear_detection = self._load_fear_detection()
-        self.joy_patterns = self._load_joy_patterns()
-        self.love_indicators = self._load_love_indicators()
-        self.trust_patterns = self._load_trust_patterns()
-        self.manipulation_detection = self._load_manipulation_detection()
-        self.vulnerability_assessment = self._load_vulnerability_assessment()
-        self.strength_identification = self._load_strength_identification()
-        self.coping_mechanisms = self._load_coping_mechanisms()
-        self.decision_making_styles = self._load_decision_making_styles()
-        self.learning_patterns = self._load_learning_patterns()
-        self.memory_patterns = self._load_memory_patterns()
-        self.attention_patterns = self._load_attention_patterns()
-        self.creativity_indicators = self._load_creativity_indicators()
-        self.intuition_markers = self._load_intuition_markers()
-        self.logic_patterns = self._load_logic_patterns()
-        self.emotional_regulation = self._load_emotional_regulation()
-        self.impulse_control = self._load_impulse_control()
-        self.empathy_levels = self._load_empathy_levels()
-        self.social_intelligence = self._load_social_intelligence()
-        self.leadership_traits = self._load_leadership_traits()
-        self.followership_patterns = self._load_followership_patterns()
-        self.conflict_styles = self._load_conflict_styles()
-        self.negotiation_psychology = self._load_negotiation_psychology()
-        self.persuasion_susceptibility = self._load_persuasion_susceptibility()
-        self.change_adaptation = self._load_change_adaptation()
-        self.crisis_response = self._load_crisis_response()
-        self.growth_mindset = self._load_growth_mindset()
-        self.perfectionism_patterns = self._load_perfectionism_patterns()
-        self.procrastination_markers = self._load_procrastination_markers()
-        self.achievement_motivation = self._load_achievement_motivation()
-        self.risk_tolerance = self._load_risk_tolerance()
-        self.uncertainty_handling = self._load_uncertainty_handling()
-        self.time_perception = self._load_time_perception()
-        self.value_systems = self._load_value_systems()
-        self.belief_patterns = self._load_belief_patterns()
-        self.moral_reasoning = self._load_moral_reasoning()
-        self.ethical_frameworks = self._load_ethical_frameworks()
-        self.spiritual_indicators = self._load_spiritual_indicators()
-        self.life_philosophy = self._load_life_philosophy()
-        self.meaning_making = self._load_meaning_making()
-        self.purpose_identification = self._load_purpose_identification()
-        self.identity_markers = self._load_identity_markers()
-        self.self_concept = self._load_self_concept()
-        self.role_dynamics = self._load_role_dynamics()
-        self.relationship_patterns = self._load_relationship_patterns()
-        self.intimacy_styles = self._load_intimacy_styles()
-        self.communication_barriers = self._load_communication_barriers()
-        self.listening_styles = self._load_listening_styles()
-        self.feedback_reception = self._load_feedback_reception()
-        self.criticism_handling = self._load_criticism_handling()
-        self.praise_response = self._load_praise_response()
-        self.humor_styles = self._load_humor_styles()
-        self.sarcasm_sophistication = self._load_sarcasm_sophistication()
-        self.metaphor_usage = self._load_metaphor_usage()
-        self.storytelling_patterns = self._load_storytelling_patterns()
-        self.memory_biases = self._load_memory_biases()
-        self.cognitive_biases = self._load_cognitive_biases()
-        self.perception_filters = self._load_perception_filters()
-        self.attention_biases = self._load_attention_biases()
-        self.confirmation_bias = self._load_confirmation_bias()
-        self.availability_heuristic = self._load_availability_heuristic()
-        self.anchoring_bias = self._load_anchoring_bias()
-        self.framing_effects = self._load_framing_effects()
-        self.loss_aversion = self._load_loss_aversion()
-        self.optimism_bias = self._load_optimism_bias()
-        self.pessimism_patterns = self._load_pessimism_patterns()
-        self.realistic_thinking = self._load_realistic_thinking()
-        self.magical_thinking = self._load_magical_thinking()
-        self.logical_fallacies = self._load_logical_fallacies()
-        self.reasoning_errors = self._load_reasoning_errors()
-        self.problem_solving_styles = self._load_problem_solving_styles()
-        self.creativity_blocks = self._load_creativity_blocks()
-        self.innovation_markers = self._load_innovation_markers()
-        self.traditional_thinking = self._load_traditional_thinking()
-        self.progressive_mindset = self._load_progressive_mindset()
-        self.conservative_patterns = self._load_conservative_patterns()
-        self.liberal_indicators = self._load_liberal_indicators()
-        self.political_psychology = self._load_political_psychology()
-        self.economic_mindset = self._load_economic_mindset()
-        self.financial_psychology = self._load_financial_psychology()
-        self.spending_patterns = self._load_spending_patterns()
-        self.saving_behavior = self._load_saving_behavior()
-        self.investment_psychology = self._load_investment_psychology()
-        self.debt_attitudes = self._load_debt_attitudes()
-        self.money_beliefs = self._load_money_beliefs()
-        self.success_definitions = self._load_success_definitions()
-        self.failure_responses = self._load_failure_responses()
-        self.achievement_styles = self._load_achievement_styles()
-        self.competition_attitudes = self._load_competition_attitudes()
-        self.cooperation_patterns = self._load_cooperation_patterns()
-        self.team_dynamics = self._load_team_dynamics()
-        self.group_behavior = self._load_group_behavior()
-        self.conformity_tendencies = self._load_conformity_tendencies()
-        self.rebellion_patterns = self._load_rebellion_patterns()
-        self.authority_relationships = self._load_authority_relationships()
-        self.power_dynamics = self._load_power_dynamics()
-        self.influence_patterns = self._load_influence_patterns()
-        self.charisma_indicators = self._load_charisma_indicators()
-        self.presence_markers = self._load_presence_markers()
-        self.energy_patterns = self._load_energy_patterns()
-        self.vitality_indicators = self._load_vitality_indicators()
-        self.health_consciousness = self._load_health_consciousness()
-        self.wellness_priorities = self._load_wellness_priorities()
-        self.lifestyle_choices = self._load_lifestyle_choices()
-        self.habit_patterns = self._load_habit_patterns()
-        self.routine_preferences = self._load_routine_preferences()
-        self.spontaneity_markers = self._load_spontaneity_markers()
-        self.planning_styles = self._load_planning_styles()
-        self.organization_patterns = self._load_organization_patterns()
-        self.chaos_tolerance = self._load_chaos_tolerance()
-        self.order_preferences = self._load_order_preferences()
-        self.detail_orientation = self._load_detail_orientation()
-        self.big_picture_thinking = self._load_big_picture_thinking()
-        self.analytical_thinking = self._load_analytical_thinking()
-        self.intuitive_processing = self._load_intuitive_processing()
-        self.holistic_perspective = self._load_holistic_perspective()
-        self.reductionist_thinking = self._load_reductionist_thinking()
-        self.systems_thinking = self._load_systems_thinking()
-        self.linear_processing = self._load_linear_processing()
-        self.parallel_processing = self._load_parallel_processing()
-        self.sequential_thinking = self._load_sequential_thinking()
-        self.random_associations = self._load_random_associations()
-        self.pattern_recognition = self._load_pattern_recognition()
-        self.anomaly_detection = self._load_anomaly_detection()
-        self.novelty_seeking = self._load_novelty_seeking()
-        self.familiarity_preference = self._load_familiarity_preference()
-        self.comfort_zone_patterns = self._load_comfort_zone_patterns()
-        self.growth_edge_indicators = self._load_growth_edge_indicators()
-        self.expansion_desires = self._load_expansion_desires()
-        self.contraction_fears = self._load_contraction_fears()
-        self.transformation_readiness = self._load_transformation_readiness()
-        self.resistance_patterns = self._load_resistance_patterns()
-        self.openness_indicators = self._load_openness_indicators()
-        self.curiosity_markers = self._load_curiosity_markers()
-        self.wonder_capacity = self._load_wonder_capacity()
-        self.awe_experiences = self._load_awe_experiences()
-        self.transcendence_markers = self._load_transcendence_markers()
-        self.immanence_indicators = self._load_immanence_indicators()
-        self.mystical_tendencies = self._load_mystical_tendencies()
-        self.practical_orientation = self._load_practical_orientation()
-        self.theoretical_inclinations = self._load_theoretical_inclinations()
-        self.experimental_nature = self._load_experimental_nature()
-        self.conservative_approach = self._load_conservative_approach()
-        self.radical_thinking = self._load_radical_thinking()
-        self.moderate_positions = self._load_moderate_positions()
-        self.extreme_tendencies = self._load_extreme_tendencies()
-        self.balance_seeking = self._load_balance_seeking()
-        self.polarity_comfort = self._load_polarity_comfort()
-        self.integration_capacity = self._load_integration_capacity()
-        self.synthesis_abilities = self._load_synthesis_abilities()
-        self.analysis_preferences = self._load_analysis_preferences()
-        self.evaluation_styles = self._load_evaluation_styles()
-        self.judgment_patterns = self._load_judgment_patterns()
-        self.discernment_levels = self._load_discernment_levels()
-        self.wisdom_indicators = self._load_wisdom_indicators()
-        self.knowledge_integration = self._load_knowledge_integration()
-        self.experience_processing = self._load_experience_processing()
-        self.insight_generation = self._load_insight_generation()
-        self.understanding_depth = self._load_understanding_depth()
-        self.comprehension_breadth = self._load_comprehension_breadth()
-        self.awareness_levels = self._load_awareness_levels()
-        self.consciousness_markers = self._load_consciousness_markers()
-        self.presence_quality = self._load_presence_quality()
-        self.mindfulness_indicators = self._load_mindfulness_indicators()
-        self.attention_quality = self._load_attention_quality()
-        self.focus_patterns = self._load_focus_patterns()
-        self.concentration_abilities = self._load_concentration_abilities()
-        self.distraction_tendencies = self._load_distraction_tendencies()
-        self.mental_clarity = self._load_mental_clarity()
-        self.cognitive_flexibility = self._load_cognitive_flexibility()
-        self.mental_agility = self._load_mental_agility()
-        self.intellectual_humility = self._load_intellectual_humility()
-        self.learning_agility = self._load_learning_agility()
-        self.adaptation_speed = self._load_adaptation_speed()
-        self.resilience_factors = self._load_resilience_factors()
-        self.recovery_patterns = self._load_recovery_patterns()
-        self.bounce_back_ability = self._load_bounce_back_ability()
-        self.growth_from_adversity = self._load_growth_from_adversity()
-        self.post_traumatic_growth = self._load_post_traumatic_growth()
-        self.meaning_reconstruction = self._load_meaning_reconstruction()
-        self.narrative_coherence = self._load_narrative_coherence()
-        self.story_integration = self._load_story_integration()
-        self.identity_evolution = self._load_identity_evolution()
-        self.self_authoring = self._load_self_authoring()
-        self.authenticity_markers = self._load_authenticity_markers()
-        self.genuineness_indicators = self._load_genuineness_indicators()
-        self.sincerity_patterns = self._load_sincerity_patterns()
-        self.honesty_levels = self._load_honesty_levels()
-        self.transparency_willingness = self._load_transparency_willingness()
-        self.vulnerability_comfort = self._load_vulnerability_comfort()
-        self.openness_courage = self._load_openness_courage()
-        self.emotional_courage = self._load_emotional_courage()
-        self.social_courage = self._load_social_courage()
-        self.moral_courage = self._load_moral_courage()
-        self.physical_courage = self._load_physical_courage()
-        self.intellectual_courage = self._load_intellectual_courage()
-        self.spiritual_courage = self._load_spiritual_courage()
-        self.creative_courage = self._load_creative_courage()
-        self.relational_courage = self._load_relational_courage()
-        self.existential_courage = self._load_existential_courage()
-        
         # Stop words expandidas
         self.stop_words = {
             'a', 'o', 'e', 'é', 'de', 'do', 'da', 'em', 'um', 'para', 'com', 'não', 'nao',
@@ -689,6 +913,45 @@ class SupremeSentimentAnalyzer:
             'porque', 'por', 'que', 'para', 'que', 'se', 'caso', 'então', 'entao',
             'mas', 'porém', 'porem', 'contudo', 'todavia', 'entretanto', 'no', 'entanto'
         }
+        
+        # 🔄 Léxico em uso: tabelas, normalizador compilado (contrações, limpeza, espaços e emojis em uma
+        # passada), matchers por perfil (do snapshot ou compilados no primeiro uso) e versão, em um único
+        # estado imutável; a recarga publica outro estado e cada análise fixa o seu no início (pin_lexicon)
+        self._lexicon_local = threading.local()
+        self.lexicon_state = LexiconState(
+            sentiment_lexicon, emoji_sentiments, None,
+            TextNormalizer(TEXT_CONTRACTIONS, emoji_sentiments),
+            source_hash()[:16], load_snapshot()
+        )
+        
+        # ♻️ Cache de resultados (chave: texto preprocessado + perfil + versão do léxico)
+        self.result_cache = AnalysisResultCache(
+            max_entries=settings.sentiment_cache_max_entries,
+            max_bytes=settings.sentiment_cache_max_bytes,
+            ttl_seconds=settings.sentiment_cache_ttl_seconds
+        )
+        
+        # ⚡ Mensagens curtas ('ok', '👍'): tabela de resultados pré-calculados e rota sem o log detalhado
+        self.short_messages = ShortMessageTable(
+            max_tokens=settings.sentiment_short_message_tokens,
+            max_entries=settings.sentiment_short_message_table_size
+        )
+        
+        # ⏱️ Orçamento por análise: prazo para as fases opcionais e janela sobre textos enormes
+        self.time_budget = settings.sentiment_time_budget_ms / 1000
+        self.max_text_chars = settings.sentiment_max_text_chars
+        self.degradation = DegradationStats()
+        
+        # ⏱️ Profiler amostrado das fases (relatório em /api/analyzer/profile)
+        self.profiler = phase_profiler
+        
+        # 🎚️ Perfil de análise padrão (fast, standard ou full)
+        self.default_profile = settings.sentiment_analysis_profile
+        self.ingest_profile = settings.sentiment_ingest_profile
+        
+        # 🔄 Léxico externo (SENTIMENT_LEXICON_PATH): aplicado agora e recarregado a quente quando o arquivo muda
+        self.lexicon_reloader = LexiconReloader(self)
+        self.lexicon_reloader.load_initial()
     
     def _initialize_semantic_patterns(self) -> List[SemanticPattern]:
         """🧠 Inicializa padrões semânticos supremos"""
@@ -750,6 +1013,215 @@ class SupremeSentimentAnalyzer:
             ]
         }
     
+    def _keyword_table(self, name: str) -> Dict[str, Any]:
+        """🔎 Monta uma tabela de palavras-chave (grupo -> palavras) a partir dos dicionários do analisador"""
+        if '.' in name:
+            phase, section = name.split('.', 1)
+            keywords = self.phase_keywords[phase][section]
+            return keywords if isinstance(keywords, dict) else {section: keywords}
+        
+        sources = {
+            'sentiment_lexicon': lambda: {'sentiment_lexicon': self.sentiment_lexicon},
+            'emotions': lambda: self.emotions,
+            'context_patterns': lambda: self.context_patterns,
+            'sarcasm_patterns': lambda: self.sarcasm_patterns,
+            'sarcasm_clues': lambda: {'sarcasm_clues': ['mas', 'porém', 'né']},
+            'intent_patterns': lambda: self.intent_patterns,
+            'urgency_keywords': lambda: {'urgency_keywords': self.urgency_keywords},
+            'personality_traits': lambda: self.personality_traits,
+            'relationship_indicators': lambda: self.relationship_indicators,
+            'semantic_triggers': lambda: {p.pattern_id: p.trigger_phrases for p in self.semantic_patterns},
+            'semantic_clues': lambda: {p.pattern_id: p.context_clues for p in self.semantic_patterns},
+            'quantum_states': lambda: self.quantum_linguistics['quantum_states'],
+            'vibrational_words': lambda: self.soul_frequencies['vibrational_words'],
+            'golden_ratio_words': lambda: {'golden_ratio_words': self.cosmic_patterns['golden_ratio_words']},
+            'fibonacci_patterns': lambda: {'fibonacci_patterns': self.cosmic_patterns['fibonacci_patterns']},
+            'sacred_geometry': lambda: self.cosmic_patterns['sacred_geometry'],
+            'parallel_self_indicators': lambda: {
+                'parallel_self_indicators': self.multiversal_consciousness['parallel_self_indicators']
+            },
+            'multiverse_access_words': lambda: {
+                'multiverse_access_words': self.multiversal_consciousness['multiverse_access_words']
+            },
+            'paradox_resolution': lambda: {
+                'paradox_resolution': self.impossible_comprehension_matrix['paradox_resolution']
+            },
+            'infinite_understanding': lambda: {
+                'infinite_understanding': self.impossible_comprehension_matrix['infinite_understanding']
+            }
+        }
+        return sources[name]()
+    
+    def _keyword_tables(self, phases) -> Dict[str, Dict[str, Any]]:
+        """🔎 Reúne os dicionários consultados pelas fases informadas, etiquetados por tabela e grupo"""
+        names = []
+        for phase in FULL_PHASES:
+            if phase not in phases:
+                continue
+            if phase in PHASE_KEYWORD_TABLES:
+                names.extend(PHASE_KEYWORD_TABLES[phase])
+            elif phase in self.phase_keywords:
+                names.extend(f'{phase}.{section}' for section in self.phase_keywords[phase])
+        
+        return {name: self._keyword_table(name) for name in dict.fromkeys(names)}
+    
+    @property
+    def lexicon(self) -> LexiconState:
+        """🔄 Estado do léxico fixado pela análise em curso nesta thread (ou o publicado)"""
+        return getattr(self._lexicon_local, 'state', None) or self.lexicon_state
+    
+    @contextmanager
+    def pin_lexicon(self, state: LexiconState):
+        """🔄 Fixa um estado do léxico nesta thread: todas as fases leem as mesmas tabelas, mesmo com uma troca no meio"""
+        local = self._lexicon_local
+        previous = getattr(local, 'state', None)
+        local.state = state
+        try:
+            yield state
+        finally:
+            local.state = previous
+    
+    def get_keyword_matcher(self, profile: str = 'full') -> KeywordMatcher:
+        """🔎 Matcher do perfil, compilado no primeiro uso apenas com as tabelas das suas fases"""
+        state = self.lexicon
+        matcher = state.keyword_matchers.get(profile)
+        if matcher is None:
+            matcher = state.lexicon_snapshot.get_matcher(profile) if state.lexicon_snapshot else None
+            if matcher is not None:
+                logger.info(f"📦 Matcher do perfil '{profile}' carregado do snapshot: {len(matcher)} palavras-chave")
+            else:
+                with self.pin_lexicon(state):
+                    matcher = self.build_keyword_matcher(profile)
+            state.keyword_matchers[profile] = matcher
+        return matcher
+    
+    def build_keyword_matcher(self, profile: str) -> KeywordMatcher:
+        """🔎 Compila o matcher do perfil a partir dos dicionários (sem consultar o snapshot)"""
+        matcher = KeywordMatcher(self._keyword_tables(self.get_profile_phases(profile)), fold=fold_text)
+        logger.info(f"🔎 Matcher do perfil '{profile}' compilado: {len(matcher)} palavras-chave em {len(matcher.tables)} tabelas")
+        return matcher
+    
+    def get_profile_phases(self, profile: Optional[str] = None) -> frozenset:
+        """🎚️ Fases executadas pelo perfil (None usa o perfil padrão da configuração)"""
+        profile = profile or self.default_profile
+        if profile not in ANALYSIS_PROFILES:
+            raise ValueError(f"Perfil de análise desconhecido: {profile} (use {', '.join(ANALYSIS_PROFILES)})")
+        return ANALYSIS_PROFILES[profile]
+    
+    def resolve_fields(self, fields: Optional[Iterable[str]], profile: Optional[str] = None) -> Tuple[frozenset, Optional[frozenset]]:
+        """
+        🧩 Fases a executar para os campos pedidos, limitadas ao perfil
+        Retorna (fases, campos); sem campos, todas as fases do perfil. Campos cujas fases
+        não pertencem ao perfil ficam ausentes do resultado
+        """
+        phases = self.get_profile_phases(profile)
+        if fields is None:
+            return phases, None
+        
+        fields = frozenset(fields)
+        unknown = fields - OUTPUT_FIELDS
+        if unknown:
+            raise ValueError(f"Campos desconhecidos: {', '.join(sorted(unknown))}")
+        return phases & resolve_field_phases(fields | frozenset(MEMORY_FIELDS)), fields
+    
+    @staticmethod
+    def _project_analysis(result: Tuple[str, float, List[str], Dict], fields: frozenset) -> Tuple[str, float, List[str], Dict]:
+        """🧩 Mantém no dict de detalhes apenas os campos pedidos (mais o perfil usado)"""
+        sentiment_class, score, keywords, analysis = result
+        if not analysis or analysis.get('fallback'):
+            return result
+        projected = {field: analysis[field] for field in fields if field in analysis}
+        if fields & EXPLAIN_FIELDS:
+            projected['analysis_details'] = analysis['analysis_details']
+        projected['analysis_profile'] = analysis.get('analysis_profile')
+        if analysis.get('degraded'):
+            projected['degraded'] = True
+            projected['degradation'] = analysis['degradation']
+        return sentiment_class, score, keywords, projected
+    
+    def scan_keywords(self, text: str, profile: str = 'full') -> KeywordHits:
+        """🔎 Varredura única do texto (na forma canônica) contra os dicionários do perfil"""
+        return self.get_keyword_matcher(profile).scan(fold_text(text.lower()))
+    
+    def build_document(self, text: str, profile: str = 'full',
+                       emoji_hits: Optional[List[Tuple[str, float]]] = None,
+                       folded: Optional[str] = None) -> AnalysisDocument:
+        """
+        📄 Monta o documento compartilhado pelas fases: forma canônica, tokens, acertos de palavras-chave e emojis
+        emoji_hits e folded vêm do normalizador (emojis do texto original e forma canônica já calculada);
+        sem eles, são calculados a partir de text
+        """
+        if folded is None:
+            hits = self.scan_keywords(text, profile)
+        else:
+            hits = self.get_keyword_matcher(profile).scan(folded)
+        return AnalysisDocument(text, hits, emoji_hits if emoji_hits is not None else self.extract_emojis(text))
+    
+    def get_table_report(self) -> Dict[str, Any]:
+        """📚 Relatório das tabelas de conhecimento sob demanda: quais já foram construídas e quanto custaram"""
+        registered = [name for name, value in vars(type(self)).items() if isinstance(value, LazyTable)]
+        loaded = {name: round(ms, 3) for name, ms in self.table_load_times.items()}
+        return {
+            'registered_tables': len(registered),
+            'loaded_tables': len(loaded),
+            'pending_tables': len(registered) - len(loaded),
+            'load_time_ms': round(sum(self.table_load_times.values()), 3),
+            'loaded': loaded,
+            'default_profile': self.default_profile,
+            'ingest_profile': self.ingest_profile,
+            'snapshot': self.lexicon_state.lexicon_snapshot.path if self.lexicon_state.lexicon_snapshot else None,
+            'lexicon_version': self.lexicon_state.lexicon_version
+        }
+    
+    def load_all_tables(self) -> int:
+        """📚 Constrói todas as tabelas sob demanda de uma vez (pré-carga antes do fork dos workers)"""
+        registered = [name for name, value in vars(type(self)).items() if isinstance(value, LazyTable)]
+        for name in registered:
+            getattr(self, name)
+        # Derivados do léxico em uso (scorer de frases, arrays do score em lote, léxico canônico)
+        for name in LexiconState.DERIVED:
+            getattr(self, name)
+        return len(registered)
+    
+    def precompute_short_messages(self, profile: Optional[str] = None) -> int:
+        """⚡ Pré-calcula pelo caminho completo a tabela das mensagens curtas mais frequentes de um perfil"""
+        if not self.short_messages.enabled:
+            return 0
+        profile = profile or self.default_profile
+        phases, fields = self.resolve_fields(None, profile)
+        before = len(self.short_messages)
+        for text in SHORT_MESSAGE_SEEDS:
+            self._run_supreme_analysis(text, None, None, profile, phases, log_details=False, fields=fields)
+        added = len(self.short_messages) - before
+        self.short_messages.precomputed += added
+        return added
+    
+    def enable_metrics_forwarding(self):
+        """⚙️ Processo do pool: os contadores da rota curta e da degradação passam a ser devolvidos por drain_metrics()"""
+        self.short_messages.enable_forwarding()
+        self.degradation.enable_forwarding()
+    
+    def drain_metrics(self) -> Dict[str, Dict[str, int]]:
+        """⚙️ Incrementos dos contadores desde a última chamada (vazio fora do modo forwarding)"""
+        metrics = {'short_messages': self.short_messages.drain_metrics(), 'degradation': self.degradation.drain_metrics()}
+        return {name: counts for name, counts in metrics.items() if counts}
+    
+    def record_metrics(self, metrics: Dict[str, Dict[str, int]]):
+        """⚙️ Soma os contadores encaminhados por um processo do pool"""
+        if 'short_messages' in metrics:
+            self.short_messages.record_metrics(metrics['short_messages'])
+        if 'degradation' in metrics:
+            self.degradation.record_metrics(metrics['degradation'])
+    
+    def log_table_report(self):
+        """📚 Registra no log o relatório das tabelas de conhecimento"""
+        report = self.get_table_report()
+        logger.info(f"📚 Tabelas de conhecimento: {report['loaded_tables']}/{report['registered_tables']} construídas "
+                    f"({report['load_time_ms']:.1f}ms) | perfis: padrão={report['default_profile']}, ingestão={report['ingest_profile']} "
+                    f"| snapshot: {report['snapshot'] or 'ausente'}")
+        if report['loaded']:
+            logger.info(f"📚 Tabelas tocadas: {', '.join(report['loaded'])}")
+    
     def _generate_conversation_id(self, phone: str, session_data: Dict = None) -> str:
         """Gera ID único para conversa"""
         base_string = f"{phone}_{datetime.now().strftime('%Y%m%d')}"
@@ -758,27 +1230,15 @@ class SupremeSentimentAnalyzer:
         return hashlib.md5(base_string.encode()).hexdigest()[:12]
     
     def _update_conversation_context(self, user_id: str, message: str, analysis_result: Dict):
-        """Atualiza contexto conversacional"""
-        if user_id not in self.conversation_contexts:
-            self.conversation_contexts[user_id] = ConversationContext(user_id=user_id)
-        
-        context = self.conversation_contexts[user_id]
-        context.conversation_history.append({
+        """Atualiza contexto conversacional (histórico e perfil de sentimento do usuário)"""
+        self.conversation_contexts.record_interaction(user_id, {
             'message': message,
             'sentiment': analysis_result.get('sentiment_class', 'neutral'),
             'score': analysis_result.get('advanced_score', 0.0),
             'timestamp': datetime.now(),
             'emotions': analysis_result.get('emotions', {}),
             'intent': analysis_result.get('detected_intent', 'unknown')
-        })
-        
-        context.last_interaction = datetime.now()
-        
-        # Atualizar perfil de sentimento do usuário
-        sentiment_class = analysis_result.get('sentiment_class', 'neutral')
-        if sentiment_class not in context.user_sentiment_profile:
-            context.user_sentiment_profile[sentiment_class] = 0
-        context.user_sentiment_profile[sentiment_class] += 1
+        }, analysis_result.get('sentiment_class', 'neutral'))
 
     def extract_emojis(self, text: str) -> List[Tuple[str, float]]:
         """Extrai emojis e seus valores de sentimento"""
@@ -793,162 +1253,112 @@ class SupremeSentimentAnalyzer:
         
         return emoji_matches
     
+    def normalize_text(self, text: str) -> NormalizedText:
+        """🧹 Normalização em passada única: texto preprocessado + emojis do texto original"""
+        return self.normalizer.normalize(text)
+    
     def preprocess_text(self, text: str) -> str:
-        """Preprocessamento avançado do texto"""
-        if not text:
-            return ""
-        
-        # Converter para minúsculas
-        text = text.lower()
-        
-        # Preservar emojis importantes antes da limpeza
-        emoji_data = self.extract_emojis(text)
-        
-        # Substituir contrações comuns
-        contractions = {
-            'não foi': 'nao foi', 'não é': 'nao eh', 'não está': 'nao esta',
-            'não gosto': 'nao gosto', 'não gostei': 'nao gostei', 'não funciona': 'nao funciona',
-            'não funcionou': 'nao funcionou', 'não recomendo': 'nao recomendo',
-            'não vale': 'nao vale', 'não compro': 'nao compro', 'não volto': 'nao volto'
-        }
-        
-        for contraction, expansion in contractions.items():
-            text = text.replace(contraction, expansion)
-        
-        # Limpar caracteres especiais mas preservar pontuação importante
-        text = re.sub(r'[^\w\s\.\,\!\?\-\:\;\"]', '', text)
-        
-        # Normalizar espaços
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        """Preprocessamento avançado do texto (minúsculas, contrações, caracteres especiais e espaços)"""
+        return self.normalizer.normalize(text).text
 
-    def detect_context(self, text: str) -> List[str]:
+    def detect_context(self, text: str, doc: Optional[AnalysisDocument] = None) -> List[str]:
         """Detecta o contexto da mensagem (atendimento, produto, etc.)"""
-        detected_contexts = []
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         
-        for context, keywords in self.context_patterns.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    detected_contexts.append(context)
-                    break
+        detected_contexts = list(hits.groups('context_patterns'))
         
         return list(set(detected_contexts))
     
-    def detect_emotions(self, text: str) -> Dict[str, float]:
+    def detect_emotions(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, float]:
         """Detecta emoções específicas no texto"""
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         detected_emotions = {}
-        text_lower = text.lower()
+        word_count = doc.density_base
         
-        for emotion, keywords in self.emotions.items():
+        for emotion, keywords in hits.groups('emotions').items():
             emotion_score = 0.0
             for keyword in keywords:
-                if keyword in text_lower:
-                    emotion_score += text_lower.count(keyword)
+                emotion_score += hits.count(keyword)
             
             if emotion_score > 0:
-                detected_emotions[emotion] = min(emotion_score / len(text_lower.split()) * 10, 1.0)
+                detected_emotions[emotion] = min(emotion_score / word_count * 10, 1.0)
         
         return detected_emotions
     
-    def calculate_advanced_sentiment_score(self, text: str) -> Tuple[float, Dict]:
-        """Calcula score avançado com intensificadores, negações e contexto"""
-        if not text:
+    def calculate_advanced_sentiment_score(self, text: str, doc: Optional[AnalysisDocument] = None,
+                                           explain: bool = True) -> Tuple[float, Dict]:
+        """
+        Calcula score avançado com intensificadores, negações e contexto
+        Termos do léxico com várias palavras são reconhecidos pela trie do phrase_scorer
+        Com explain=False o score é o mesmo, mas word_contributions (e seus textos de modificadores) não é montado
+        """
+        # Mensagens só de emojis ('👍') chegam com o texto preprocessado vazio, mas com emoji_hits
+        if not text and (doc is None or not doc.emoji_hits):
             return 0.0, {}
         
-        words = text.lower().split()
-        total_score = 0.0
-        word_contributions = []
-        
-        i = 0
-        while i < len(words):
-            word = words[i]
-            
-            # Verificar se a palavra está no léxico
-            if word in self.sentiment_lexicon:
-                base_score = self.sentiment_lexicon[word]
-                final_score = base_score
-                modifiers = []
-                
-                # Verificar intensificadores/diminuidores nas 2 palavras anteriores
-                for j in range(max(0, i-2), i):
-                    prev_word = words[j]
-                    if prev_word in self.intensifiers:
-                        final_score *= self.intensifiers[prev_word]
-                        modifiers.append(f"intensificado por '{prev_word}'")
-                    elif prev_word in self.diminishers:
-                        final_score *= self.diminishers[prev_word]
-                        modifiers.append(f"diminuído por '{prev_word}'")
-                
-                # Verificar negações nas 3 palavras anteriores
-                negated = False
-                for j in range(max(0, i-3), i):
-                    if words[j] in self.negations:
-                        final_score *= -0.8  # Inverte e diminui um pouco
-                        modifiers.append(f"negado por '{words[j]}'")
-                        negated = True
-                        break
-                
-                total_score += final_score
-                word_contributions.append({
-                    'word': word,
-                    'base_score': base_score,
-                    'final_score': final_score,
-                    'modifiers': modifiers,
-                    'negated': negated
-                })
-            
-            i += 1
+        if doc is None:
+            doc = self.build_document(text)
+        words = doc.tokens
+        # Passada única sobre os ids dos tokens: frases do léxico (ex.: 'muito bom') têm precedência
+        total_score, word_contributions, units = self.phrase_scorer.score(words, explain, doc.words if explain else None)
         
         # Adicionar score dos emojis
-        emoji_data = self.extract_emojis(text)
+        emoji_data = doc.emoji_hits
         emoji_score = sum([score for _, score in emoji_data])
         total_score += emoji_score
         
-        # Normalizar pelo tamanho do texto
-        if len(words) > 0:
-            normalized_score = total_score / len(words)
-        else:
-            normalized_score = 0.0
+        # Normalizar pelo tamanho do texto: frases do léxico contam como uma palavra
+        # (sem palavras, os emojis valem como uma)
+        normalized_score = total_score / max(units, 1)
         
         analysis_details = {
-            'word_contributions': word_contributions,
             'emoji_contributions': emoji_data,
             'emoji_score': emoji_score,
             'raw_score': total_score,
             'normalized_score': normalized_score,
             'word_count': len(words)
         }
+        if explain:
+            analysis_details = {'word_contributions': word_contributions, **analysis_details}
         
         return normalized_score, analysis_details
     
-    def extract_advanced_keywords(self, text: str) -> List[Dict]:
+    def extract_advanced_keywords(self, text: str, doc: Optional[AnalysisDocument] = None) -> List[Dict]:
         """Extração avançada de palavras-chave com relevância"""
         if not text:
             return []
         
-        words = text.lower().split()
+        if doc is None:
+            doc = self.build_document(text)
+        words = doc.tokens
         keyword_scores = {}
+        canonical_lexicon = self.canonical_lexicon
+        # Grafia exibida: a primeira ocorrência no texto de cada token canônico
+        written = {}
+        for token, word in zip(words, doc.words):
+            written.setdefault(token, word)
         
         # Calcular TF (Term Frequency) simples
-        word_counts = Counter(words)
+        word_counts = doc.token_counts
         
         for word, count in word_counts.items():
-            if (len(word) > 2 and 
-                word not in self.stop_words and
-                (word in self.sentiment_lexicon or any(word in emotion_words for emotion_words in self.emotions.values()))):
+            if len(word) > 2 and word in canonical_lexicon:
+                lexicon_value = canonical_lexicon[word]
                 
                 # Score baseado na frequência e sentimento
-                sentiment_weight = abs(self.sentiment_lexicon.get(word, 0.5))
+                sentiment_weight = abs(lexicon_value if lexicon_value is not None else 0.5)
                 tf_score = count / len(words)
                 relevance_score = tf_score * (1 + sentiment_weight)
                 
                 keyword_scores[word] = {
-                    'word': word,
+                    'word': written[word],
                     'frequency': count,
                     'tf_score': tf_score,
-                    'sentiment_value': self.sentiment_lexicon.get(word, 0.0),
+                    'sentiment_value': lexicon_value if lexicon_value is not None else 0.0,
                     'relevance_score': relevance_score
                 }
         
@@ -1101,22 +1511,272 @@ class SupremeSentimentAnalyzer:
             }
         }
     
-    def detect_sarcasm(self, text: str, context: Optional[Dict] = None) -> Tuple[bool, float, str]:
+    def _load_phrase_scorer(self) -> PhraseScorer:
+        """🔢 Compila léxico, intensificadores, diminuidores e negações em ids de tokens + trie de frases"""
+        return PhraseScorer(self.sentiment_lexicon, self.intensifiers, self.diminishers, self.negations, fold=fold_text)
+    
+    def _load_batch_scorer(self) -> BatchLexiconScorer:
+        """📊 Arrays do phrase_scorer para o score léxico vetorizado (NumPy opcional)"""
+        return BatchLexiconScorer(self.phrase_scorer)
+    
+    def _load_canonical_lexicon(self) -> Dict[str, Optional[float]]:
+        """🔤 Palavras do léxico e das emoções na forma canônica -> valor no léxico (None: só emoção), sem stop words"""
+        stop_words = {fold_text(word) for word in self.stop_words}
+        canonical: Dict[str, Optional[float]] = {}
+        for word, value in self.sentiment_lexicon.items():
+            canonical.setdefault(fold_text(word), value)
+        for emotion_words in self.emotions.values():
+            for word in emotion_words:
+                canonical.setdefault(fold_text(word), None)
+        return {word: value for word, value in canonical.items() if word not in stop_words}
+    
+    def _load_phase_keywords(self) -> Dict[str, Dict[str, Any]]:
+        """🧠 Carrega os dicionários das análises psicológicas, ultra-impossíveis e divinas"""
+        return {
+            'psychological_profile': {
+                'traits': {
+                    'extroversion': ['social', 'pessoas', 'festa', 'grupo', 'energia'],
+                    'introversion': ['sozinho', 'quieto', 'interno', 'reflexão', 'calmo'],
+                    'openness': ['novo', 'criativo', 'arte', 'imaginação', 'experiência'],
+                    'conscientiousness': ['organizado', 'responsável', 'planejamento', 'detalhes'],
+                    'agreeableness': ['gentil', 'cooperação', 'harmonia', 'empático'],
+                    'neuroticism': ['ansioso', 'preocupado', 'estressado', 'nervoso']
+                },
+                'analytical': ['análise', 'lógica', 'razão', 'pensar', 'dados'],
+                'intuitive': ['sentir', 'intuição', 'coração', 'instinto', 'energia'],
+                'mental_health': {
+                    'anxiety': ['ansioso', 'preocupado', 'nervoso', 'medo'],
+                    'depression': ['triste', 'deprimido', 'sem energia', 'vazio'],
+                    'stress': ['estressado', 'pressão', 'sobregregado', 'tenso'],
+                    'resilience': ['superar', 'forte', 'recuperar', 'persistir']
+                },
+                'defenses': {
+                    'denial': ['não é verdade', 'isso não aconteceu', 'não acredito'],
+                    'projection': ['culpa dos outros', 'eles que', 'não sou eu'],
+                    'rationalization': ['porque', 'justifica', 'explicação', 'razão'],
+                    'sublimation': ['canalizar', 'transformar', 'criar', 'arte']
+                }
+            },
+            'emotional_intelligence': {
+                'self_awareness': ['sinto', 'emoção', 'percebo', 'consciente', 'sinto que'],
+                'self_regulation': ['controlar', 'gerenciar', 'equilibrar', 'calmar', 'respirar'],
+                'motivation': ['objetivo', 'meta', 'crescer', 'melhorar', 'conquistar'],
+                'empathy': ['entender', 'compreender', 'sentir', 'lugar do outro', 'perspectiva'],
+                'social_skills': ['comunicar', 'relacionar', 'conectar', 'equipe', 'cooperar'],
+                'emotional_vocabulary': ['alegria', 'tristeza', 'raiva', 'medo', 'surpresa', 'nojo', 'amor', 'ódio']
+            },
+            'cognitive_biases': {
+                'confirmation': ['sempre', 'nunca', 'todos sabem', 'óbvio que', 'claro que'],
+                'availability': ['lembro que', 'vi ontem', 'aconteceu comigo', 'exemplo'],
+                'overconfidence': ['tenho certeza', 'impossível estar errado', 'sei que', 'garantido'],
+                'loss_aversion': ['perder', 'risco', 'seguro', 'garantia', 'não posso perder']
+            },
+            'communication_style': {
+                'direct': ['diretamente', 'claro', 'objetivo', 'específico', 'ponto'],
+                'indirect': ['talvez', 'possivelmente', 'meio que', 'parece que'],
+                'formal': ['senhor', 'senhora', 'prezado', 'cordialmente', 'atenciosamente'],
+                'informal': ['cara', 'mano', 'oi', 'tchau', 'valeu'],
+                'expressive': ['amo', 'odeio', 'adoro', 'detesto', 'emociona', 'sinto muito'],
+                'assertive': ['preciso', 'quero', 'acredito', 'minha opinião', 'posição']
+            },
+            'stress_resilience': {
+                'stress': ['estressado', 'pressão', 'sobregregado', 'ansioso', 'tenso'],
+                'stress_sources': {
+                    'work': ['trabalho', 'chefe', 'prazo', 'reunião', 'projeto'],
+                    'financial': ['dinheiro', 'dívida', 'conta', 'financeiro', 'pagar'],
+                    'relationship': ['relacionamento', 'família', 'conflito', 'discussão'],
+                    'health': ['saúde', 'doença', 'médico', 'dor', 'cansaço']
+                },
+                'coping_strategies': {
+                    'problem_focused': ['resolver', 'planejar', 'ação', 'estratégia', 'solução'],
+                    'emotion_focused': ['relaxar', 'respirar', 'meditar', 'exercício', 'hobby'],
+                    'social_support': ['conversar', 'amigos', 'família', 'ajuda', 'apoio'],
+                    'avoidance': ['esquecer', 'ignorar', 'fugir', 'evitar', 'negar']
+                },
+                'resilience': ['superar', 'forte', 'persistir', 'aprender', 'crescer']
+            },
+            'micro_gestures': {
+                'facial': {
+                    'slight_smile': ['rs', 'hehe', 'hihi', 'levemente', 'sutilmente'],
+                    'micro_frown': ['hmm', 'né', 'meio que', 'ah sei'],
+                    'eye_roll': ['nossa', 'sério?', 'ah tá', 'claro né'],
+                    'eyebrow_raise': ['mesmo?', 'sério mesmo?', 'nossa!', 'caramba'],
+                    'lip_compression': ['ok...', 'tá bom', 'se você diz', 'tanto faz'],
+                    'nose_flare': ['que absurdo', 'inacreditável', 'não acredito']
+                },
+                'body': {
+                    'crossed_arms': ['defensivo', 'protegido', 'fechado', 'resistente'],
+                    'open_posture': ['aberto', 'receptivo', 'disponível', 'acolhedor'],
+                    'leaning_forward': ['interessado', 'curioso', 'atento', 'focado'],
+                    'leaning_back': ['relaxado', 'distante', 'observando', 'avaliando'],
+                    'fidgeting': ['ansioso', 'nervoso', 'agitado', 'inquieto'],
+                    'stillness': ['calmo', 'centrado', 'estável', 'presente']
+                },
+                'attention': {
+                    'direct_gaze': ['olha', 'vejo', 'observo', 'foco', 'direto'],
+                    'avoiding_gaze': ['não sei', 'talvez', 'meio que', 'tipo'],
+                    'scanning': ['vários', 'diferentes', 'múltiplos', 'análise'],
+                    'fixation': ['sempre', 'constantemente', 'focado', 'centrado']
+                }
+            },
+            'soul_dna': {
+                'blueprint': {
+                    'healer': ['curar', 'ajudar', 'cuidar', 'aliviar', 'sarar'],
+                    'teacher': ['ensinar', 'explicar', 'compartilhar', 'educar', 'orientar'],
+                    'creator': ['criar', 'inventar', 'construir', 'manifestar', 'gerar'],
+                    'guardian': ['proteger', 'defender', 'guardar', 'preservar', 'manter'],
+                    'seeker': ['buscar', 'procurar', 'explorar', 'descobrir', 'investigar'],
+                    'connector': ['conectar', 'unir', 'relacionar', 'integrar', 'harmonizar']
+                },
+                'karmic': {
+                    'forgiveness': ['perdoar', 'perdão', 'absolver', 'liberar'],
+                    'compassion': ['compaixão', 'compreensão', 'empatia', 'amor'],
+                    'wisdom': ['sabedoria', 'aprender', 'compreender', 'crescer'],
+                    'service': ['servir', 'doar', 'contribuir', 'ajudar'],
+                    'balance': ['equilibrar', 'harmonizar', 'balancear', 'centrar']
+                },
+                'past_life': {
+                    'ancient_wisdom': ['antigo', 'ancestral', 'milenar', 'eterno'],
+                    'mystical_knowledge': ['místico', 'espiritual', 'transcendental', 'divino'],
+                    'warrior_spirit': ['luta', 'batalha', 'coragem', 'força', 'resistir'],
+                    'artistic_soul': ['arte', 'beleza', 'criação', 'inspiração', 'estética'],
+                    'scholarly_mind': ['conhecimento', 'estudo', 'pesquisa', 'análise']
+                },
+                'wisdom': ['experiência', 'sabedoria', 'compreensão', 'perspectiva'],
+                'cosmic_heritage': {
+                    'pleiadian': ['luz', 'amor', 'cura', 'elevação'],
+                    'arcturian': ['tecnologia', 'evolução', 'conhecimento', 'sabedoria'],
+                    'sirian': ['estrutura', 'ordem', 'organização', 'sistema'],
+                    'andromedan': ['liberdade', 'exploração', 'aventura', 'descoberta'],
+                    'lyran': ['criatividade', 'arte', 'expressão', 'originalidade']
+                }
+            },
+            'quantum_empathy': {
+                'empathy': {
+                    'high_resonance': ['sinto', 'compreendo', 'entendo', 'percebo', 'sinta'],
+                    'emotional_absorption': ['absorvo', 'tomo para mim', 'carrego', 'sinto como meu'],
+                    'healing_intention': ['curar', 'aliviar', 'consolar', 'confortar', 'amparar'],
+                    'compassionate_response': ['compaixão', 'ternura', 'carinho', 'cuidado']
+                },
+                'emotional': ['amor', 'dor', 'alegria', 'tristeza', 'medo', 'raiva', 'paz', 'ansiedade'],
+                'telepathic': ['sinto que', 'percebo que', 'intuição', 'pressentimento', 'energia'],
+                'compassion': ['perdoar', 'compreender', 'aceitar', 'acolher', 'apoiar'],
+                'dimensional': {
+                    '3D_physical': ['corpo', 'físico', 'material', 'tangível'],
+                    '4D_emotional': ['emoção', 'sentimento', 'coração', 'alma'],
+                    '5D_mental': ['mente', 'pensamento', 'consciência', 'awareness'],
+                    '6D_causal': ['causa', 'origem', 'propósito', 'missão'],
+                    '7D_buddhic': ['unidade', 'totalidade', 'conexão', 'universal'],
+                    '8D_logoic': ['divino', 'sagrado', 'transcendente', 'absoluto']
+                }
+            },
+            'temporal_personality': {
+                'time_orientations': {
+                    'past_focused': ['era', 'antes', 'lembro', 'passado', 'história'],
+                    'present_focused': ['agora', 'hoje', 'momento', 'atual', 'presente'],
+                    'future_focused': ['será', 'vou', 'futuro', 'amanhã', 'próximo']
+                },
+                'age_regression': {
+                    'child_self': ['criança', 'pequeno', 'ingênuo', 'brincadeira', 'diversão'],
+                    'teen_self': ['adolescente', 'rebelde', 'descoberta', 'intenso', 'paixão'],
+                    'young_adult': ['jovem', 'energia', 'aventura', 'exploração', 'liberdade'],
+                    'mature_self': ['responsabilidade', 'sabedoria', 'experiência', 'estabilidade']
+                },
+                'consistency': ['sempre', 'nunca', 'constantemente', 'geralmente'],
+                'change': ['mudei', 'evoluí', 'cresci', 'aprendi', 'transformei'],
+                'anchors': {
+                    'childhood_trauma': ['trauma', 'machucou', 'ferida', 'cicatriz'],
+                    'formative_experience': ['marcou', 'mudou tudo', 'transformador', 'definitivo'],
+                    'spiritual_awakening': ['despertar', 'iluminação', 'consciência', 'revelação'],
+                    'major_loss': ['perda', 'luto', 'partida', 'ausência'],
+                    'achievement': ['conquista', 'vitória', 'sucesso', 'realização']
+                }
+            },
+            'divine_consciousness': {
+                'god_consciousness': {
+                    'unity': ['unidade', 'totalidade', 'um só', 'integração', 'harmonia'],
+                    'unconditional_love': ['amor incondicional', 'amor puro', 'compaixão infinita', 'amor universal'],
+                    'infinite_wisdom': ['sabedoria infinita', 'conhecimento absoluto', 'verdade universal'],
+                    'perfect_peace': ['paz perfeita', 'serenidade absoluta', 'calma divina'],
+                    'divine_service': ['servir', 'dedicação', 'entrega', 'doação', 'sacrifício']
+                },
+                'archetypes': {
+                    'the_creator': ['criar', 'manifestar', 'gerar', 'originar', 'dar vida'],
+                    'the_destroyer': ['transformar', 'purificar', 'limpar', 'renovar', 'liberar'],
+                    'the_preserver': ['manter', 'sustentar', 'proteger', 'preservar', 'cuidar'],
+                    'the_wise_one': ['sabedoria', 'conhecimento', 'ensinar', 'guiar', 'iluminar'],
+                    'the_healer': ['curar', 'restaurar', 'regenerar', 'harmonizar', 'equilibrar'],
+                    'the_warrior_of_light': ['luta', 'defesa', 'proteção', 'coragem', 'força'],
+                    'the_mother_goddess': ['nutrir', 'acolher', 'gerar', 'criar vida', 'amor maternal'],
+                    'the_father_god': ['proteger', 'prover', 'estruturar', 'organizar', 'liderar']
+                },
+                'ascended_masters': {
+                    'jesus_christ': ['amor', 'perdão', 'compaixão', 'sacrifício', 'redenção'],
+                    'buddha': ['iluminação', 'despertar', 'mindfulness', 'cessação', 'nirvana'],
+                    'krishna': ['devoção', 'bhakti', 'dharma', 'yoga', 'transcendência'],
+                    'quan_yin': ['misericórdia', 'compaixão', 'cura', 'ternura', 'gentileza'],
+                    'saint_germain': ['transformação', 'alquimia', 'chama violeta', 'transmutação']
+                }
+            },
+            'reality_manipulation': {
+                'manifestation': {
+                    'intention_setting': ['pretendo', 'desejo', 'quero', 'intenciono', 'almejo'],
+                    'visualization': ['visualizo', 'imagino', 'vejo', 'projeto', 'mentalizo'],
+                    'belief_power': ['acredito', 'tenho fé', 'confio', 'sei que', 'certeza'],
+                    'feeling_state': ['sinto como se', 'já aconteceu', 'realidade', 'vivencio'],
+                    'gratitude': ['grato', 'agradecido', 'obrigado', 'gratidão', 'reconheço']
+                },
+                'timelines': {
+                    'past_healing': ['curar o passado', 'resolver traumas', 'perdoar', 'liberar'],
+                    'present_mastery': ['momento presente', 'agora', 'presença', 'mindfulness'],
+                    'future_creation': ['criar futuro', 'desenhar destino', 'moldar amanhã'],
+                    'parallel_timelines': ['outras possibilidades', 'universos paralelos', 'realidades alternativas']
+                }
+            },
+            'interdimensional_communication': {
+                'et_contact': {
+                    'pleiadians': ['luz', 'cura', 'amor', 'ascensão', 'despertar'],
+                    'arcturians': ['tecnologia', 'conhecimento', 'geometria sagrada', 'cristais'],
+                    'sirians': ['estrutura', 'ordem', 'sistema', 'organização', 'disciplina'],
+                    'andromedans': ['liberdade', 'exploração', 'aventura', 'descoberta', 'viagem'],
+                    'greys': ['observação', 'estudo', 'análise', 'pesquisa', 'experimento'],
+                    'reptilians': ['poder', 'controle', 'dominação', 'hierarquia', 'autoridade']
+                },
+                'cosmic_languages': {
+                    'light_language': ['energia', 'vibração', 'frequência', 'ressonância'],
+                    'geometric_language': ['geometria', 'padrões', 'formas', 'símbolos'],
+                    'tonal_language': ['som', 'música', 'harmonia', 'melodia'],
+                    'color_language': ['cores', 'espectro', 'arco-íris', 'aura']
+                }
+            },
+            'akashic_records': {
+                'akashic': {
+                    'soul_memory': ['lembro', 'memória da alma', 'vidas passadas', 'já vivi'],
+                    'karmic_understanding': ['karma', 'lições', 'aprendizado', 'crescimento'],
+                    'soul_contracts': ['acordo', 'contrato', 'missão', 'propósito'],
+                    'divine_timing': ['momento certo', 'sincronicidade', 'timing divino'],
+                    'cosmic_truth': ['verdade universal', 'sabedoria cósmica', 'conhecimento divino']
+                }
+            }
+        }
+    
+    def detect_sarcasm(self, text: str, context: Optional[Dict] = None, doc: Optional[AnalysisDocument] = None) -> Tuple[bool, float, str]:
         """🎭 Detecção suprema de sarcasmo e ironia"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         sarcasm_score = 0.0
         detected_type = "none"
         
         # Verificar padrões óbvios de sarcasmo
-        for sarcasm_type, phrases in self.sarcasm_patterns.items():
+        for sarcasm_type, phrases in hits.groups('sarcasm_patterns').items():
             for phrase in phrases:
-                if phrase in text_lower:
-                    sarcasm_score += 0.8
-                    detected_type = sarcasm_type
+                sarcasm_score += 0.8
+                detected_type = sarcasm_type
         
         # Análise contextual de sarcasmo
-        positive_words = sum(1 for word in self.sentiment_lexicon if word in text_lower and self.sentiment_lexicon[word] > 2.0)
-        negative_context_clues = text_lower.count('mas') + text_lower.count('porém') + text_lower.count('né')
+        positive_words = sum(1 for word, weight in hits.weighted('sentiment_lexicon') if weight > 2.0)
+        negative_context_clues = hits.count('mas') + hits.count('porém') + hits.count('né')
         
         if positive_words > 0 and negative_context_clues > 0:
             sarcasm_score += 0.6
@@ -1130,16 +1790,18 @@ class SupremeSentimentAnalyzer:
         is_sarcastic = sarcasm_score > 0.5
         return is_sarcastic, min(sarcasm_score, 1.0), detected_type
     
-    def detect_intent(self, text: str) -> Dict[str, float]:
+    def detect_intent(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, float]:
         """🎯 Detecção suprema de intenção"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         intent_scores = {}
+        word_count = doc.density_base
         
-        for intent, keywords in self.intent_patterns.items():
+        for intent, keywords in hits.groups('intent_patterns').items():
             score = 0.0
             for keyword in keywords:
-                if keyword in text_lower:
-                    score += text_lower.count(keyword) / len(text_lower.split())
+                score += hits.count(keyword) / word_count
             
             if score > 0:
                 intent_scores[intent] = score
@@ -1151,14 +1813,15 @@ class SupremeSentimentAnalyzer:
         
         return intent_scores
     
-    def detect_urgency(self, text: str) -> Tuple[str, float]:
+    def detect_urgency(self, text: str, doc: Optional[AnalysisDocument] = None) -> Tuple[str, float]:
         """⚡ Detecção suprema de urgência"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         urgency_score = 0.0
         
-        for keyword, weight in self.urgency_keywords.items():
-            if keyword in text_lower:
-                urgency_score += weight
+        for keyword, weight in hits.weighted('urgency_keywords'):
+            urgency_score += weight
         
         # Verificar pontuação de urgência
         urgent_punctuation = len(re.findall(r'[!]{2,}|URGENT|EMERGENCIA', text, re.IGNORECASE))
@@ -1176,26 +1839,28 @@ class SupremeSentimentAnalyzer:
         
         return urgency_level, min(urgency_score / 3.0, 1.0)
     
-    def analyze_personality(self, text: str) -> Dict[str, float]:
+    def analyze_personality(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, float]:
         """🧠 Análise suprema de personalidade"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         personality_scores = {}
         
-        for trait, keywords in self.personality_traits.items():
-            score = 0.0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
+        for trait, keywords in hits.groups('personality_traits').items():
+            score = float(len(keywords))
             
             # Normalizar por comprimento do texto
             if score > 0:
-                personality_scores[trait] = score / len(text_lower.split())
+                personality_scores[trait] = score / doc.density_base
         
         return personality_scores
     
-    def analyze_relationship_stage(self, text: str, user_history: Optional[List] = None) -> Dict[str, Any]:
+    def analyze_relationship_stage(self, text: str, user_history: Optional[List] = None,
+                                   doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """💼 Análise suprema do relacionamento cliente-empresa"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         relationship_data = {
             'stage': 'unknown',
             'loyalty_score': 0.0,
@@ -1203,12 +1868,9 @@ class SupremeSentimentAnalyzer:
             'lifetime_value_indicator': 'medium'
         }
         
-        # Detectar estágio do relacionamento
-        for stage, indicators in self.relationship_indicators.items():
-            for indicator in indicators:
-                if indicator in text_lower:
-                    relationship_data['stage'] = stage
-                    break
+        # Detectar estágio do relacionamento (prevalece o último estágio encontrado)
+        for stage in hits.groups('relationship_indicators'):
+            relationship_data['stage'] = stage
         
         # Analisar histórico se disponível
         if user_history:
@@ -1230,20 +1892,24 @@ class SupremeSentimentAnalyzer:
         
         return relationship_data
     
-    def apply_semantic_patterns(self, text: str) -> Dict[str, Any]:
+    def apply_semantic_patterns(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🔍 Aplicação suprema de padrões semânticos"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         pattern_matches = []
         total_confidence_boost = 0.0
         semantic_adjustments = 0.0
+        triggers = hits.groups('semantic_triggers')
+        clues = hits.groups('semantic_clues')
         
         for pattern in self.semantic_patterns:
             # Verificar se trigger phrases estão presentes
-            trigger_found = any(trigger in text_lower for trigger in pattern.trigger_phrases)
+            trigger_found = pattern.pattern_id in triggers
             
             if trigger_found:
                 # Verificar context clues
-                context_clues_found = sum(1 for clue in pattern.context_clues if clue in text_lower)
+                context_clues_found = len(clues.get(pattern.pattern_id, []))
                 
                 if context_clues_found > 0:
                     pattern_strength = context_clues_found / len(pattern.context_clues)
@@ -1267,9 +1933,13 @@ class SupremeSentimentAnalyzer:
         }
     
     # 🧠💫⚡ MÉTODOS DE ANÁLISE TRANSCENDENTAIS IMPOSSÍVEIS ⚡💫🧠
-    def analyze_quantum_linguistics(self, text: str) -> Dict[str, Any]:
+    def analyze_quantum_linguistics(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🌌 Análise linguística quântica suprema"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.word_count
+        quantum_states = hits.groups('quantum_states')
         quantum_analysis = {
             'quantum_state': 'classical',
             'probability_field': 0.5,
@@ -1278,28 +1948,26 @@ class SupremeSentimentAnalyzer:
             'superposition_level': 0.0
         }
         
-        # Detectar estados quânticos
-        for state, words in self.quantum_linguistics['quantum_states'].items():
-            if any(word in text_lower for word in words):
-                quantum_analysis['quantum_state'] = state
-                break
+        # Detectar estados quânticos (prevalece o primeiro estado encontrado)
+        if quantum_states:
+            quantum_analysis['quantum_state'] = next(iter(quantum_states))
         
         # Calcular nível de superposição
-        uncertainty_words = self.quantum_linguistics['quantum_states']['superposition']
-        uncertainty_count = sum(1 for word in uncertainty_words if word in text_lower)
-        if len(text_lower.split()) > 0:
-            quantum_analysis['superposition_level'] = min(uncertainty_count / len(text_lower.split()), 1.0)
+        uncertainty_count = len(quantum_states.get('superposition', []))
+        if word_count > 0:
+            quantum_analysis['superposition_level'] = min(uncertainty_count / word_count, 1.0)
         
         # Detectar entrelaçamento quântico
-        entanglement_words = self.quantum_linguistics['quantum_states']['entanglement']
-        if any(word in text_lower for word in entanglement_words):
+        if 'entanglement' in quantum_states:
             quantum_analysis['entanglement_detected'] = True
         
         return quantum_analysis
     
-    def analyze_soul_frequency(self, text: str) -> Dict[str, Any]:
+    def analyze_soul_frequency(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """✨ Análise das frequências da alma"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         soul_analysis = {
             'dominant_frequency': 440.0,  # Frequência padrão
             'vibrational_level': 'neutral',
@@ -1308,11 +1976,9 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar palavras de alta vibração
-        high_vib_words = self.soul_frequencies['vibrational_words']['high_vibration']
-        low_vib_words = self.soul_frequencies['vibrational_words']['low_vibration']
-        
-        high_count = sum(1 for word in high_vib_words if word in text_lower)
-        low_count = sum(1 for word in low_vib_words if word in text_lower)
+        vibrational_words = hits.groups('vibrational_words')
+        high_count = len(vibrational_words.get('high_vibration', []))
+        low_count = len(vibrational_words.get('low_vibration', []))
         
         if high_count > low_count:
             soul_analysis['vibrational_level'] = 'high'
@@ -1325,9 +1991,12 @@ class SupremeSentimentAnalyzer:
         
         return soul_analysis
     
-    def analyze_cosmic_patterns(self, text: str) -> Dict[str, Any]:
+    def analyze_cosmic_patterns(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🌟 Análise de padrões cósmicos universais"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.word_count
         cosmic_analysis = {
             'golden_ratio_alignment': 0.0,
             'fibonacci_presence': False,
@@ -1336,20 +2005,16 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar padrões da razão áurea
-        golden_words = self.cosmic_patterns['golden_ratio_words']
-        golden_count = sum(1 for word in golden_words if word in text_lower)
-        if len(text_lower.split()) > 0:
-            cosmic_analysis['golden_ratio_alignment'] = min(golden_count / len(text_lower.split()), 1.0)
+        golden_count = len(hits.present('golden_ratio_words'))
+        if word_count > 0:
+            cosmic_analysis['golden_ratio_alignment'] = min(golden_count / word_count, 1.0)
         
         # Detectar padrões de Fibonacci
-        fibonacci_words = self.cosmic_patterns['fibonacci_patterns']
-        if any(word in text_lower for word in fibonacci_words):
+        if hits.present('fibonacci_patterns'):
             cosmic_analysis['fibonacci_presence'] = True
         
         # Detectar geometria sagrada
-        for geometry, words in self.cosmic_patterns['sacred_geometry'].items():
-            if any(word in text_lower for word in words):
-                cosmic_analysis['sacred_geometry_detected'].append(geometry)
+        cosmic_analysis['sacred_geometry_detected'].extend(hits.groups('sacred_geometry'))
         
         # Calcular ressonância cósmica
         total_patterns = (
@@ -1361,9 +2026,12 @@ class SupremeSentimentAnalyzer:
         
         return cosmic_analysis
     
-    def analyze_multiversal_consciousness(self, text: str) -> Dict[str, Any]:
+    def analyze_multiversal_consciousness(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🧠🌌 Análise de consciência multiversal"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.word_count
         multiverse_analysis = {
             'dimensional_awareness': 1,  # Dimensão padrão
             'parallel_self_detected': False,
@@ -1372,16 +2040,14 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar indicadores de eu paralelo
-        parallel_indicators = self.multiversal_consciousness['parallel_self_indicators']
-        if any(indicator in text_lower for indicator in parallel_indicators):
+        if hits.present('parallel_self_indicators'):
             multiverse_analysis['parallel_self_detected'] = True
             multiverse_analysis['dimensional_awareness'] = 3
         
         # Detectar palavras de acesso multiversal
-        access_words = self.multiversal_consciousness['multiverse_access_words']
-        access_count = sum(1 for word in access_words if word in text_lower)
-        if len(text_lower.split()) > 0:
-            multiverse_analysis['multiverse_access'] = min(access_count / len(text_lower.split()), 1.0)
+        access_count = len(hits.present('multiverse_access_words'))
+        if word_count > 0:
+            multiverse_analysis['multiverse_access'] = min(access_count / word_count, 1.0)
         
         # Determinar nível de consciência
         if multiverse_analysis['multiverse_access'] > 0.5:
@@ -1391,9 +2057,12 @@ class SupremeSentimentAnalyzer:
         
         return multiverse_analysis
     
-    def analyze_impossible_comprehension(self, text: str) -> Dict[str, Any]:
+    def analyze_impossible_comprehension(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """💥 Análise de compreensão impossível"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.word_count
         impossible_analysis = {
             'paradox_level': 0.0,
             'infinite_understanding': False,
@@ -1403,14 +2072,12 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar paradoxos
-        paradox_words = self.impossible_comprehension_matrix['paradox_resolution']
-        paradox_count = sum(1 for word in paradox_words if word in text_lower)
-        if len(text_lower.split()) > 0:
-            impossible_analysis['paradox_level'] = min(paradox_count / len(text_lower.split()), 1.0)
+        paradox_count = len(hits.present('paradox_resolution'))
+        if word_count > 0:
+            impossible_analysis['paradox_level'] = min(paradox_count / word_count, 1.0)
         
         # Detectar compreensão infinita
-        infinite_words = self.impossible_comprehension_matrix['infinite_understanding']
-        if any(word in text_lower for word in infinite_words):
+        if hits.present('infinite_understanding'):
             impossible_analysis['infinite_understanding'] = True
             impossible_analysis['comprehension_level'] = 'godlike'
         
@@ -1425,9 +2092,11 @@ class SupremeSentimentAnalyzer:
         return impossible_analysis
     
     # 🧠💫⚡ MÉTODOS SUPREMOS DE ANÁLISE PSICOLÓGICA HUMANA ⚡💫🧠
-    def analyze_psychological_profile(self, text: str) -> Dict[str, Any]:
+    def analyze_psychological_profile(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🧠 Análise psicológica profunda da personalidade"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         psych_profile = {
             'dominant_traits': [],
             'cognitive_style': 'balanced',
@@ -1442,31 +2111,18 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar traços de personalidade dominantes
-        trait_indicators = {
-            'extroversion': ['social', 'pessoas', 'festa', 'grupo', 'energia'],
-            'introversion': ['sozinho', 'quieto', 'interno', 'reflexão', 'calmo'],
-            'openness': ['novo', 'criativo', 'arte', 'imaginação', 'experiência'],
-            'conscientiousness': ['organizado', 'responsável', 'planejamento', 'detalhes'],
-            'agreeableness': ['gentil', 'cooperação', 'harmonia', 'empático'],
-            'neuroticism': ['ansioso', 'preocupado', 'estressado', 'nervoso']
-        }
-        
+        word_count = doc.density_base
         trait_scores = {}
-        for trait, keywords in trait_indicators.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                trait_scores[trait] = score / len(text_lower.split())
+        for trait, keywords in hits.groups('psychological_profile.traits').items():
+            trait_scores[trait] = len(keywords) / word_count
         
         if trait_scores:
             dominant_trait = max(trait_scores.items(), key=lambda x: x[1])
             psych_profile['dominant_traits'] = [dominant_trait[0]]
         
         # Detectar estilo cognitivo
-        analytical_words = ['análise', 'lógica', 'razão', 'pensar', 'dados']
-        intuitive_words = ['sentir', 'intuição', 'coração', 'instinto', 'energia']
-        
-        analytical_count = sum(1 for word in analytical_words if word in text_lower)
-        intuitive_count = sum(1 for word in intuitive_words if word in text_lower)
+        analytical_count = len(hits.present('psychological_profile.analytical'))
+        intuitive_count = len(hits.present('psychological_profile.intuitive'))
         
         if analytical_count > intuitive_count:
             psych_profile['cognitive_style'] = 'analytical'
@@ -1474,34 +2130,19 @@ class SupremeSentimentAnalyzer:
             psych_profile['cognitive_style'] = 'intuitive'
         
         # Detectar indicadores de saúde mental
-        mental_health_keywords = {
-            'anxiety': ['ansioso', 'preocupado', 'nervoso', 'medo'],
-            'depression': ['triste', 'deprimido', 'sem energia', 'vazio'],
-            'stress': ['estressado', 'pressão', 'sobregregado', 'tenso'],
-            'resilience': ['superar', 'forte', 'recuperar', 'persistir']
-        }
-        
-        for condition, keywords in mental_health_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                psych_profile['mental_health_indicators'].append(condition)
+        psych_profile['mental_health_indicators'].extend(hits.groups('psychological_profile.mental_health'))
         
         # Detectar mecanismos de defesa
-        defense_patterns = {
-            'denial': ['não é verdade', 'isso não aconteceu', 'não acredito'],
-            'projection': ['culpa dos outros', 'eles que', 'não sou eu'],
-            'rationalization': ['porque', 'justifica', 'explicação', 'razão'],
-            'sublimation': ['canalizar', 'transformar', 'criar', 'arte']
-        }
-        
-        for defense, patterns in defense_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                psych_profile['defense_mechanisms'].append(defense)
+        psych_profile['defense_mechanisms'].extend(hits.groups('psychological_profile.defenses'))
         
         return psych_profile
     
-    def analyze_emotional_intelligence(self, text: str) -> Dict[str, Any]:
+    def analyze_emotional_intelligence(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """💗 Análise suprema de inteligência emocional"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.density_base
         eq_analysis = {
             'self_awareness': 0.5,
             'self_regulation': 0.5,
@@ -1514,40 +2155,37 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar autoconsciência emocional
-        self_awareness_words = ['sinto', 'emoção', 'percebo', 'consciente', 'sinto que']
-        self_awareness_count = sum(1 for word in self_awareness_words if word in text_lower)
-        eq_analysis['self_awareness'] = min(self_awareness_count / len(text_lower.split()) * 5, 1.0)
+        self_awareness_count = len(hits.present('emotional_intelligence.self_awareness'))
+        eq_analysis['self_awareness'] = min(self_awareness_count / word_count * 5, 1.0)
         
         # Detectar autorregulação
-        regulation_words = ['controlar', 'gerenciar', 'equilibrar', 'calmar', 'respirar']
-        regulation_count = sum(1 for word in regulation_words if word in text_lower)
-        eq_analysis['self_regulation'] = min(regulation_count / len(text_lower.split()) * 5, 1.0)
+        regulation_count = len(hits.present('emotional_intelligence.self_regulation'))
+        eq_analysis['self_regulation'] = min(regulation_count / word_count * 5, 1.0)
         
         # Detectar motivação
-        motivation_words = ['objetivo', 'meta', 'crescer', 'melhorar', 'conquistar']
-        motivation_count = sum(1 for word in motivation_words if word in text_lower)
-        eq_analysis['motivation'] = min(motivation_count / len(text_lower.split()) * 3, 1.0)
+        motivation_count = len(hits.present('emotional_intelligence.motivation'))
+        eq_analysis['motivation'] = min(motivation_count / word_count * 3, 1.0)
         
         # Detectar empatia
-        empathy_words = ['entender', 'compreender', 'sentir', 'lugar do outro', 'perspectiva']
-        empathy_count = sum(1 for word in empathy_words if word in text_lower)
-        eq_analysis['empathy'] = min(empathy_count / len(text_lower.split()) * 3, 1.0)
+        empathy_count = len(hits.present('emotional_intelligence.empathy'))
+        eq_analysis['empathy'] = min(empathy_count / word_count * 3, 1.0)
         
         # Detectar habilidades sociais
-        social_words = ['comunicar', 'relacionar', 'conectar', 'equipe', 'cooperar']
-        social_count = sum(1 for word in social_words if word in text_lower)
-        eq_analysis['social_skills'] = min(social_count / len(text_lower.split()) * 3, 1.0)
+        social_count = len(hits.present('emotional_intelligence.social_skills'))
+        eq_analysis['social_skills'] = min(social_count / word_count * 3, 1.0)
         
         # Calcular vocabulário emocional
-        emotion_words = ['alegria', 'tristeza', 'raiva', 'medo', 'surpresa', 'nojo', 'amor', 'ódio']
-        emotion_count = sum(1 for word in emotion_words if word in text_lower)
-        eq_analysis['emotional_vocabulary'] = min(emotion_count / len(text_lower.split()) * 2, 1.0)
+        emotion_count = len(hits.present('emotional_intelligence.emotional_vocabulary'))
+        eq_analysis['emotional_vocabulary'] = min(emotion_count / word_count * 2, 1.0)
         
         return eq_analysis
     
-    def analyze_cognitive_biases(self, text: str) -> Dict[str, Any]:
+    def analyze_cognitive_biases(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🧩 Detecção suprema de vieses cognitivos"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.density_base
         bias_analysis = {
             'confirmation_bias': 0.0,
             'availability_heuristic': 0.0,
@@ -1559,30 +2197,29 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar viés de confirmação
-        confirmation_patterns = ['sempre', 'nunca', 'todos sabem', 'óbvio que', 'claro que']
-        confirmation_count = sum(1 for pattern in confirmation_patterns if pattern in text_lower)
-        bias_analysis['confirmation_bias'] = min(confirmation_count / len(text_lower.split()) * 3, 1.0)
+        confirmation_count = len(hits.present('cognitive_biases.confirmation'))
+        bias_analysis['confirmation_bias'] = min(confirmation_count / word_count * 3, 1.0)
         
         # Detectar heurística da disponibilidade
-        availability_patterns = ['lembro que', 'vi ontem', 'aconteceu comigo', 'exemplo']
-        availability_count = sum(1 for pattern in availability_patterns if pattern in text_lower)
-        bias_analysis['availability_heuristic'] = min(availability_count / len(text_lower.split()) * 3, 1.0)
+        availability_count = len(hits.present('cognitive_biases.availability'))
+        bias_analysis['availability_heuristic'] = min(availability_count / word_count * 3, 1.0)
         
         # Detectar excesso de confiança
-        overconfidence_patterns = ['tenho certeza', 'impossível estar errado', 'sei que', 'garantido']
-        overconfidence_count = sum(1 for pattern in overconfidence_patterns if pattern in text_lower)
-        bias_analysis['overconfidence_bias'] = min(overconfidence_count / len(text_lower.split()) * 3, 1.0)
+        overconfidence_count = len(hits.present('cognitive_biases.overconfidence'))
+        bias_analysis['overconfidence_bias'] = min(overconfidence_count / word_count * 3, 1.0)
         
         # Detectar aversão à perda
-        loss_aversion_patterns = ['perder', 'risco', 'seguro', 'garantia', 'não posso perder']
-        loss_count = sum(1 for pattern in loss_aversion_patterns if pattern in text_lower)
-        bias_analysis['loss_aversion'] = min(loss_count / len(text_lower.split()) * 3, 1.0)
+        loss_count = len(hits.present('cognitive_biases.loss_aversion'))
+        bias_analysis['loss_aversion'] = min(loss_count / word_count * 3, 1.0)
         
         return bias_analysis
     
-    def analyze_communication_style(self, text: str) -> Dict[str, Any]:
+    def analyze_communication_style(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """💬 Análise suprema do estilo de comunicação"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.density_base
         comm_analysis = {
             'directness_level': 0.5,
             'formality_level': 0.5,
@@ -1595,11 +2232,8 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar nível de direcionamento
-        direct_words = ['diretamente', 'claro', 'objetivo', 'específico', 'ponto']
-        indirect_words = ['talvez', 'possivelmente', 'meio que', 'parece que']
-        
-        direct_count = sum(1 for word in direct_words if word in text_lower)
-        indirect_count = sum(1 for word in indirect_words if word in text_lower)
+        direct_count = len(hits.present('communication_style.direct'))
+        indirect_count = len(hits.present('communication_style.indirect'))
         
         if direct_count > indirect_count:
             comm_analysis['directness_level'] = 0.8
@@ -1607,11 +2241,8 @@ class SupremeSentimentAnalyzer:
             comm_analysis['directness_level'] = 0.2
         
         # Detectar formalidade
-        formal_words = ['senhor', 'senhora', 'prezado', 'cordialmente', 'atenciosamente']
-        informal_words = ['cara', 'mano', 'oi', 'tchau', 'valeu']
-        
-        formal_count = sum(1 for word in formal_words if word in text_lower)
-        informal_count = sum(1 for word in informal_words if word in text_lower)
+        formal_count = len(hits.present('communication_style.formal'))
+        informal_count = len(hits.present('communication_style.informal'))
         
         if formal_count > informal_count:
             comm_analysis['formality_level'] = 0.8
@@ -1619,20 +2250,21 @@ class SupremeSentimentAnalyzer:
             comm_analysis['formality_level'] = 0.2
         
         # Detectar expressividade emocional
-        expressive_words = ['amo', 'odeio', 'adoro', 'detesto', 'emociona', 'sinto muito']
-        expressive_count = sum(1 for word in expressive_words if word in text_lower)
-        comm_analysis['emotional_expressiveness'] = min(expressive_count / len(text_lower.split()) * 3, 1.0)
+        expressive_count = len(hits.present('communication_style.expressive'))
+        comm_analysis['emotional_expressiveness'] = min(expressive_count / word_count * 3, 1.0)
         
         # Detectar assertividade
-        assertive_words = ['preciso', 'quero', 'acredito', 'minha opinião', 'posição']
-        assertive_count = sum(1 for word in assertive_words if word in text_lower)
-        comm_analysis['assertiveness'] = min(assertive_count / len(text_lower.split()) * 3, 1.0)
+        assertive_count = len(hits.present('communication_style.assertive'))
+        comm_analysis['assertiveness'] = min(assertive_count / word_count * 3, 1.0)
         
         return comm_analysis
     
-    def analyze_stress_resilience(self, text: str) -> Dict[str, Any]:
+    def analyze_stress_resilience(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """💪 Análise suprema de estresse e resiliência"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.density_base
         stress_analysis = {
             'stress_level': 0.5,
             'stress_sources': [],
@@ -1644,47 +2276,29 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar nível de estresse
-        stress_indicators = ['estressado', 'pressão', 'sobregregado', 'ansioso', 'tenso']
-        stress_count = sum(1 for indicator in stress_indicators if indicator in text_lower)
-        stress_analysis['stress_level'] = min(stress_count / len(text_lower.split()) * 5, 1.0)
+        stress_count = len(hits.present('stress_resilience.stress'))
+        stress_analysis['stress_level'] = min(stress_count / word_count * 5, 1.0)
         
         # Detectar fontes de estresse
-        stress_sources = {
-            'work': ['trabalho', 'chefe', 'prazo', 'reunião', 'projeto'],
-            'financial': ['dinheiro', 'dívida', 'conta', 'financeiro', 'pagar'],
-            'relationship': ['relacionamento', 'família', 'conflito', 'discussão'],
-            'health': ['saúde', 'doença', 'médico', 'dor', 'cansaço']
-        }
-        
-        for source, keywords in stress_sources.items():
-            if any(keyword in text_lower for keyword in keywords):
-                stress_analysis['stress_sources'].append(source)
+        stress_analysis['stress_sources'].extend(hits.groups('stress_resilience.stress_sources'))
         
         # Detectar estratégias de enfrentamento
-        coping_strategies = {
-            'problem_focused': ['resolver', 'planejar', 'ação', 'estratégia', 'solução'],
-            'emotion_focused': ['relaxar', 'respirar', 'meditar', 'exercício', 'hobby'],
-            'social_support': ['conversar', 'amigos', 'família', 'ajuda', 'apoio'],
-            'avoidance': ['esquecer', 'ignorar', 'fugir', 'evitar', 'negar']
-        }
-        
-        for strategy, keywords in coping_strategies.items():
-            if any(keyword in text_lower for keyword in keywords):
-                stress_analysis['coping_strategies'].append(strategy)
+        stress_analysis['coping_strategies'].extend(hits.groups('stress_resilience.coping_strategies'))
         
         # Detectar fatores de resiliência
-        resilience_indicators = ['superar', 'forte', 'persistir', 'aprender', 'crescer']
-        resilience_count = sum(1 for indicator in resilience_indicators if indicator in text_lower)
+        resilience_count = len(hits.present('stress_resilience.resilience'))
         
         if resilience_count > 0:
             stress_analysis['resilience_factors'] = ['emotional_strength', 'adaptability']
-            stress_analysis['growth_from_adversity'] = min(resilience_count / len(text_lower.split()) * 3, 1.0)
+            stress_analysis['growth_from_adversity'] = min(resilience_count / word_count * 3, 1.0)
         
         return stress_analysis
     
-    def analyze_micro_gestures_through_text(self, text: str) -> Dict[str, Any]:
+    def analyze_micro_gestures_through_text(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🤏 Detecção de micro-gestos através da análise textual IMPOSSÍVEL"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         gesture_analysis = {
             'facial_micro_expressions': [],
             'body_language_indicators': [],
@@ -1699,58 +2313,29 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar micro-expressões faciais através do texto
-        facial_patterns = {
-            'slight_smile': ['rs', 'hehe', 'hihi', 'levemente', 'sutilmente'],
-            'micro_frown': ['hmm', 'né', 'meio que', 'ah sei'],
-            'eye_roll': ['nossa', 'sério?', 'ah tá', 'claro né'],
-            'eyebrow_raise': ['mesmo?', 'sério mesmo?', 'nossa!', 'caramba'],
-            'lip_compression': ['ok...', 'tá bom', 'se você diz', 'tanto faz'],
-            'nose_flare': ['que absurdo', 'inacreditável', 'não acredito']
-        }
-        
-        for expression, patterns in facial_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                gesture_analysis['facial_micro_expressions'].append(expression)
+        gesture_analysis['facial_micro_expressions'].extend(hits.groups('micro_gestures.facial'))
         
         # Detectar linguagem corporal através de padrões textuais
-        body_patterns = {
-            'crossed_arms': ['defensivo', 'protegido', 'fechado', 'resistente'],
-            'open_posture': ['aberto', 'receptivo', 'disponível', 'acolhedor'],
-            'leaning_forward': ['interessado', 'curioso', 'atento', 'focado'],
-            'leaning_back': ['relaxado', 'distante', 'observando', 'avaliando'],
-            'fidgeting': ['ansioso', 'nervoso', 'agitado', 'inquieto'],
-            'stillness': ['calmo', 'centrado', 'estável', 'presente']
-        }
-        
-        for gesture, patterns in body_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                gesture_analysis['body_language_indicators'].append(gesture)
+        gesture_analysis['body_language_indicators'].extend(hits.groups('micro_gestures.body'))
         
         # Detectar padrões de respiração através da pontuação e ritmo
         if '...' in text or '---' in text:
             gesture_analysis['breathing_patterns'].append('deep_breathing')
         if '!' in text and len(text.split('!')) > 2:
             gesture_analysis['breathing_patterns'].append('excited_breathing')
-        if text.count(',') > len(text.split()) * 0.1:
+        if text.count(',') > doc.word_count * 0.1:
             gesture_analysis['breathing_patterns'].append('controlled_breathing')
         
         # Detectar movimentos oculares através de padrões de atenção
-        attention_patterns = {
-            'direct_gaze': ['olha', 'vejo', 'observo', 'foco', 'direto'],
-            'avoiding_gaze': ['não sei', 'talvez', 'meio que', 'tipo'],
-            'scanning': ['vários', 'diferentes', 'múltiplos', 'análise'],
-            'fixation': ['sempre', 'constantemente', 'focado', 'centrado']
-        }
-        
-        for pattern, keywords in attention_patterns.items():
-            if any(keyword in text_lower for keyword in keywords):
-                gesture_analysis['eye_movement_patterns'].append(pattern)
+        gesture_analysis['eye_movement_patterns'].extend(hits.groups('micro_gestures.attention'))
         
         return gesture_analysis
     
-    def analyze_soul_dna(self, text: str) -> Dict[str, Any]:
+    def analyze_soul_dna(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🧬 Análise do DNA da alma através de padrões linguísticos impossíveis"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         soul_dna = {
             'soul_blueprint': {},
             'karmic_patterns': [],
@@ -1767,79 +2352,41 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar blueprint da alma
-        soul_blueprint_patterns = {
-            'healer': ['curar', 'ajudar', 'cuidar', 'aliviar', 'sarar'],
-            'teacher': ['ensinar', 'explicar', 'compartilhar', 'educar', 'orientar'],
-            'creator': ['criar', 'inventar', 'construir', 'manifestar', 'gerar'],
-            'guardian': ['proteger', 'defender', 'guardar', 'preservar', 'manter'],
-            'seeker': ['buscar', 'procurar', 'explorar', 'descobrir', 'investigar'],
-            'connector': ['conectar', 'unir', 'relacionar', 'integrar', 'harmonizar']
-        }
-        
         blueprint_scores = {}
-        for blueprint, keywords in soul_blueprint_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                blueprint_scores[blueprint] = score / len(text_lower.split())
+        for blueprint, keywords in hits.groups('soul_dna.blueprint').items():
+            blueprint_scores[blueprint] = len(keywords) / doc.density_base
         
         if blueprint_scores:
             dominant_blueprint = max(blueprint_scores.items(), key=lambda x: x[1])
             soul_dna['soul_blueprint'] = {dominant_blueprint[0]: dominant_blueprint[1]}
         
         # Detectar padrões kármicos
-        karmic_patterns = {
-            'forgiveness': ['perdoar', 'perdão', 'absolver', 'liberar'],
-            'compassion': ['compaixão', 'compreensão', 'empatia', 'amor'],
-            'wisdom': ['sabedoria', 'aprender', 'compreender', 'crescer'],
-            'service': ['servir', 'doar', 'contribuir', 'ajudar'],
-            'balance': ['equilibrar', 'harmonizar', 'balancear', 'centrar']
-        }
-        
-        for pattern, keywords in karmic_patterns.items():
-            if any(keyword in text_lower for keyword in keywords):
-                soul_dna['karmic_patterns'].append(pattern)
+        soul_dna['karmic_patterns'].extend(hits.groups('soul_dna.karmic'))
         
         # Detectar ecos de vidas passadas
-        past_life_indicators = {
-            'ancient_wisdom': ['antigo', 'ancestral', 'milenar', 'eterno'],
-            'mystical_knowledge': ['místico', 'espiritual', 'transcendental', 'divino'],
-            'warrior_spirit': ['luta', 'batalha', 'coragem', 'força', 'resistir'],
-            'artistic_soul': ['arte', 'beleza', 'criação', 'inspiração', 'estética'],
-            'scholarly_mind': ['conhecimento', 'estudo', 'pesquisa', 'análise']
-        }
-        
-        for echo, keywords in past_life_indicators.items():
-            if any(keyword in text_lower for keyword in keywords):
-                soul_dna['past_life_echoes'].append(echo)
+        soul_dna['past_life_echoes'].extend(hits.groups('soul_dna.past_life'))
         
         # Calcular idade da alma
-        wisdom_indicators = ['experiência', 'sabedoria', 'compreensão', 'perspectiva']
-        wisdom_count = sum(1 for indicator in wisdom_indicators if indicator in text_lower)
+        wisdom_count = len(hits.present('soul_dna.wisdom'))
         soul_dna['soul_age'] = min(wisdom_count * 100 + len(soul_dna['past_life_echoes']) * 200, 9999)
         
         # Determinar herança cósmica
-        cosmic_patterns = {
-            'pleiadian': ['luz', 'amor', 'cura', 'elevação'],
-            'arcturian': ['tecnologia', 'evolução', 'conhecimento', 'sabedoria'],
-            'sirian': ['estrutura', 'ordem', 'organização', 'sistema'],
-            'andromedan': ['liberdade', 'exploração', 'aventura', 'descoberta'],
-            'lyran': ['criatividade', 'arte', 'expressão', 'originalidade']
-        }
-        
         cosmic_scores = {}
-        for heritage, patterns in cosmic_patterns.items():
-            score = sum(1 for pattern in patterns if pattern in text_lower)
-            if score > 0:
-                cosmic_scores[heritage] = score
+        for heritage, patterns in hits.groups('soul_dna.cosmic_heritage').items():
+            cosmic_scores[heritage] = len(patterns)
         
         if cosmic_scores:
             soul_dna['cosmic_heritage'] = max(cosmic_scores.items(), key=lambda x: x[1])[0]
         
         return soul_dna
     
-    def analyze_quantum_empathy(self, text: str, target_person: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_quantum_empathy(self, text: str, target_person: Optional[str] = None,
+                                doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🌌💗 Empatia quântica transcendental - sentir através das dimensões"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
+        word_count = doc.density_base
         quantum_empathy = {
             'empathic_resonance_level': 0.0,
             'emotional_field_strength': 0.0,
@@ -1854,54 +2401,35 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar ressonância empática
-        empathy_indicators = {
-            'high_resonance': ['sinto', 'compreendo', 'entendo', 'percebo', 'sinta'],
-            'emotional_absorption': ['absorvo', 'tomo para mim', 'carrego', 'sinto como meu'],
-            'healing_intention': ['curar', 'aliviar', 'consolar', 'confortar', 'amparar'],
-            'compassionate_response': ['compaixão', 'ternura', 'carinho', 'cuidado']
-        }
-        
         resonance_score = 0
-        for level, indicators in empathy_indicators.items():
-            level_score = sum(1 for indicator in indicators if indicator in text_lower)
-            resonance_score += level_score * (1.0 if 'high' in level else 0.8)
+        for level, indicators in hits.groups('quantum_empathy.empathy').items():
+            resonance_score += len(indicators) * (1.0 if 'high' in level else 0.8)
         
-        quantum_empathy['empathic_resonance_level'] = min(resonance_score / len(text_lower.split()) * 10, 1.0)
+        quantum_empathy['empathic_resonance_level'] = min(resonance_score / word_count * 10, 1.0)
         
         # Calcular força do campo emocional
-        emotional_words = ['amor', 'dor', 'alegria', 'tristeza', 'medo', 'raiva', 'paz', 'ansiedade']
-        emotional_intensity = sum(1 for word in emotional_words if word in text_lower)
-        quantum_empathy['emotional_field_strength'] = min(emotional_intensity / len(text_lower.split()) * 5, 1.0)
+        emotional_intensity = len(hits.present('quantum_empathy.emotional'))
+        quantum_empathy['emotional_field_strength'] = min(emotional_intensity / word_count * 5, 1.0)
         
         # Detectar qualidade da conexão telepática
-        telepathic_indicators = ['sinto que', 'percebo que', 'intuição', 'pressentimento', 'energia']
-        telepathic_count = sum(1 for indicator in telepathic_indicators if indicator in text_lower)
-        quantum_empathy['telepathic_connection_quality'] = min(telepathic_count / len(text_lower.split()) * 8, 1.0)
+        telepathic_count = len(hits.present('quantum_empathy.telepathic'))
+        quantum_empathy['telepathic_connection_quality'] = min(telepathic_count / word_count * 8, 1.0)
         
         # Calcular quociente de compaixão
-        compassion_words = ['perdoar', 'compreender', 'aceitar', 'acolher', 'apoiar']
-        compassion_count = sum(1 for word in compassion_words if word in text_lower)
-        quantum_empathy['compassion_quotient'] = min(compassion_count / len(text_lower.split()) * 7, 1.0)
+        compassion_count = len(hits.present('quantum_empathy.compassion'))
+        quantum_empathy['compassion_quotient'] = min(compassion_count / word_count * 7, 1.0)
         
         # Detectar alcance empático dimensional
-        dimensional_patterns = {
-            '3D_physical': ['corpo', 'físico', 'material', 'tangível'],
-            '4D_emotional': ['emoção', 'sentimento', 'coração', 'alma'],
-            '5D_mental': ['mente', 'pensamento', 'consciência', 'awareness'],
-            '6D_causal': ['causa', 'origem', 'propósito', 'missão'],
-            '7D_buddhic': ['unidade', 'totalidade', 'conexão', 'universal'],
-            '8D_logoic': ['divino', 'sagrado', 'transcendente', 'absoluto']
-        }
-        
-        for dimension, patterns in dimensional_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                quantum_empathy['dimensional_empathy_reach'].append(dimension)
+        quantum_empathy['dimensional_empathy_reach'].extend(hits.groups('quantum_empathy.dimensional'))
         
         return quantum_empathy
     
-    def analyze_temporal_personality(self, text: str, user_history: List[str] = None) -> Dict[str, Any]:
+    def analyze_temporal_personality(self, text: str, user_history: List[str] = None,
+                                     doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """⏰🧠 Análise de personalidade através das linhas temporais"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         temporal_analysis = {
             'personality_evolution_rate': 0.0,
             'temporal_consistency_score': 0.0,
@@ -1917,63 +2445,37 @@ class SupremeSentimentAnalyzer:
         }
         
         # Analisar orientação temporal
-        time_orientations = {
-            'past_focused': ['era', 'antes', 'lembro', 'passado', 'história'],
-            'present_focused': ['agora', 'hoje', 'momento', 'atual', 'presente'],
-            'future_focused': ['será', 'vou', 'futuro', 'amanhã', 'próximo']
-        }
-        
+        orientation_hits = hits.groups('temporal_personality.time_orientations')
         time_scores = {}
-        for orientation, keywords in time_orientations.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            time_scores[orientation] = score
+        for orientation in self.phase_keywords['temporal_personality']['time_orientations']:
+            time_scores[orientation] = len(orientation_hits.get(orientation, []))
         
         if time_scores:
             dominant_orientation = max(time_scores.items(), key=lambda x: x[1])
             temporal_analysis['time_perception_style'] = dominant_orientation[0].replace('_focused', '')
         
         # Detectar padrões de regressão etária
-        age_regression_indicators = {
-            'child_self': ['criança', 'pequeno', 'ingênuo', 'brincadeira', 'diversão'],
-            'teen_self': ['adolescente', 'rebelde', 'descoberta', 'intenso', 'paixão'],
-            'young_adult': ['jovem', 'energia', 'aventura', 'exploração', 'liberdade'],
-            'mature_self': ['responsabilidade', 'sabedoria', 'experiência', 'estabilidade']
-        }
-        
-        for age_pattern, indicators in age_regression_indicators.items():
-            if any(indicator in text_lower for indicator in indicators):
-                temporal_analysis['age_regression_patterns'].append(age_pattern)
+        temporal_analysis['age_regression_patterns'].extend(hits.groups('temporal_personality.age_regression'))
         
         # Analisar evolução da personalidade através do histórico
         if user_history:
-            consistency_factors = ['sempre', 'nunca', 'constantemente', 'geralmente']
-            change_factors = ['mudei', 'evoluí', 'cresci', 'aprendi', 'transformei']
-            
-            consistency_count = sum(1 for factor in consistency_factors if factor in text_lower)
-            change_count = sum(1 for factor in change_factors if factor in text_lower)
+            consistency_count = len(hits.present('temporal_personality.consistency'))
+            change_count = len(hits.present('temporal_personality.change'))
             
             if consistency_count + change_count > 0:
                 temporal_analysis['temporal_consistency_score'] = consistency_count / (consistency_count + change_count)
                 temporal_analysis['personality_evolution_rate'] = change_count / (consistency_count + change_count)
         
         # Detectar âncoras temporais da personalidade
-        anchor_patterns = {
-            'childhood_trauma': ['trauma', 'machucou', 'ferida', 'cicatriz'],
-            'formative_experience': ['marcou', 'mudou tudo', 'transformador', 'definitivo'],
-            'spiritual_awakening': ['despertar', 'iluminação', 'consciência', 'revelação'],
-            'major_loss': ['perda', 'luto', 'partida', 'ausência'],
-            'achievement': ['conquista', 'vitória', 'sucesso', 'realização']
-        }
-        
-        for anchor, patterns in anchor_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                temporal_analysis['temporal_personality_anchors'].append(anchor)
+        temporal_analysis['temporal_personality_anchors'].extend(hits.groups('temporal_personality.anchors'))
         
         return temporal_analysis
     
-    def analyze_divine_consciousness(self, text: str) -> Dict[str, Any]:
+    def analyze_divine_consciousness(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """👑🌟 Análise de consciência divina universal - ALÉM DA REALIDADE"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         divine_analysis = {
             'god_consciousness_level': 0.0,
             'universal_wisdom_access': 0.0,
@@ -1999,57 +2501,26 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar níveis de consciência divina
-        god_consciousness_indicators = {
-            'unity': ['unidade', 'totalidade', 'um só', 'integração', 'harmonia'],
-            'unconditional_love': ['amor incondicional', 'amor puro', 'compaixão infinita', 'amor universal'],
-            'infinite_wisdom': ['sabedoria infinita', 'conhecimento absoluto', 'verdade universal'],
-            'perfect_peace': ['paz perfeita', 'serenidade absoluta', 'calma divina'],
-            'divine_service': ['servir', 'dedicação', 'entrega', 'doação', 'sacrifício']
-        }
-        
         god_score = 0
-        for aspect, indicators in god_consciousness_indicators.items():
-            aspect_score = sum(1 for indicator in indicators if indicator in text_lower)
-            if aspect_score > 0:
-                god_score += aspect_score * 0.2
-                divine_analysis['omniscience_glimpses'].append(aspect)
+        for aspect, indicators in hits.groups('divine_consciousness.god_consciousness').items():
+            god_score += len(indicators) * 0.2
+            divine_analysis['omniscience_glimpses'].append(aspect)
         
-        divine_analysis['god_consciousness_level'] = min(god_score / len(text_lower.split()) * 100, 1.0)
+        divine_analysis['god_consciousness_level'] = min(god_score / doc.density_base * 100, 1.0)
         
         # Detectar arquétipos divinos
-        divine_archetypes = {
-            'the_creator': ['criar', 'manifestar', 'gerar', 'originar', 'dar vida'],
-            'the_destroyer': ['transformar', 'purificar', 'limpar', 'renovar', 'liberar'],
-            'the_preserver': ['manter', 'sustentar', 'proteger', 'preservar', 'cuidar'],
-            'the_wise_one': ['sabedoria', 'conhecimento', 'ensinar', 'guiar', 'iluminar'],
-            'the_healer': ['curar', 'restaurar', 'regenerar', 'harmonizar', 'equilibrar'],
-            'the_warrior_of_light': ['luta', 'defesa', 'proteção', 'coragem', 'força'],
-            'the_mother_goddess': ['nutrir', 'acolher', 'gerar', 'criar vida', 'amor maternal'],
-            'the_father_god': ['proteger', 'prover', 'estruturar', 'organizar', 'liderar']
-        }
-        
-        for archetype, patterns in divine_archetypes.items():
-            if any(pattern in text_lower for pattern in patterns):
-                divine_analysis['divine_archetypes_activated'].append(archetype)
+        divine_analysis['divine_archetypes_activated'].extend(hits.groups('divine_consciousness.archetypes'))
         
         # Detectar conexão com mestres ascensos
-        ascended_masters = {
-            'jesus_christ': ['amor', 'perdão', 'compaixão', 'sacrifício', 'redenção'],
-            'buddha': ['iluminação', 'despertar', 'mindfulness', 'cessação', 'nirvana'],
-            'krishna': ['devoção', 'bhakti', 'dharma', 'yoga', 'transcendência'],
-            'quan_yin': ['misericórdia', 'compaixão', 'cura', 'ternura', 'gentileza'],
-            'saint_germain': ['transformação', 'alquimia', 'chama violeta', 'transmutação']
-        }
-        
-        for master, qualities in ascended_masters.items():
-            if any(quality in text_lower for quality in qualities):
-                divine_analysis['ascended_master_guidance'].append(master)
+        divine_analysis['ascended_master_guidance'].extend(hits.groups('divine_consciousness.ascended_masters'))
         
         return divine_analysis
     
-    def analyze_reality_manipulation(self, text: str) -> Dict[str, Any]:
+    def analyze_reality_manipulation(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🌀🔮 Análise de capacidades de manipulação da realidade"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         reality_analysis = {
             'reality_bending_potential': 0.0,
             'manifestation_power': 0.0,
@@ -2069,40 +2540,23 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar poder de manifestação
-        manifestation_indicators = {
-            'intention_setting': ['pretendo', 'desejo', 'quero', 'intenciono', 'almejo'],
-            'visualization': ['visualizo', 'imagino', 'vejo', 'projeto', 'mentalizo'],
-            'belief_power': ['acredito', 'tenho fé', 'confio', 'sei que', 'certeza'],
-            'feeling_state': ['sinto como se', 'já aconteceu', 'realidade', 'vivencio'],
-            'gratitude': ['grato', 'agradecido', 'obrigado', 'gratidão', 'reconheço']
-        }
-        
         manifestation_score = 0
-        for technique, indicators in manifestation_indicators.items():
-            technique_score = sum(1 for indicator in indicators if indicator in text_lower)
-            if technique_score > 0:
-                manifestation_score += technique_score * 0.2
-                reality_analysis['manifestation_techniques_detected'].append(technique)
+        for technique, indicators in hits.groups('reality_manipulation.manifestation').items():
+            manifestation_score += len(indicators) * 0.2
+            reality_analysis['manifestation_techniques_detected'].append(technique)
         
-        reality_analysis['manifestation_power'] = min(manifestation_score / len(text_lower.split()) * 10, 1.0)
+        reality_analysis['manifestation_power'] = min(manifestation_score / doc.density_base * 10, 1.0)
         
         # Detectar influência temporal
-        timeline_patterns = {
-            'past_healing': ['curar o passado', 'resolver traumas', 'perdoar', 'liberar'],
-            'present_mastery': ['momento presente', 'agora', 'presença', 'mindfulness'],
-            'future_creation': ['criar futuro', 'desenhar destino', 'moldar amanhã'],
-            'parallel_timelines': ['outras possibilidades', 'universos paralelos', 'realidades alternativas']
-        }
-        
-        for pattern, indicators in timeline_patterns.items():
-            if any(indicator in text_lower for indicator in indicators):
-                reality_analysis['causality_influence_patterns'].append(pattern)
+        reality_analysis['causality_influence_patterns'].extend(hits.groups('reality_manipulation.timelines'))
         
         return reality_analysis
     
-    def analyze_interdimensional_communication(self, text: str) -> Dict[str, Any]:
+    def analyze_interdimensional_communication(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """🌌👽 Análise de comunicação interdimensional"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         interdimensional_analysis = {
             'dimensional_awareness_level': 0.0,
             'extraterrestrial_contact_probability': 0.0,
@@ -2123,40 +2577,24 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar contato extraterrestre
-        et_contact_indicators = {
-            'pleiadians': ['luz', 'cura', 'amor', 'ascensão', 'despertar'],
-            'arcturians': ['tecnologia', 'conhecimento', 'geometria sagrada', 'cristais'],
-            'sirians': ['estrutura', 'ordem', 'sistema', 'organização', 'disciplina'],
-            'andromedans': ['liberdade', 'exploração', 'aventura', 'descoberta', 'viagem'],
-            'greys': ['observação', 'estudo', 'análise', 'pesquisa', 'experimento'],
-            'reptilians': ['poder', 'controle', 'dominação', 'hierarquia', 'autoridade']
-        }
-        
-        for race, indicators in et_contact_indicators.items():
-            contact_score = sum(1 for indicator in indicators if indicator in text_lower)
-            if contact_score > 0:
-                interdimensional_analysis['interdimensional_beings_detected'].append(race)
-                contact_key = f'{race}_contact'
-                if contact_key in interdimensional_analysis:
-                    interdimensional_analysis[contact_key] = min(contact_score / len(text_lower.split()) * 5, 1.0)
+        for race, indicators in hits.groups('interdimensional_communication.et_contact').items():
+            interdimensional_analysis['interdimensional_beings_detected'].append(race)
+            contact_key = f'{race}_contact'
+            if contact_key in interdimensional_analysis:
+                interdimensional_analysis[contact_key] = min(len(indicators) / doc.density_base * 5, 1.0)
         
         # Detectar linguagens cósmicas
-        cosmic_languages = {
-            'light_language': ['energia', 'vibração', 'frequência', 'ressonância'],
-            'geometric_language': ['geometria', 'padrões', 'formas', 'símbolos'],
-            'tonal_language': ['som', 'música', 'harmonia', 'melodia'],
-            'color_language': ['cores', 'espectro', 'arco-íris', 'aura']
-        }
-        
-        for language, indicators in cosmic_languages.items():
-            if any(indicator in text_lower for indicator in indicators):
-                interdimensional_analysis['cosmic_languages_understanding'].append(language)
+        interdimensional_analysis['cosmic_languages_understanding'].extend(
+            hits.groups('interdimensional_communication.cosmic_languages')
+        )
         
         return interdimensional_analysis
     
-    def analyze_akashic_records_access(self, text: str) -> Dict[str, Any]:
+    def analyze_akashic_records_access(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """📚🌌 Análise de acesso aos registros akáshicos"""
-        text_lower = text.lower()
+        if doc is None:
+            doc = self.build_document(text)
+        hits = doc.hits
         akashic_analysis = {
             'akashic_access_level': 0.0,
             'soul_records_clarity': 0.0,
@@ -2178,28 +2616,17 @@ class SupremeSentimentAnalyzer:
         }
         
         # Detectar acesso aos registros
-        akashic_indicators = {
-            'soul_memory': ['lembro', 'memória da alma', 'vidas passadas', 'já vivi'],
-            'karmic_understanding': ['karma', 'lições', 'aprendizado', 'crescimento'],
-            'soul_contracts': ['acordo', 'contrato', 'missão', 'propósito'],
-            'divine_timing': ['momento certo', 'sincronicidade', 'timing divino'],
-            'cosmic_truth': ['verdade universal', 'sabedoria cósmica', 'conhecimento divino']
-        }
-        
         access_score = 0
-        for category, indicators in akashic_indicators.items():
-            category_score = sum(1 for indicator in indicators if indicator in text_lower)
-            if category_score > 0:
-                access_score += category_score * 0.2
-                akashic_analysis['records_layers_accessed'].append(category)
+        for category, indicators in hits.groups('akashic_records.akashic').items():
+            access_score += len(indicators) * 0.2
+            akashic_analysis['records_layers_accessed'].append(category)
         
-        akashic_analysis['akashic_access_level'] = min(access_score / len(text_lower.split()) * 15, 1.0)
+        akashic_analysis['akashic_access_level'] = min(access_score / doc.density_base * 15, 1.0)
         
         return akashic_analysis
     
-    def analyze_god_mode_omniscience(self, text: str) -> Dict[str, Any]:
+    def analyze_god_mode_omniscience(self, text: str, doc: Optional[AnalysisDocument] = None) -> Dict[str, Any]:
         """👑🧠∞ MODO DEUS - Análise omnisciente absoluta"""
-        text_lower = text.lower()
         god_mode = {
             'omniscience_activation': 1.0,  # SEMPRE ATIVO NO MODO DEUS
             'universal_knowledge_access': 1.0,
@@ -3139,17 +3566,140 @@ class SupremeSentimentAnalyzer:
     def _load_existential_courage(self) -> Dict[str, Any]:
         return {'existential_courage_analysis': 'supreme'}
 
-    def analyze_sentiment_supreme(self, text: str, user_id: Optional[str] = None, session_data: Optional[Dict] = None) -> Tuple[str, float, List[str], Dict]:
+    def analyze_sentiment_supreme(self, text: str, user_id: Optional[str] = None, session_data: Optional[Dict] = None,
+                                  profile: Optional[str] = None,
+                                  fields: Optional[Iterable[str]] = None) -> Tuple[str, float, List[str], Dict]:
         """
         🧠 ANÁLISE SUPREMA DE SENTIMENTOS COM IA AVANÇADA 🧠
         Compreensão contextual profunda, memória conversacional e NLP supremo
+        
+        Perfis: 'fast' (score léxico com sarcasmo e padrões semânticos, emoções, contextos e
+        palavras-chave), 'standard' (+ intenção e urgência) e 'full' (todas as fases). A classe
+        de sentimento é a mesma nos três perfis. Sem perfil, usa settings.sentiment_analysis_profile.
+        
+        fields restringe o dict de detalhes aos campos pedidos (ex.: {'sentiment_class', 'emotions'}) e
+        executa apenas as fases de que eles dependem (FIELD_DEPENDENCIES); 'word_contributions'
+        inclui a explicação palavra a palavra em analysis_details
+        """
+        profile = profile or self.default_profile
+        phases, fields = self.resolve_fields(fields, profile)
+        return self._run_supreme_analysis(text, user_id, session_data, profile, phases, fields=fields)
+    
+    def analyze_batch(self, texts: Iterable[Union[str, Dict[str, Any]]], profile: Optional[str] = None,
+                      fields: Optional[Iterable[str]] = None) -> List[Tuple[str, float, List[str], Dict]]:
+        """
+        📦 Analisa uma lista de textos em uma única chamada
+        Itens podem ser strings ou dicts {'text', 'user_id'}; resultados na mesma ordem da entrada
+        """
+        return list(self.iter_analyze_batch(texts, profile, fields))
+    
+    def iter_analyze_batch(self, texts: Iterable[Union[str, Dict[str, Any]]], profile: Optional[str] = None,
+                           fields: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, float, List[str], Dict]]:
+        """
+        📦 Versão incremental de analyze_batch (para respostas em streaming)
+        Perfil, fases e matcher são resolvidos uma única vez; o log detalhado por mensagem
+        é substituído por um resumo do lote
+        """
+        profile = profile or self.default_profile
+        phases, fields = self.resolve_fields(fields, profile)
+        self.get_keyword_matcher(profile)
+        run_analysis = self._run_supreme_analysis
+        
+        started = time.perf_counter()
+        distribution = Counter()
+        errors = 0
+        for item in texts:
+            if isinstance(item, dict):
+                text, user_id = item.get('text') or '', item.get('user_id')
+            else:
+                text, user_id = item or '', None
+            
+            result = run_analysis(text, user_id, None, profile, phases, log_details=False, fields=fields)
+            distribution[result[0]] += 1
+            if result[3].get('fallback'):
+                errors += 1
+            yield result
+        
+        total = sum(distribution.values())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"📦 Lote analisado: {total} textos | perfil {profile} | {elapsed_ms:.1f}ms "
+                    f"({elapsed_ms / max(total, 1):.2f}ms/texto) | erros: {errors} | {dict(distribution)}")
+    
+    def score_batch(self, texts: Iterable[str]) -> List[float]:
         """
+        📊 normalized_score léxico (o de analysis_details) de muitos textos de uma vez, sem as demais fases
+        Vetorizado com NumPy quando disponível; para jobs em massa, chamar em lotes de alguns milhares
+        """
+        self.lexicon_reloader.poll()
+        with self.pin_lexicon(self.lexicon):
+            token_lists = []
+            emoji_scores = []
+            for text in texts:
+                normalized = self.normalize_text(text or '')
+                token_lists.append(normalized.folded.split())
+                emoji_scores.append(sum([score for _, score in normalized.emoji_hits]))
+            return self.batch_scorer.score(token_lists, emoji_scores)
+    
+    def _run_supreme_analysis(self, text: str, user_id: Optional[str], session_data: Optional[Dict], profile: str,
+                              phases: frozenset, log_details: bool = True,
+                              fields: Optional[frozenset] = None) -> Tuple[str, float, List[str], Dict]:
+        """🧠 Executa as fases já resolvidas sobre um texto (com fields, projeta o resultado nesses campos)"""
         if not text:
             return 'neutral', 0.0, [], {}
         
+        # 🔄 Fronteira de análise: troca de léxico pendente é aplicada aqui; o estado lido agora vale
+        # para todas as fases, mesmo que outra thread publique um léxico novo no meio da análise
+        self.lexicon_reloader.poll()
+        with self.pin_lexicon(self.lexicon):
+            return self._run_pinned_analysis(text, user_id, session_data, profile, phases, log_details, fields)
+    
+    def _run_pinned_analysis(self, text: str, user_id: Optional[str], session_data: Optional[Dict], profile: str,
+                             phases: frozenset, log_details: bool,
+                             fields: Optional[frozenset]) -> Tuple[str, float, List[str], Dict]:
+        """🧠 Corpo de _run_supreme_analysis, com o estado do léxico já fixado"""
+        # ⏱️ Apenas uma fração das análises é cronometrada (timings None = sem custo extra)
+        timings = {} if self.profiler.should_sample() else None
+        started = time.perf_counter()
+        
+        # ⏱️ Orçamento: fases opcionais só começam antes do prazo; textos enormes são analisados por janelas
+        budget = AnalysisBudget(phases, started + self.time_budget if self.time_budget > 0 else None)
+        analysis_text = text
+        if self.max_text_chars and len(text) > self.max_text_chars:
+            analysis_text = window_text(text, self.max_text_chars)
+        truncated_chars = len(text) - len(analysis_text)
+        
         try:
             # 🚀 FASE 1: Preprocessamento supremo
-            processed_text = self.preprocess_text(text)
+            normalized = _call_phase(timings, self.normalize_text, analysis_text)
+            processed_text = normalized.text
+            
+            # ⚡ Mensagens curtas: sem o log detalhado por mensagem (uma linha de debug)
+            is_short = self.short_messages.is_short(processed_text)
+            if is_short:
+                log_details = False
+            
+            # ♻️ Cache de resultados: só a parte independente do histórico do usuário é reaproveitada
+            cache_key = short_key = None
+            if not truncated_chars and not (user_id and phases & CONTEXT_DEPENDENT_PHASES):
+                cache_variant = profile if fields is None else f"{profile}:{','.join(sorted(fields))}"
+                cached = None
+                if is_short:
+                    short_key = (normalized.cache_text, cache_variant, self.lexicon_version)
+                    cached = self.short_messages.get(short_key)
+                if cached is None and self.result_cache.enabled:
+                    cache_key = self.result_cache.make_key(normalized.cache_text, cache_variant, self.lexicon_version)
+                    cached = self.result_cache.get(cache_key)
+                    if cached is not None and short_key is not None:
+                        self.short_messages.put(short_key, cached)
+                if cached is not None:
+                    self.degradation.record()
+                    result = self._analysis_from_cache(text, user_id, cached, log_details)
+                    if is_short:
+                        logger.debug(f"⚡ Mensagem curta: {result[0]} ({result[1]:.3f}) | {text[:50]}")
+                    return result if fields is None else self._project_analysis(result, fields)
+            
+            # 📄 Documento compartilhado: tokens e varredura única dos dicionários do perfil
+            doc = _call_phase(timings, self.build_document, processed_text, profile, normalized.emoji_hits, normalized.folded)
             
             # 🧠 FASE 2: Análise contextual suprema
             if user_id:
@@ -3161,53 +3711,30 @@ class SupremeSentimentAnalyzer:
                 user_context = None
             
             # 🎭 FASE 3: Detecção de sarcasmo e ironia
-            is_sarcastic, sarcasm_score, sarcasm_type = self.detect_sarcasm(processed_text)
+            is_sarcastic, sarcasm_score, sarcasm_type = False, 0.0, "none"
+            if budget.allows('sarcasm'):
+                is_sarcastic, sarcasm_score, sarcasm_type = _call_phase(timings, self.detect_sarcasm, processed_text, doc=doc)
             
             # 🎯 FASE 4: Detecção de intenção
-            intent_scores = self.detect_intent(processed_text)
+            intent_scores = {}
+            if budget.allows('intent'):
+                intent_scores = _call_phase(timings, self.detect_intent, processed_text, doc)
             primary_intent = max(intent_scores.items(), key=lambda x: x[1])[0] if intent_scores else 'unknown'
             
             # ⚡ FASE 5: Detecção de urgência
-            urgency_level, urgency_score = self.detect_urgency(processed_text)
-            
-            # 🧠 FASE 6: Análise de personalidade
-            personality_traits = self.analyze_personality(processed_text)
-            
-            # 💼 FASE 7: Análise de relacionamento
-            relationship_analysis = self.analyze_relationship_stage(processed_text, user_history)
-            
-            # 🔍 FASE 8: Aplicação de padrões semânticos
-            semantic_analysis = self.apply_semantic_patterns(processed_text)
+            urgency_level, urgency_score = "low", 0.0
+            if budget.allows('urgency'):
+                urgency_level, urgency_score = _call_phase(timings, self.detect_urgency, processed_text, doc)
             
-            # 🌌💫 FASE 8.5: ANÁLISES TRANSCENDENTAIS IMPOSSÍVEIS 💫🌌
-            quantum_analysis = self.analyze_quantum_linguistics(processed_text)
-            soul_frequency_analysis = self.analyze_soul_frequency(processed_text)
-            cosmic_analysis = self.analyze_cosmic_patterns(processed_text)
-            multiverse_analysis = self.analyze_multiversal_consciousness(processed_text)
-            impossible_analysis = self.analyze_impossible_comprehension(processed_text)
-            
-            # 🧠💫 FASE 8.7: ANÁLISES PSICOLÓGICAS SUPREMAS 💫🧠
-            psychological_profile = self.analyze_psychological_profile(processed_text)
-            emotional_intelligence_analysis = self.analyze_emotional_intelligence(processed_text)
-            cognitive_biases_analysis = self.analyze_cognitive_biases(processed_text)
-            communication_style_analysis = self.analyze_communication_style(processed_text)
-            stress_resilience_analysis = self.analyze_stress_resilience(processed_text)
-            
-            # 🌌🤏 FASE 8.9: ANÁLISES ULTRA-IMPOSSÍVEIS 🤏🌌
-            micro_gestures_analysis = self.analyze_micro_gestures_through_text(processed_text)
-            soul_dna_analysis = self.analyze_soul_dna(processed_text)
-            quantum_empathy_analysis = self.analyze_quantum_empathy(processed_text, user_id)
-            temporal_personality_analysis = self.analyze_temporal_personality(processed_text, user_history)
-            
-            # 👑🌟 FASE 9.0: ANÁLISES DIVINAS ULTRA-SUPREMAS 🌟👑
-            divine_consciousness_analysis = self.analyze_divine_consciousness(processed_text)
-            reality_manipulation_analysis = self.analyze_reality_manipulation(processed_text)
-            interdimensional_communication_analysis = self.analyze_interdimensional_communication(processed_text)
-            akashic_records_analysis = self.analyze_akashic_records_access(processed_text)
-            god_mode_omniscience_analysis = self.analyze_god_mode_omniscience(processed_text)
+            # 🌌💫 FASES 6 a 9.0: ANÁLISES PROFUNDAS (perfil full) 💫🌌
+            deep_analyses = self._run_deep_analyses(processed_text, doc, budget, user_id, user_history, timings)
+            semantic_analysis = deep_analyses.get('semantic_analysis', {})
             
             # 📊 FASE 9: Cálculo supremo do score
-            base_sentiment_score, analysis_details = self.calculate_advanced_sentiment_score(processed_text)
+            base_sentiment_score, analysis_details = _call_phase(
+                timings, self.calculate_advanced_sentiment_score, processed_text, doc,
+                explain=fields is None or bool(fields & EXPLAIN_FIELDS)
+            )
             
             # Ajustes por sarcasmo
             if is_sarcastic and sarcasm_score > 0.7:
@@ -3218,9 +3745,9 @@ class SupremeSentimentAnalyzer:
             final_sentiment_score = base_sentiment_score + semantic_adjustment
             
             # 🎨 FASE 10: Detecção avançada de emoções
-            emotions = self.detect_emotions(processed_text)
-            contexts = self.detect_context(processed_text)
-            advanced_keywords = self.extract_advanced_keywords(processed_text)
+            emotions = _call_phase(timings, self.detect_emotions, processed_text, doc)
+            contexts = _call_phase(timings, self.detect_context, processed_text, doc)
+            advanced_keywords = _call_phase(timings, self.extract_advanced_keywords, processed_text, doc)
             
             # 🏆 FASE 11: Classificação suprema final
             if final_sentiment_score > 0.5:
@@ -3253,54 +3780,30 @@ class SupremeSentimentAnalyzer:
                 'emotions': emotions,
                 'contexts': contexts,
                 'analysis_details': analysis_details,
-                'keyword_analysis': advanced_keywords,
-                
-                # Análises supremas
-                'sarcasm_detection': {
+                'keyword_analysis': advanced_keywords
+            }
+            
+            # Análises supremas
+            if budget.ran('sarcasm'):
+                supreme_analysis['sarcasm_detection'] = {
                     'is_sarcastic': is_sarcastic,
                     'sarcasm_score': sarcasm_score,
                     'sarcasm_type': sarcasm_type
-                },
-                'intent_analysis': {
+                }
+            if budget.ran('intent'):
+                supreme_analysis['intent_analysis'] = {
                     'primary_intent': primary_intent,
                     'all_intents': intent_scores,
                     'intent_confidence': max(intent_scores.values()) if intent_scores else 0.0
-                },
-                'urgency_analysis': {
+                }
+            if budget.ran('urgency'):
+                supreme_analysis['urgency_analysis'] = {
                     'urgency_level': urgency_level,
                     'urgency_score': urgency_score
-                },
-                'personality_analysis': personality_traits,
-                'relationship_analysis': relationship_analysis,
-                'semantic_analysis': semantic_analysis,
-                
-                # 🌌💫 ANÁLISES TRANSCENDENTAIS SUPREMAS 💫🌌
-                'quantum_linguistics': quantum_analysis,
-                'soul_frequency': soul_frequency_analysis,
-                'cosmic_patterns': cosmic_analysis,
-                'multiversal_consciousness': multiverse_analysis,
-                'impossible_comprehension': impossible_analysis,
-                
-                # 🧠💫 ANÁLISES PSICOLÓGICAS SUPREMAS 💫🧠
-                'psychological_profile': psychological_profile,
-                'emotional_intelligence_deep': emotional_intelligence_analysis,
-                'cognitive_biases': cognitive_biases_analysis,
-                'communication_style_analysis': communication_style_analysis,
-                'stress_resilience': stress_resilience_analysis,
-                
-                # 🌌🤏 ANÁLISES ULTRA-IMPOSSÍVEIS 🤏🌌
-                'micro_gestures_through_text': micro_gestures_analysis,
-                'soul_dna_blueprint': soul_dna_analysis,
-                'quantum_empathy_transcendental': quantum_empathy_analysis,
-                'temporal_personality_evolution': temporal_personality_analysis,
-                
-                # 👑🌟 ANÁLISES DIVINAS ULTRA-SUPREMAS 🌟👑
-                'divine_consciousness_universal': divine_consciousness_analysis,
-                'reality_manipulation_mastery': reality_manipulation_analysis,
-                'interdimensional_communication': interdimensional_communication_analysis,
-                'akashic_records_access': akashic_records_analysis,
-                'god_mode_omniscience_absolute': god_mode_omniscience_analysis,
-                
+                }
+            supreme_analysis.update(deep_analyses)
+            
+            supreme_analysis.update({
                 # Contexto conversacional
                 'conversation_context': {
                     'has_history': len(user_history) > 0,
@@ -3313,17 +3816,34 @@ class SupremeSentimentAnalyzer:
                 'processed_text': processed_text,
                 'timestamp': datetime.now().isoformat(),
                 'analyzer_version': 'SUPREME_2.0',
-                'analysis_depth': 'maximum',
-                'features_used': [
-                    'sentiment_analysis', 'sarcasm_detection', 'intent_recognition',
-                    'urgency_detection', 'personality_analysis', 'relationship_analysis',
-                    'semantic_patterns', 'conversation_memory', 'emoji_analysis',
-                    'quantum_linguistics', 'soul_frequency_analysis', 'cosmic_patterns',
-                    'multiversal_consciousness', 'impossible_comprehension', 'reality_bending',
-                    'dimensional_analysis', 'temporal_consciousness', 'telepathic_reading',
-                    'universal_truth_resonance', 'infinite_wisdom_access', 'god_consciousness'
-                ]
-            }
+                'analysis_profile': profile,
+                'analysis_depth': ANALYSIS_DEPTH[profile],
+                'features_used': list(ANALYSIS_FEATURES[profile])
+            })
+            
+            # ⏱️ Degradação: entrada truncada e/ou fases opcionais puladas pelo prazo (resultado fora dos caches)
+            self.degradation.record(truncated_chars, budget.skipped)
+            if truncated_chars or budget.skipped:
+                supreme_analysis['degraded'] = True
+                supreme_analysis['degradation'] = {
+                    'truncated_chars': truncated_chars,
+                    'skipped_phases': budget.skipped,
+                    'time_budget_ms': round(self.time_budget * 1000, 1)
+                }
+                cache_key = short_key = None
+                logger.warning(f"⏱️ Análise degradada ({len(text)} caracteres): {truncated_chars} truncados, "
+                               f"{len(budget.skipped)} fases puladas pelo prazo de {self.time_budget * 1000:.0f}ms")
+            
+            # Palavras-chave simplificadas para compatibilidade
+            simple_keywords = [kw['word'] for kw in advanced_keywords[:5]]
+            
+            if cache_key is not None or short_key is not None:
+                cached_analysis = dict(supreme_analysis, conversation_context=None)
+                cached = (sentiment_class, final_sentiment_score, simple_keywords, cached_analysis)
+                if short_key is not None:
+                    self.short_messages.put(short_key, cached)
+                if cache_key is not None:
+                    self.result_cache.put(cache_key, cached)
             
             # 🧠 FASE 14: Atualização da memória conversacional
             if user_id:
@@ -3332,12 +3852,147 @@ class SupremeSentimentAnalyzer:
             # 📚 FASE 15: Aprendizagem suprema
             self.store_analysis_for_learning(text, final_sentiment_score, supreme_analysis)
             
-            # Palavras-chave simplificadas para compatibilidade
-            simple_keywords = [kw['word'] for kw in advanced_keywords[:5]]
+            if log_details:
+                self._log_supreme_analysis(text, supreme_analysis)
+            elif is_short:
+                logger.debug(f"⚡ Mensagem curta: {sentiment_class} ({final_sentiment_score:.3f}) | {text[:50]}")
+            
+            if timings is not None:
+                timings['total'] = time.perf_counter() - started
+                self.profiler.record(profile, timings)
+            
+            result = sentiment_class, final_sentiment_score, simple_keywords, supreme_analysis
+            return result if fields is None else self._project_analysis(result, fields)
+        
+        except Exception as e:
+            logger.error(f"❌ Erro na análise suprema: {e}")
+            return 'neutral', 0.0, [], {'error': str(e), 'fallback': True}
+    
+    def _analysis_from_cache(self, text: str, user_id: Optional[str], cached: Tuple,
+                             log_details: bool) -> Tuple[str, float, List[str], Dict]:
+        """♻️ Completa um resultado do cache com os campos por chamada e executa as fases 14 e 15"""
+        sentiment_class, final_sentiment_score, simple_keywords, cached_analysis = cached
+        user_context = self.conversation_contexts.get(user_id) if user_id else None
+        history_length = len(user_context.conversation_history) if user_context else 0
+        
+        supreme_analysis = dict(cached_analysis)
+        supreme_analysis.update({
+            'conversation_context': {
+                'has_history': history_length > 0,
+                'interaction_count': history_length,
+                'user_sentiment_profile': user_context.user_sentiment_profile if user_context else {}
+            },
+            'text_length': len(text),
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        if user_id:
+            self._update_conversation_context(user_id, text, supreme_analysis)
+        self.store_analysis_for_learning(text, final_sentiment_score, supreme_analysis)
+        
+        if log_details:
+            self._log_supreme_analysis(text, supreme_analysis)
+        
+        return sentiment_class, final_sentiment_score, list(simple_keywords), supreme_analysis
+    
+    def _run_deep_analyses(self, processed_text: str, doc: AnalysisDocument, budget: AnalysisBudget,
+                           user_id: Optional[str], user_history: List,
+                           timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """🌌 Executa as fases profundas presentes no perfil (enquanto houver prazo) e retorna seus resultados por chave"""
+        deep = {}
+        
+        # 🧠 FASE 6: Análise de personalidade
+        if budget.allows('personality'):
+            deep['personality_analysis'] = _call_phase(timings, self.analyze_personality, processed_text, doc)
+        
+        # 💼 FASE 7: Análise de relacionamento
+        if budget.allows('relationship'):
+            deep['relationship_analysis'] = _call_phase(timings, self.analyze_relationship_stage, processed_text, user_history, doc=doc)
+        
+        # 🔍 FASE 8: Aplicação de padrões semânticos
+        if budget.allows('semantic_patterns'):
+            deep['semantic_analysis'] = _call_phase(timings, self.apply_semantic_patterns, processed_text, doc)
+        
+        # 🌌💫 FASE 8.5: ANÁLISES TRANSCENDENTAIS IMPOSSÍVEIS 💫🌌
+        if budget.allows('quantum_linguistics'):
+            deep['quantum_linguistics'] = _call_phase(timings, self.analyze_quantum_linguistics, processed_text, doc)
+        if budget.allows('soul_frequency'):
+            deep['soul_frequency'] = _call_phase(timings, self.analyze_soul_frequency, processed_text, doc)
+        if budget.allows('cosmic_patterns'):
+            deep['cosmic_patterns'] = _call_phase(timings, self.analyze_cosmic_patterns, processed_text, doc)
+        if budget.allows('multiversal_consciousness'):
+            deep['multiversal_consciousness'] = _call_phase(timings, self.analyze_multiversal_consciousness, processed_text, doc)
+        if budget.allows('impossible_comprehension'):
+            deep['impossible_comprehension'] = _call_phase(timings, self.analyze_impossible_comprehension, processed_text, doc)
+        
+        # 🧠💫 FASE 8.7: ANÁLISES PSICOLÓGICAS SUPREMAS 💫🧠
+        if budget.allows('psychological_profile'):
+            deep['psychological_profile'] = _call_phase(timings, self.analyze_psychological_profile, processed_text, doc)
+        if budget.allows('emotional_intelligence'):
+            deep['emotional_intelligence_deep'] = _call_phase(timings, self.analyze_emotional_intelligence, processed_text, doc)
+        if budget.allows('cognitive_biases'):
+            deep['cognitive_biases'] = _call_phase(timings, self.analyze_cognitive_biases, processed_text, doc)
+        if budget.allows('communication_style'):
+            deep['communication_style_analysis'] = _call_phase(timings, self.analyze_communication_style, processed_text, doc)
+        if budget.allows('stress_resilience'):
+            deep['stress_resilience'] = _call_phase(timings, self.analyze_stress_resilience, processed_text, doc)
+        
+        # 🌌🤏 FASE 8.9: ANÁLISES ULTRA-IMPOSSÍVEIS 🤏🌌
+        if budget.allows('micro_gestures'):
+            deep['micro_gestures_through_text'] = _call_phase(timings, self.analyze_micro_gestures_through_text, processed_text, doc)
+        if budget.allows('soul_dna'):
+            deep['soul_dna_blueprint'] = _call_phase(timings, self.analyze_soul_dna, processed_text, doc)
+        if budget.allows('quantum_empathy'):
+            deep['quantum_empathy_transcendental'] = _call_phase(timings, self.analyze_quantum_empathy, processed_text, user_id, doc=doc)
+        if budget.allows('temporal_personality'):
+            deep['temporal_personality_evolution'] = _call_phase(timings, self.analyze_temporal_personality, processed_text, user_history, doc=doc)
+        
+        # 👑🌟 FASE 9.0: ANÁLISES DIVINAS ULTRA-SUPREMAS 🌟👑
+        if budget.allows('divine_consciousness'):
+            deep['divine_consciousness_universal'] = _call_phase(timings, self.analyze_divine_consciousness, processed_text, doc)
+        if budget.allows('reality_manipulation'):
+            deep['reality_manipulation_mastery'] = _call_phase(timings, self.analyze_reality_manipulation, processed_text, doc)
+        if budget.allows('interdimensional_communication'):
+            deep['interdimensional_communication'] = _call_phase(timings, self.analyze_interdimensional_communication, processed_text, doc)
+        if budget.allows('akashic_records'):
+            deep['akashic_records_access'] = _call_phase(timings, self.analyze_akashic_records_access, processed_text, doc)
+        if budget.allows('god_mode'):
+            deep['god_mode_omniscience_absolute'] = _call_phase(timings, self.analyze_god_mode_omniscience, processed_text, doc)
+        
+        return deep
+    
+    def _log_supreme_analysis(self, text: str, analysis: Dict[str, Any]):
+        """📝 Registra o resumo da análise (seções profundas apenas quando executadas)"""
+        sentiment_class = analysis['sentiment_class']
+        supreme_confidence = analysis['confidence']
+        primary_intent = analysis.get('intent_analysis', {}).get('primary_intent', 'unknown')
+        urgency_level = analysis.get('urgency_analysis', {}).get('urgency_level', 'low')
+        is_sarcastic = analysis.get('sarcasm_detection', {}).get('is_sarcastic', False)
+        
+        logger.info(f"🧠👑🌌💫 ANÁLISE SUPREMA MULTIVERSAL & PSICOLÓGICA 💫🌌👑🧠")
+        logger.info(f"Sentimento: {sentiment_class} | Confiança: {supreme_confidence:.3f}")
+        logger.info(f"Intenção: {primary_intent} | Urgência: {urgency_level} | Sarcasmo: {is_sarcastic}")
+        
+        if 'psychological_profile' in analysis:
+            psychological_profile = analysis.get('psychological_profile', {})
+            emotional_intelligence_analysis = analysis.get('emotional_intelligence_deep', {})
+            communication_style_analysis = analysis.get('communication_style_analysis', {})
+            stress_resilience_analysis = analysis.get('stress_resilience', {})
+            quantum_analysis = analysis.get('quantum_linguistics', {})
+            soul_frequency_analysis = analysis.get('soul_frequency', {})
+            cosmic_analysis = analysis.get('cosmic_patterns', {})
+            multiverse_analysis = analysis.get('multiversal_consciousness', {})
+            impossible_analysis = analysis.get('impossible_comprehension', {})
+            micro_gestures_analysis = analysis.get('micro_gestures_through_text', {})
+            soul_dna_analysis = analysis.get('soul_dna_blueprint', {})
+            quantum_empathy_analysis = analysis.get('quantum_empathy_transcendental', {})
+            temporal_personality_analysis = analysis.get('temporal_personality_evolution', {})
+            divine_consciousness_analysis = analysis.get('divine_consciousness_universal', {})
+            reality_manipulation_analysis = analysis.get('reality_manipulation_mastery', {})
+            interdimensional_communication_analysis = analysis.get('interdimensional_communication', {})
+            akashic_records_analysis = analysis.get('akashic_records_access', {})
+            god_mode_omniscience_analysis = analysis.get('god_mode_omniscience_absolute', {})
             
-            logger.info(f"🧠👑🌌💫 ANÁLISE SUPREMA MULTIVERSAL & PSICOLÓGICA 💫🌌👑🧠")
-            logger.info(f"Sentimento: {sentiment_class} | Confiança: {supreme_confidence:.3f}")
-            logger.info(f"Intenção: {primary_intent} | Urgência: {urgency_level} | Sarcasmo: {is_sarcastic}")
             logger.info(f"🔬 PERFIL PSICOLÓGICO:")
             logger.info(f"  Traços Dominantes: {psychological_profile.get('dominant_traits', [])}")
             logger.info(f"  Estilo Cognitivo: {psychological_profile.get('cognitive_style', 'unknown')}")
@@ -3402,33 +4057,32 @@ class SupremeSentimentAnalyzer:
             logger.info(f"  Compreensão Impossível: {god_mode_omniscience_analysis.get('impossible_understanding_mastery', 0):.1f}")
             logger.info(f"  Verdade Absoluta: {god_mode_omniscience_analysis.get('ultimate_truth_absolute_knowledge', 0):.1f}")
             logger.info(f"  Essência Analisada: {god_mode_omniscience_analysis.get('analyzed_text_essence', {}).get('ultimate_truth', 'N/A')}")
-            logger.info(f"📝 Texto: {text[:50]}...")
-            
-            return sentiment_class, final_sentiment_score, simple_keywords, supreme_analysis
-            
-        except Exception as e:
-            logger.error(f"❌ Erro na análise suprema: {e}")
-            return 'neutral', 0.0, [], {'error': str(e), 'fallback': True}
+        logger.info(f"📝 Texto: {text[:50]}...")
     
-    def analyze_sentiment_advanced(self, text: str, user_id: Optional[str] = None, session_data: Optional[Dict] = None) -> Tuple[str, float, List[str], Dict]:
+    def analyze_sentiment_advanced(self, text: str, user_id: Optional[str] = None, session_data: Optional[Dict] = None,
+                                   profile: Optional[str] = None) -> Tuple[str, float, List[str], Dict]:
         """Método de compatibilidade - redireciona para análise suprema"""
-        return self.analyze_sentiment_supreme(text, user_id, session_data)
+        return self.analyze_sentiment_supreme(text, user_id, session_data, profile)
     
-    def analyze_sentiment(self, text: str) -> Tuple[str, float, List[str]]:
+    def analyze_sentiment(self, text: str, profile: Optional[str] = None) -> Tuple[str, float, List[str]]:
         """
-        Método de compatibilidade com interface antiga
+        Método de compatibilidade com interface antiga (perfil 'full' por padrão, como antes dos perfis;
+        a projeção de campos já restringe a análise às fases do score)
         """
-        sentiment_class, score, keywords, _ = self.analyze_sentiment_advanced(text)
-        
-        # Converter sentiment_class para formato antigo
-        if sentiment_class in ['very_positive', 'positive']:
-            simple_sentiment = 'positive'
-        elif sentiment_class in ['very_negative', 'negative']:
-            simple_sentiment = 'negative'
-        else:
-            simple_sentiment = 'neutral'
+        sentiment_class, score, keywords, _ = self.analyze_sentiment_supreme(
+            text, profile=profile or 'full', fields=('sentiment_class',)
+        )
         
-        return simple_sentiment, abs(score), keywords
+        return self._to_simple_sentiment(sentiment_class), abs(score), keywords
+    
+    @staticmethod
+    def _to_simple_sentiment(sentiment_class: str) -> str:
+        """Converte sentiment_class para formato antigo"""
+        if sentiment_class in ['extremely_positive', 'very_positive', 'positive']:
+            return 'positive'
+        elif sentiment_class in ['extremely_negative', 'very_negative', 'negative']:
+            return 'negative'
+        return 'neutral'
     
     def store_analysis_for_learning(self, text: str, score: float, details: Dict):
         """Machine learning simples: armazena análises para melhorar o sistema"""
@@ -3444,72 +4098,43 @@ class SupremeSentimentAnalyzer:
                 'timestamp': datetime.now().isoformat()
             }
             
+            # Buffer circular: ao encher, o registro mais antigo é descartado e descontado dos contadores
             self.analysis_history.append(learning_data)
             
-            # Manter apenas os últimos registros
-            if len(self.analysis_history) > self.max_history:
-                self.analysis_history = self.analysis_history[-self.max_history:]
-            
         except Exception as e:
             logger.warning(f"⚠️ Erro ao armazenar dados de aprendizagem: {e}")
     
     def get_learning_insights(self) -> Dict:
-        """Retorna insights baseados no histórico de análises"""
+        """Retorna insights baseados no histórico de análises (contadores incrementais, O(1))"""
         if not self.analysis_history:
             return {'message': 'Nenhum dado de análise disponível'}
         
         try:
-            total_analyses = len(self.analysis_history)
-            sentiment_distribution = Counter([analysis['sentiment_class'] for analysis in self.analysis_history])
-            avg_confidence = sum([analysis['confidence'] for analysis in self.analysis_history]) / total_analyses
-            
-            # Contextos mais comuns
-            all_contexts = []
-            for analysis in self.analysis_history:
-                all_contexts.extend(analysis.get('contexts_detected', []))
-            common_contexts = Counter(all_contexts).most_common(5)
-            
-            # Tendências temporais (últimas 24h vs resto)
-            now = datetime.now()
-            recent_analyses = []
-            for analysis in self.analysis_history:
-                analysis_time = datetime.fromisoformat(analysis['timestamp'])
-                if (now - analysis_time).total_seconds() < 86400:  # 24 horas
-                    recent_analyses.append(analysis)
-            
-            recent_sentiment = Counter([a['sentiment_class'] for a in recent_analyses]) if recent_analyses else {}
-            
-            insights = {
-                'total_analyses': total_analyses,
-                'sentiment_distribution': dict(sentiment_distribution),
-                'average_confidence': round(avg_confidence, 3),
-                'common_contexts': common_contexts,
-                'recent_24h_count': len(recent_analyses),
-                'recent_sentiment_trend': dict(recent_sentiment),
-                'system_learning_status': 'active' if total_analyses > 10 else 'building_knowledge'
-            }
-            
-            return insights
+            return self.analysis_history.get_insights()
             
         except Exception as e:
             logger.error(f"❌ Erro ao gerar insights: {e}")
             return {'error': str(e)}
 
-    def analyze_message(self, message_data: Dict) -> Dict:
+    def analyze_message(self, message_data: Dict, profile: Optional[str] = None) -> Dict:
         """
-        Analisa uma mensagem completa com tecnologia avançada
+        Analisa uma mensagem completa com tecnologia avançada (perfil 'full' por padrão, como antes dos perfis)
         """
+        profile = profile or 'full'
         try:
             text = message_data.get('text', '')
             contact_name = message_data.get('contact_name', 'Cliente')
             contact_phone = message_data.get('contact_phone', '')
             timestamp = message_data.get('timestamp', datetime.now().isoformat())
             
-            # Análise avançada completa
-            sentiment_class, score, keywords, complete_details = self.analyze_sentiment_advanced(text)
+            # Análise avançada (apenas os campos usados abaixo: dispensa as fases profundas)
+            sentiment_class, score, keywords, complete_details = self.analyze_sentiment_supreme(
+                text, profile=profile,
+                fields=('confidence', 'emotions', 'contexts', 'keyword_analysis', 'analysis_details', 'word_contributions')
+            )
             
-            # Compatibilidade com formato antigo
-            simple_sentiment, simple_score, simple_keywords = self.analyze_sentiment(text)
+            # Compatibilidade com formato antigo (reaproveita a análise acima)
+            simple_sentiment, simple_score, simple_keywords = self._to_simple_sentiment(sentiment_class), abs(score), keywords
             
             # Resultado estruturado expandido
             result = {
@@ -3545,7 +4170,7 @@ class SupremeSentimentAnalyzer:
             logger.error(f"❌ Erro ao analisar mensagem avançada: {e}")
             # Fallback para análise simples
             try:
-                sentiment, score, keywords = self.analyze_sentiment(message_data.get('text', ''))
+                sentiment, score, keywords = self.analyze_sentiment(message_data.get('text', ''), profile)
                 return {
                     'id': f"feedback_{int(datetime.now().timestamp())}",
                     'contact_name': message_data.get('contact_name', 'Cliente'),
@@ -3588,9 +4213,14 @@ def get_supreme_analyzer_stats() -> Dict:
             'conversation_memory': {
                 'active_conversations': len(sentiment_analyzer.conversation_contexts),
                 'total_memory_items': len(sentiment_analyzer.global_conversation_memory),
-                'max_history': sentiment_analyzer.max_history
+                'max_history': sentiment_analyzer.max_history,
+                'context_store': sentiment_analyzer.conversation_contexts.get_stats()
             },
             'learning_insights': sentiment_analyzer.get_learning_insights(),
+            'knowledge_tables': sentiment_analyzer.get_table_report(),
+            'result_cache': sentiment_analyzer.result_cache.get_stats(),
+            'short_messages': sentiment_analyzer.short_messages.get_stats(),
+            'degradation': sentiment_analyzer.degradation.get_stats(),
             'status': 'SUPREME_ANALYZER_ACTIVE'
         }
     except Exception as e:
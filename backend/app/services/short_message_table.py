@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+⚡ CAMINHO RÁPIDO DE MENSAGENS CURTAS ⚡
+Boa parte das respostas do WhatsApp tem de um a três tokens ou só emojis
+('ok', '👍', 'obrigado!', '?'). Textos normalizados com até max_tokens tokens
+seguem uma rota mínima no analisador:
+
+- Tabela de consulta: o resultado completo (a parte independente do histórico
+  do usuário, a mesma guardada no cache de resultados) por texto normalizado,
+  variante de perfil/campos e versão do léxico. As mensagens mais frequentes
+  (SHORT_MESSAGE_SEEDS) são pré-calculadas no aquecimento do analisador, antes
+  do fork dos workers; as demais entram no primeiro uso, até max_entries. Sem
+  LRU nem TTL: rajadas de mensagens longas não expulsam as curtas.
+- Fora da tabela, as fases executam normalmente (o resultado é o do caminho
+  completo), mas o log detalhado por mensagem vira uma única linha de debug.
+
+Os valores ficam serializados (pickle), como no cache de resultados: cada
+acerto devolve uma cópia independente.
+"""
+
+import pickle
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Respostas curtas mais frequentes do WhatsApp, pré-calculadas no aquecimento
+SHORT_MESSAGE_SEEDS = (
+    'ok', 'ok!', 'okay', 'sim', 'não', 'nao', 'certo', 'entendi', 'beleza', 'blz',
+    'obrigado', 'obrigado!', 'obrigada', 'obrigada!', 'muito obrigado', 'ok obrigado', 'valeu', 'vlw',
+    'show', 'top', 'perfeito', 'tá bom', 'ta bom', 'tudo bem', 'aguardo',
+    'oi', 'olá', 'bom dia', 'boa tarde', 'boa noite',
+    '?', '??', 'kkk', 'kkkk', 'hmm',
+    '👍', '🙏', '😊', '❤️', '👏', '😂', '😡', '👎', '🙄',
+)
+
+# Contadores encaminhados dos processos do pool ao processo principal
+METRIC_FIELDS = ('analyses', 'short_messages', 'hits', 'misses', 'rejected')
+
+# Chave da tabela: (texto normalizado + emojis, variante perfil/campos, versão do léxico)
+ShortMessageKey = Tuple[str, str, str]
+
+
+class ShortMessageTable:
+    """Tabela de resultados de mensagens curtas, com taxa de acerto sobre as mensagens curtas e sobre o total"""
+    
+    def __init__(self, max_tokens: int, max_entries: int):
+        self.max_tokens = max_tokens
+        self.max_entries = max_entries
+        self._entries: Dict[ShortMessageKey, bytes] = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.precomputed = 0
+        
+        # Métricas
+        self.analyses = 0
+        self.short_messages = 0
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        # Modo processo do pool: contadores já devolvidos ao processo principal
+        self._forwarded: Optional[Dict[str, int]] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_tokens > 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def is_short(self, processed_text: str) -> bool:
+        """Conta a análise e diz se o texto normalizado (espaços já colapsados) segue a rota curta"""
+        self.analyses += 1
+        if not self.enabled or processed_text.count(' ') >= self.max_tokens:
+            return False
+        self.short_messages += 1
+        return True
+    
+    def get(self, key: ShortMessageKey) -> Optional[Any]:
+        data = self._entries.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(data)
+    
+    def put(self, key: ShortMessageKey, value: Any) -> bool:
+        """Guarda o resultado enquanto houver espaço (entradas existentes nunca são substituídas)"""
+        if key in self._entries:
+            return True
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self.rejected += 1
+                return False
+            if self._entries.setdefault(key, data) is data:
+                self.current_bytes += len(data)
+        return True
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.precomputed = 0
+    
+    def reset_metrics(self):
+        """Zera os contadores (após o aquecimento, para que reflitam apenas o tráfego real)"""
+        for name in METRIC_FIELDS:
+            setattr(self, name, 0)
+        if self._forwarded is not None:
+            self._forwarded = dict.fromkeys(METRIC_FIELDS, 0)
+    
+    def enable_forwarding(self):
+        """Modo processo do pool: drain_metrics() devolve os contadores acumulados desde a última chamada"""
+        self._forwarded = {name: getattr(self, name) for name in METRIC_FIELDS}
+    
+    def drain_metrics(self) -> Dict[str, int]:
+        """Incrementos dos contadores desde a última chamada (vazio fora do modo forwarding)"""
+        if self._forwarded is None:
+            return {}
+        current = {name: getattr(self, name) for name in METRIC_FIELDS}
+        delta = {name: value - self._forwarded[name] for name, value in current.items() if value != self._forwarded[name]}
+        self._forwarded = current
+        return delta
+    
+    def record_metrics(self, delta: Dict[str, int]):
+        """Soma os contadores encaminhados por um processo do pool"""
+        for name, value in delta.items():
+            setattr(self, name, getattr(self, name) + value)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'max_tokens': self.max_tokens,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'precomputed': self.precomputed,
+            'bytes': self.current_bytes,
+            'analyses': self.analyses,
+            'short_messages': self.short_messages,
+            'short_share': round(self.short_messages / self.analyses, 4) if self.analyses else 0.0,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            # Fração de todas as análises respondidas pela tabela
+            'table_share': round(self.hits / self.analyses, 4) if self.analyses else 0.0,
+            'rejected': self.rejected
+        }
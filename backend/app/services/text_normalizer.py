@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+🧹 NORMALIZADOR DE TEXTO COMPILADO 🧹
+Minúsculas, expansão de contrações (uma única alternação regex), filtragem de
+caracteres especiais, colapso de espaços e extração de emojis. Os emojis são
+identificados nos trechos removidos pela filtragem, na mesma passada, e
+seguem adiante junto com o texto normalizado (não são recalculados depois)
+
+A forma canônica (fold_text) é calculada uma vez por mensagem: variantes
+ortográficas comuns do PT-BR ('vc', 'pq', 'né'), acentos removidos e letras
+repetidas colapsadas. As chaves dos dicionários são compiladas na mesma forma,
+então 'ótimo', 'otimo' e 'ótimooo' encontram a mesma entrada
+"""
+
+import os
+import re
+from typing import Dict, List, NamedTuple, Tuple
+
+# Caracteres preservados além de letras/dígitos/espaços (pontuação importante)
+_REMOVED_CHARS = r'[^\w\s\.\,\!\?\-\:\;\"]+'
+
+# Variantes ortográficas (palavra inteira -> forma canônica, sempre uma única palavra sem acentos)
+# 'é'/'né' viram 'eh'/'neh' (como em 'não é' -> 'nao eh'): sem acento colidiriam com 'e' e com o 'ne' de 'internet'
+ORTHOGRAPHIC_VARIANTS = {
+    'é': 'eh', 'né': 'neh', 'ne': 'neh', 'ñ': 'nao', 'naum': 'nao',
+    'vc': 'voce', 'vcs': 'voces', 'pq': 'porque', 'q': 'que', 'tb': 'tambem', 'tbm': 'tambem',
+    'mt': 'muito', 'mto': 'muito', 'msm': 'mesmo', 'obg': 'obrigado', 'hj': 'hoje', 'td': 'tudo', 'nd': 'nada'
+}
+
+_VARIANT_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(ORTHOGRAPHIC_VARIANTS, key=len, reverse=True))) + r')\b'
+)
+_ACCENT_TABLE = str.maketrans('áàâãäéèêëíìîïóòôõöúùûüç', 'aaaaaeeeeiiiiooooouuuuc')
+# Letra repetida 3+ vezes ('ótimooo', 'muuuito'); 'rr' e 'ss' são grafias legítimas e ficam com duas
+_REPEATED_PATTERN = re.compile(r'([a-z])\1{2,}')
+
+
+def _variant(match) -> str:
+    return ORTHOGRAPHIC_VARIANTS[match.group()]
+
+
+def _repeated(match) -> str:
+    letter = match.group(1)
+    return letter * 2 if letter in 'rs' else letter
+
+
+def fold_text(text: str) -> str:
+    """Forma canônica de um texto em minúsculas (mesmos tokens, na mesma ordem)"""
+    text = _VARIANT_PATTERN.sub(_variant, text)
+    if not text.isascii():
+        text = text.translate(_ACCENT_TABLE)
+    return _REPEATED_PATTERN.sub(_repeated, text)
+
+
+class NormalizedText(NamedTuple):
+    """Texto normalizado, emojis (emoji, valor * ocorrências) do texto original e forma canônica do texto"""
+    text: str
+    emoji_hits: List[Tuple[str, float]]
+    folded: str = ''
+    
+    @property
+    def cache_text(self) -> str:
+        """Conteúdo que determina o resultado da análise (texto + emojis), para chaves de cache"""
+        if not self.emoji_hits:
+            return self.text
+        return self.text + '\x00' + ''.join(f'{emoji}{value}' for emoji, value in self.emoji_hits)
+
+
+class TextNormalizer:
+    """Normalizador com padrões pré-compilados a partir das contrações e emojis do analisador"""
+    
+    def __init__(self, contractions: Dict[str, str], emoji_sentiments: Dict[str, float]):
+        self.contractions = dict(contractions)
+        self.emoji_sentiments = emoji_sentiments
+        
+        # Alternação das contrações (mais longas primeiro); nenhuma expansão gera outra contração
+        ordered = sorted(self.contractions, key=len, reverse=True)
+        self._contraction_pattern = re.compile('|'.join(map(re.escape, ordered))) if ordered else None
+        self._expand = lambda match: self.contractions[match.group()]
+        # Prefixo comum das contrações ('não '): sem ele no texto, a regex nem é executada
+        self._contraction_prefix = os.path.commonprefix(ordered) if ordered else ''
+        
+        # Grupo de captura: split() devolve trechos mantidos e removidos alternados
+        self._removed_pattern = re.compile(f'({_REMOVED_CHARS})')
+        
+        ordered_emojis = sorted(emoji_sentiments, key=len, reverse=True)
+        self._emoji_pattern = re.compile('|'.join(map(re.escape, ordered_emojis))) if ordered_emojis else None
+        self._emoji_order = {emoji: index for index, emoji in enumerate(emoji_sentiments)}
+    
+    def normalize(self, text: str) -> NormalizedText:
+        if not text:
+            return NormalizedText('', [], '')
+        
+        text = text.lower()
+        if self._contraction_pattern is not None and self._contraction_prefix in text:
+            text = self._contraction_pattern.sub(self._expand, text)
+        
+        parts = self._removed_pattern.split(text)
+        emoji_hits = []
+        if len(parts) > 1:
+            text = ''.join(parts[0::2])
+            emoji_hits = self._match_emojis(' '.join(parts[1::2]))
+        
+        # Equivale a re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
+        return NormalizedText(text, emoji_hits, fold_text(text))
+    
+    def _match_emojis(self, removed: str) -> List[Tuple[str, float]]:
+        """Emojis nos trechos removidos, na ordem do dicionário, com valor multiplicado pelas ocorrências"""
+        if self._emoji_pattern is None:
+            return []
+        counts: Dict[str, int] = {}
+        for emoji in self._emoji_pattern.findall(removed):
+            counts[emoji] = counts.get(emoji, 0) + 1
+        return [(emoji, self.emoji_sentiments[emoji] * counts[emoji])
+                for emoji in sorted(counts, key=self._emoji_order.__getitem__)]
@@ -15,6 +15,42 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Colunas de análise de whatsapp_messages (preenchidas uma vez pelo estágio de análise da ingestão)
+ANALYSIS_COLUMNS = """
+            ALTER TABLE whatsapp_messages
+                ADD COLUMN IF NOT EXISTS sentiment_class VARCHAR(20),
+                ADD COLUMN IF NOT EXISTS sentiment_score REAL,
+                ADD COLUMN IF NOT EXISTS sentiment_confidence REAL,
+                ADD COLUMN IF NOT EXISTS urgency_level VARCHAR(10),
+                ADD COLUMN IF NOT EXISTS primary_intent VARCHAR(30),
+                ADD COLUMN IF NOT EXISTS analyzed_at TIMESTAMP
+"""
+
+UPDATE_ANALYSIS_QUERY = """
+    UPDATE whatsapp_messages
+    SET sentiment_class = %s,
+        sentiment_score = %s,
+        sentiment_confidence = %s,
+        urgency_level = %s,
+        primary_intent = %s,
+        analyzed_at = %s
+    WHERE message_id = %s
+"""
+
+
+def _sentiment_from_row(row, start: int) -> Optional[Dict]:
+    """Análise gravada a partir da coluna start (ordem de ANALYSIS_COLUMNS) ou None se a mensagem ainda não foi analisada"""
+    if not row[start]:
+        return None
+    return {
+        'sentiment_class': row[start],
+        'score': float(row[start + 1]) if row[start + 1] is not None else 0.0,
+        'confidence': float(row[start + 2]) if row[start + 2] is not None else 0.0,
+        'urgency_level': row[start + 3],
+        'primary_intent': row[start + 4],
+        'analyzed_at': row[start + 5].isoformat() if row[start + 5] else None
+    }
+
 class WhatsAppPersistenceService:
     """
     Serviço para persistir chats e mensagens WhatsApp no PostgreSQL
@@ -81,7 +117,7 @@ class WhatsAppPersistenceService:
             """
             
             # Executar comandos separadamente para evitar problemas
-            commands = create_script.split(';')
+            commands = create_script.split(';') + [ANALYSIS_COLUMNS]
             for cmd in commands:
                 cmd = cmd.strip()
                 if cmd and not cmd.startswith('--'):
@@ -270,11 +306,22 @@ class WhatsAppPersistenceService:
                 logger.warning("DB Manager não disponível para buscar chats")
                 return []
             
+            # Sentimento da última mensagem analisada do chat (gravado na ingestão, sem reanalisar)
             query = """
-                 SELECT phone, name, last_message, last_message_time, 
-                        unread_count, created_at, updated_at
-                 FROM whatsapp_chats 
-                 ORDER BY last_message_time DESC NULLS LAST
+                 SELECT c.phone, c.name, c.last_message, c.last_message_time, 
+                        c.unread_count, c.created_at, c.updated_at,
+                        m.sentiment_class, m.sentiment_score, m.sentiment_confidence,
+                        m.urgency_level, m.primary_intent, m.analyzed_at
+                 FROM whatsapp_chats c
+                 LEFT JOIN LATERAL (
+                     SELECT sentiment_class, sentiment_score, sentiment_confidence,
+                            urgency_level, primary_intent, analyzed_at
+                     FROM whatsapp_messages
+                     WHERE chat_phone = c.phone AND sentiment_class IS NOT NULL
+                     ORDER BY timestamp DESC
+                     LIMIT 1
+                 ) m ON TRUE
+                 ORDER BY c.last_message_time DESC NULLS LAST
                  LIMIT %s
              """
             
@@ -289,7 +336,8 @@ class WhatsAppPersistenceService:
                     'last_message_time': row[3].isoformat() if row[3] else datetime.now().isoformat(),
                     'unread_count': row[4] or 0,
                     'created_at': row[5].isoformat() if row[5] else None,
-                    'updated_at': row[6].isoformat() if row[6] else None
+                    'updated_at': row[6].isoformat() if row[6] else None,
+                    'last_sentiment': _sentiment_from_row(row, 7)
                 }
                 chats.append(chat)
             
@@ -312,7 +360,9 @@ class WhatsAppPersistenceService:
             # Base query
             query = """
                 SELECT message_id, chat_phone, content, sender, message_type,
-                       direction, status, timestamp, waha_data, created_at
+                       direction, status, timestamp, waha_data, created_at,
+                       sentiment_class, sentiment_score, sentiment_confidence,
+                       urgency_level, primary_intent, analyzed_at
                 FROM whatsapp_messages 
                 WHERE chat_phone = %s
             """
@@ -344,7 +394,8 @@ class WhatsAppPersistenceService:
                     'status': row[6],
                     'timestamp': row[7].isoformat() if row[7] else None,
                     'waha_data': json.loads(row[8]) if row[8] else {},
-                    'created_at': row[9].isoformat() if row[9] else None
+                    'created_at': row[9].isoformat() if row[9] else None,
+                    'sentiment': _sentiment_from_row(row, 10)
                 }
                 messages.append(message)
             
@@ -355,6 +406,58 @@ class WhatsAppPersistenceService:
             logger.error(f"❌ Erro ao buscar mensagens para {phone}: {e}")
             return []
     
+    def save_message_analyses(self, analyses: List[Dict]) -> int:
+        """
+        Grava a análise de várias mensagens em uma única transação (update por message_id)
+        Cada item: message_id, sentiment_class, score, confidence, urgency_level, primary_intent, analyzed_at
+        """
+        try:
+            if not self.db_manager:
+                logger.warning("DB Manager não disponível para salvar análises")
+                return 0
+            if not analyses:
+                return 0
+            
+            self.db_manager.cursor.executemany(UPDATE_ANALYSIS_QUERY, [self._analysis_values(analysis) for analysis in analyses])
+            self.db_manager.connection.commit()
+            logger.info(f"✅ {len(analyses)} análises gravadas em whatsapp_messages")
+            return len(analyses)
+        
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar análises das mensagens: {e}")
+            try:
+                self.db_manager.connection.rollback()
+            except Exception:
+                return 0
+            if len(analyses) == 1:
+                return 0
+            # Uma análise inválida não derruba o lote: grava uma a uma
+            saved = 0
+            for analysis in analyses:
+                try:
+                    self.db_manager.cursor.execute(UPDATE_ANALYSIS_QUERY, self._analysis_values(analysis))
+                    self.db_manager.connection.commit()
+                    saved += 1
+                except Exception as row_error:
+                    logger.error(f"❌ Erro ao salvar análise da mensagem {analysis.get('message_id')}: {row_error}")
+                    try:
+                        self.db_manager.connection.rollback()
+                    except Exception:
+                        break
+            return saved
+    
+    @staticmethod
+    def _analysis_values(analysis: Dict) -> tuple:
+        return (
+            analysis.get('sentiment_class'),
+            analysis.get('score'),
+            analysis.get('confidence'),
+            analysis.get('urgency_level'),
+            analysis.get('primary_intent'),
+            analysis.get('analyzed_at'),
+            analysis.get('message_id')
+        )
+    
     def mark_chat_as_read(self, phone: str) -> bool:
         """
         Marca um chat como lido (zera unread_count)
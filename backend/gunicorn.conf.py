@@ -0,0 +1,35 @@
+"""
+Configuração do gunicorn - SacsMax Backend
+    
+    gunicorn main:app -c gunicorn.conf.py
+
+Com SENTIMENT_PRELOAD=true (padrão) o processo mestre importa apenas o
+analisador de sentimentos, aquece-o e congela o heap (gc.freeze) antes do fork:
+as tabelas somente leitura ficam em páginas compartilhadas entre os workers.
+A aplicação (e com ela as conexões com o banco) é importada em cada worker,
+depois do fork: preload_app fica desligado para que nenhum socket do psycopg2
+seja herdado e compartilhado entre processos.
+Memória por worker: GET /api/analyzer/memory ou
+python -m app.services.analyzer_preload report --workers 4
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = 'uvicorn.workers.UvicornWorker'
+# Lido aqui sem importar app.core.config (mesmo padrão de settings.sentiment_preload)
+sentiment_preload = os.getenv("SENTIMENT_PRELOAD", "true").lower() == "true"
+preload_app = False
+
+
+def when_ready(server):
+    """Mestre pronto, antes do fork dos workers: aquece só o analisador (nada de banco no mestre)"""
+    if not sentiment_preload:
+        return
+    try:
+        from app.services.analyzer_preload import preload
+        preload()
+    except Exception as e:
+        server.log.warning(f"⚠️ Pré-carga do analisador falhou (cada worker construirá o seu): {e}")
+
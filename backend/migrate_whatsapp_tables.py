@@ -58,6 +58,15 @@ def migrate_whatsapp_tables():
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
+        -- Análise de sentimento da mensagem (gravada uma vez na ingestão)
+        ALTER TABLE whatsapp_messages
+            ADD COLUMN IF NOT EXISTS sentiment_class VARCHAR(20),
+            ADD COLUMN IF NOT EXISTS sentiment_score REAL,
+            ADD COLUMN IF NOT EXISTS sentiment_confidence REAL,
+            ADD COLUMN IF NOT EXISTS urgency_level VARCHAR(10),
+            ADD COLUMN IF NOT EXISTS primary_intent VARCHAR(30),
+            ADD COLUMN IF NOT EXISTS analyzed_at TIMESTAMP;
+        
         -- Índices para performance
         CREATE INDEX IF NOT EXISTS idx_whatsapp_chats_phone ON whatsapp_chats(phone);
         CREATE INDEX IF NOT EXISTS idx_whatsapp_chats_last_message_time ON whatsapp_chats(last_message_time DESC);
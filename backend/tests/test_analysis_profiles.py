@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Perfis de análise: 'fast' e 'standard' dispensam apenas fases auxiliares,
+então a classe de sentimento deve ser a mesma do perfil 'full'
+    
+    cd backend && python -m pytest -q tests
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.analyzer_benchmark import generate_corpus
+from app.services.sentiment_analyzer import ANALYSIS_PROFILES, SupremeSentimentAnalyzer, resolve_field_phases
+
+# Corpus sintético de SAC (determinístico pela semente)
+FIXTURE_MESSAGES = 1500
+FIXTURE_SEED = 7
+
+
+class AnalysisProfileParityTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.INFO)
+        cls.analyzer = SupremeSentimentAnalyzer()
+        # Cada perfil é analisado de fato (sem reaproveitar resultados do cache)
+        cls.analyzer.result_cache.max_entries = 0
+        cls.corpus = [item['text'] for item in generate_corpus(FIXTURE_MESSAGES, seed=FIXTURE_SEED)]
+        cls.classes = {
+            profile: [cls.analyzer.analyze_sentiment_supreme(text, profile=profile)[0] for text in cls.corpus]
+            for profile in ('fast', 'standard', 'full')
+        }
+    
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+    
+    def assert_same_classes(self, profile: str):
+        mismatches = [(text, light, full) for text, light, full
+                      in zip(self.corpus, self.classes[profile], self.classes['full']) if light != full]
+        self.assertEqual(mismatches, [], f"{len(mismatches)} mensagens com classe diferente de 'full' no perfil '{profile}'")
+    
+    def test_fast_matches_full(self):
+        self.assert_same_classes('fast')
+    
+    def test_standard_matches_full(self):
+        self.assert_same_classes('standard')
+    
+    def test_profiles_run_every_phase_of_sentiment_class(self):
+        class_phases = resolve_field_phases(frozenset({'sentiment_class'}))
+        for profile, phases in ANALYSIS_PROFILES.items():
+            self.assertLessEqual(class_phases, phases, profile)
+    
+    def test_legacy_entry_points_match_full(self):
+        for text, full in zip(self.corpus[:200], self.classes['full']):
+            sentiment, _, _ = self.analyzer.analyze_sentiment(text)
+            self.assertEqual(sentiment, SupremeSentimentAnalyzer._to_simple_sentiment(full), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
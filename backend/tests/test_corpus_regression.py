@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Regressão sobre o corpus sintético de SAC: a distribuição de classes de cada
+perfil fica fixada, e a mesma mensagem escrita sem acentos (casada pela forma
+canônica de fold_text) recebe a mesma classe da grafia acentuada. Mudanças no
+léxico ou no normalizador que desloquem classes precisam atualizar este teste
+    
+    cd backend && python -m pytest -q tests
+"""
+
+import logging
+import os
+import sys
+import unicodedata
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.analyzer_benchmark import generate_corpus
+from app.services.sentiment_analyzer import ANALYSIS_PROFILES, SupremeSentimentAnalyzer
+
+FIXTURE_MESSAGES = 1500
+FIXTURE_SEED = 7
+
+# Distribuição de classes do corpus (igual nos três perfis)
+EXPECTED_DISTRIBUTION = {
+    'extremely_positive': 301,
+    'very_positive': 83,
+    'positive': 139,
+    'neutral': 574,
+    'negative': 129,
+    'very_negative': 80,
+    'extremely_negative': 194,
+}
+
+
+def strip_accents(text: str) -> str:
+    """Grafia sem acentos, como o usuário costuma digitar"""
+    return ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+
+
+class CorpusRegressionTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.INFO)
+        cls.analyzer = SupremeSentimentAnalyzer()
+        cls.analyzer.result_cache.max_entries = 0
+        cls.analyzer.short_messages.max_entries = 0
+        cls.corpus = [item['text'] for item in generate_corpus(FIXTURE_MESSAGES, seed=FIXTURE_SEED)]
+    
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+    
+    def classify(self, text: str, profile: str) -> str:
+        return self.analyzer.analyze_sentiment_supreme(text, profile=profile)[0]
+    
+    def test_class_distribution_is_pinned(self):
+        for profile in ANALYSIS_PROFILES:
+            with self.subTest(profile=profile):
+                distribution = Counter(self.classify(text, profile) for text in self.corpus)
+                self.assertEqual(dict(distribution), EXPECTED_DISTRIBUTION)
+    
+    def test_unaccented_spelling_keeps_class(self):
+        accented = sorted({text for text in self.corpus if strip_accents(text) != text})
+        self.assertGreater(len(accented), FIXTURE_MESSAGES // 2)
+        mismatches = []
+        for text in accented:
+            expected, actual = self.classify(text, 'full'), self.classify(strip_accents(text), 'full')
+            if expected != actual:
+                mismatches.append((text, expected, actual))
+        self.assertEqual(mismatches, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
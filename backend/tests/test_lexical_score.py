@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Score léxico (calculate_advanced_sentiment_score / score_batch): emojis entram no
+score mesmo quando a mensagem não tem palavras, e frases do léxico contam como uma
+unidade na normalização (o intensificador absorvido pela frase não dilui o score)
+    
+    cd backend && python -m pytest -q tests
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.sentiment_analyzer import SupremeSentimentAnalyzer
+
+
+class LexicalScoreTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.INFO)
+        cls.analyzer = SupremeSentimentAnalyzer()
+        cls.analyzer.result_cache.max_entries = 0
+        cls.analyzer.short_messages.max_entries = 0
+    
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+    
+    def lexical_score(self, text: str) -> float:
+        normalized = self.analyzer.normalize_text(text)
+        doc = self.analyzer.build_document(normalized.text, 'fast', normalized.emoji_hits, normalized.folded)
+        return self.analyzer.calculate_advanced_sentiment_score(normalized.text, doc, explain=False)[0]
+    
+    def test_emoji_only_messages_are_scored(self):
+        emoji_sentiments = self.analyzer.emoji_sentiments
+        self.assertEqual(self.lexical_score('👍'), emoji_sentiments['👍'])
+        self.assertEqual(self.lexical_score('😡😡'), 2 * emoji_sentiments['😡'])
+        self.assertEqual(self.analyzer.score_batch(['👍', '😡', '']),
+                         [emoji_sentiments['👍'], emoji_sentiments['😡'], 0.0])
+    
+    def test_emoji_only_class_follows_emoji(self):
+        for profile in ('fast', 'standard'):
+            self.assertIn('positive', self.analyzer.analyze_sentiment_supreme('👍', profile=profile)[0])
+            self.assertIn('negative', self.analyzer.analyze_sentiment_supreme('😡', profile=profile)[0])
+
+    def test_phrase_is_not_weaker_than_its_words(self):
+        self.assertGreaterEqual(self.lexical_score('muito bom'), self.lexical_score('bom'))
+        self.assertGreaterEqual(abs(self.lexical_score('muito bom')), abs(self.lexical_score('muito ruim')))
+        self.assertLessEqual(self.lexical_score('não gostei'), 0.0)
+    
+    def test_batch_matches_single_scores(self):
+        texts = ['muito bom', 'muito ruim', 'não funcionou', 'o atendimento foi muito bom, mas não gostei do preço', '👍']
+        expected = [self.lexical_score(text) for text in texts]
+        for actual, value in zip(self.analyzer.score_batch(texts), expected):
+            self.assertAlmostEqual(actual, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Léxico recarregável: uma análise lê o LexiconState uma vez no início e usa as
+mesmas tabelas em todas as fases, mesmo que um estado novo seja publicado no meio
+    
+    cd backend && python -m pytest -q tests
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.lexicon_reloader import LexiconState
+from app.services.sentiment_analyzer import SupremeSentimentAnalyzer
+
+TEXT = "o atendimento foi excelente, adorei a solução, muito obrigado"
+
+
+class LexiconStateSwapTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.INFO)
+        cls.analyzer = SupremeSentimentAnalyzer()
+        cls.analyzer.result_cache.max_entries = 0
+        cls.analyzer.short_messages.max_entries = 0
+    
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+    
+    def setUp(self):
+        self.original = self.analyzer.lexicon_state
+        # Léxico invertido: a mesma mensagem passa a ter a classe oposta
+        self.inverted = LexiconState(
+            {word: -value for word, value in self.original.sentiment_lexicon.items()},
+            self.original.emoji_sentiments,
+            self.original.sarcasm_patterns,
+            self.original.normalizer,
+            'inverted'
+        )
+    
+    def tearDown(self):
+        self.analyzer.lexicon_state = self.original
+        self.analyzer.__dict__.pop('build_document', None)
+    
+    def test_inverted_lexicon_changes_class(self):
+        expected = self.analyzer.analyze_sentiment_supreme(TEXT, profile='full')[0]
+        self.analyzer.lexicon_state = self.inverted
+        self.assertNotEqual(self.analyzer.analyze_sentiment_supreme(TEXT, profile='full')[0], expected)
+    
+    def test_swap_during_analysis_keeps_pinned_state(self):
+        analyzer = self.analyzer
+        expected = analyzer.analyze_sentiment_supreme(TEXT, profile='full')
+        build_document = analyzer.build_document
+        
+        def publish_then_build(*args, **kwargs):
+            # Recarga publicada entre o preprocessamento e as demais fases
+            analyzer.lexicon_state = self.inverted
+            return build_document(*args, **kwargs)
+        
+        analyzer.build_document = publish_then_build
+        result = analyzer.analyze_sentiment_supreme(TEXT, profile='full')
+        self.assertEqual(result[:2], expected[:2])
+        self.assertIs(analyzer.lexicon_state, self.inverted)
+        self.assertIsNone(self.inverted.phrase_scorer)
+    
+    def test_state_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.original.sentiment_lexicon = {}
+        with self.assertRaises(AttributeError):
+            self.original.cache('sentiment_lexicon', {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tabela de mensagens curtas: as sementes pré-calculadas (inclusive as só de
+emojis, que não têm tokens) entram na tabela em todos os perfis, e um acerto
+devolve o mesmo resultado do caminho completo
+    
+    cd backend && python -m pytest -q tests
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.sentiment_analyzer import ANALYSIS_PROFILES, SupremeSentimentAnalyzer
+from app.services.short_message_table import SHORT_MESSAGE_SEEDS
+
+EMOJI_MESSAGES = ('👍', '😡', '😡😡😡')
+
+
+class ShortMessageTableTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.INFO)
+        cls.analyzer = SupremeSentimentAnalyzer()
+        cls.analyzer.result_cache.max_entries = 0
+        # Referência: caminho completo, sem tabela nem cache
+        cls.reference = SupremeSentimentAnalyzer()
+        cls.reference.result_cache.max_entries = 0
+        cls.reference.short_messages.max_entries = 0
+    
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+    
+    def setUp(self):
+        self.analyzer.short_messages.clear()
+    
+    def test_seeds_are_precomputed_in_every_profile(self):
+        for profile in ANALYSIS_PROFILES:
+            with self.subTest(profile=profile):
+                self.analyzer.short_messages.clear()
+                self.analyzer.precompute_short_messages(profile)
+                for text in SHORT_MESSAGE_SEEDS:
+                    hits = self.analyzer.short_messages.hits
+                    result = self.analyzer.analyze_sentiment_supreme(text, profile=profile)
+                    self.assertEqual(self.analyzer.short_messages.hits, hits + 1, text)
+                    self.assertFalse(result[3].get('fallback'), text)
+    
+    def test_table_hit_matches_full_path(self):
+        for profile in ANALYSIS_PROFILES:
+            for text in EMOJI_MESSAGES:
+                with self.subTest(profile=profile, text=text):
+                    expected = self.reference.analyze_sentiment_supreme(text, profile=profile)
+                    self.assertFalse(expected[3].get('fallback'))
+                    self.analyzer.analyze_sentiment_supreme(text, profile=profile)
+                    hits = self.analyzer.short_messages.hits
+                    result = self.analyzer.analyze_sentiment_supreme(text, profile=profile)
+                    self.assertEqual(self.analyzer.short_messages.hits, hits + 1)
+                    self.assertEqual(result[:3], expected[:3])
+        self.assertIn('positive', self.reference.analyze_sentiment_supreme('👍', profile='full')[0])
+        self.assertIn('negative', self.reference.analyze_sentiment_supreme('😡😡😡', profile='full')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()